@@ -13,19 +13,28 @@ Author: caplaz
 License: MIT
 """
 
+import asyncio
+from collections.abc import Mapping
 from datetime import timedelta
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, DOMAIN
-
-if TYPE_CHECKING:
-    from .weather_detector import WeatherDetector
+from . import weather_detector
+from .const import (
+    CALM_UPDATE_INTERVAL_FACTOR,
+    CONF_REFRESH_ON_STARTUP,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_REFRESH_ON_STARTUP,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    MAX_CALM_UPDATE_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,30 +65,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Create coordinator for managing updates
     coordinator = MicroWeatherCoordinator(hass, entry)
-    # Attempt an initial refresh; if it fails, signal ConfigEntryNotReady so HA retries
-    try:
-        await coordinator.async_refresh()
-    except UpdateFailed as err:
-        from homeassistant.exceptions import ConfigEntryNotReady
-
-        _LOGGER.error("Initial coordinator refresh failed: %s", err)
-        raise ConfigEntryNotReady from err
-
-    # If coordinator reported an unsuccessful update (async_refresh swallowed the UpdateFailed),
-    # signal that the config entry is not ready so HA retries setup later.
-    from homeassistant.exceptions import ConfigEntryNotReady
-
-    if not getattr(coordinator, "last_update_success", True):
-        _LOGGER.error(
-            "Initial coordinator refresh reported failure: last_update_success=False"
-        )
-        raise ConfigEntryNotReady
+
+    if coordinator.refresh_on_startup:
+        # Attempt an initial refresh; if it fails, signal ConfigEntryNotReady
+        # so HA retries
+        try:
+            await coordinator.async_refresh()
+        except UpdateFailed as err:
+            _LOGGER.error("Initial coordinator refresh failed: %s", err)
+            raise ConfigEntryNotReady from err
+
+        # If coordinator reported an unsuccessful update (async_refresh swallowed
+        # the UpdateFailed), signal that the config entry is not ready so HA
+        # retries setup later.
+        if not getattr(coordinator, "last_update_success", True):
+            _LOGGER.error(
+                "Initial coordinator refresh reported failure: last_update_success=False"
+            )
+            raise ConfigEntryNotReady
+    else:
+        # Defer analysis to the first scheduled update. The detector is still
+        # built so the weather entity binds to the shared analyzers.
+        _LOGGER.debug("Skipping startup refresh; waiting for first scheduled update")
+        coordinator.get_detector()
 
     # Store coordinator in hass data
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Set up platforms
+    # Set up all platforms in one awaited call so they load in parallel
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Set up options update listener for immediate refresh
@@ -146,8 +160,11 @@ class MicroWeatherCoordinator(DataUpdateCoordinator):
             entry: Configuration entry with sensor mappings and settings
         """
         self.entry = entry
-        self._detector: WeatherDetector | None = None
-        self._detector_options: dict[str, Any] | None = None
+        self._detector: weather_detector.WeatherDetector | None = None
+        self._detector_options: Mapping[str, Any] | None = None
+        # Held while the analyzers run in the executor; the weather entity
+        # takes it before using the same analyzers on the event loop
+        self.analysis_lock = asyncio.Lock()
         update_interval = self._get_update_interval_minutes(entry)
         super().__init__(
             hass,
@@ -156,6 +173,13 @@ class MicroWeatherCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(minutes=update_interval),
         )
 
+    @property
+    def refresh_on_startup(self) -> bool:
+        """Return whether data should be fetched when the entry is set up."""
+        return bool(
+            self.entry.options.get(CONF_REFRESH_ON_STARTUP, DEFAULT_REFRESH_ON_STARTUP)
+        )
+
     @staticmethod
     def _get_update_interval_minutes(entry: ConfigEntry) -> int:
         """Return the configured coordinator update interval in minutes."""
@@ -167,6 +191,56 @@ class MicroWeatherCoordinator(DataUpdateCoordinator):
             return DEFAULT_UPDATE_INTERVAL
         return update_interval
 
+    def _adapt_update_interval(
+        self, detector: weather_detector.WeatherDetector
+    ) -> None:
+        """Back off polling while the weather is quiescent.
+
+        The configured interval stays the fastest refresh rate, since the
+        detector's history buffers are sized for it. In calm, settled weather
+        the coordinator refreshes less often, up to a 15 minute ceiling (or
+        the configured interval if that is already longer).
+        """
+        configured = self._get_update_interval_minutes(self.entry)
+        minutes = configured
+        if detector.trends_analyzer.is_weather_quiescent():
+            minutes = max(
+                configured,
+                min(
+                    configured * CALM_UPDATE_INTERVAL_FACTOR,
+                    MAX_CALM_UPDATE_INTERVAL,
+                ),
+            )
+
+        interval = timedelta(minutes=minutes)
+        if interval != self.update_interval:
+            _LOGGER.debug("Adjusting update interval to %s", interval)
+            self.update_interval = interval
+
+    def get_detector(self) -> weather_detector.WeatherDetector:
+        """Return the persistent detector, rebuilding it when options change.
+
+        Config entry updates replace ``entry.options`` with a new mapping, so
+        an unchanged identity means unchanged options and the per-refresh
+        check is a single comparison. A new mapping with equal contents keeps
+        the existing detector and its accumulated sensor history.
+        """
+        options = self.entry.options
+        if self._detector is not None and options is self._detector_options:
+            return self._detector
+
+        if self._detector is None or self._detector_options != options:
+            detector = weather_detector.WeatherDetector(self.hass, options)
+            self._detector = detector
+
+            # Store analyzers on coordinator for weather entity access
+            self.atmospheric_analyzer = detector.atmospheric_analyzer
+            self.solar_analyzer = detector.solar_analyzer
+            self.trends_analyzer = detector.trends_analyzer
+            self.core_analyzer = detector.core_analyzer
+        self._detector_options = options
+        return self._detector
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Update weather data from real sensors.
 
@@ -180,22 +254,16 @@ class MicroWeatherCoordinator(DataUpdateCoordinator):
         Raises:
             UpdateFailed: If critical sensors are unavailable or data is invalid
         """
-        from .weather_detector import WeatherDetector
-
         try:
-            options = dict(self.entry.options)
-            detector = self._detector
-            if detector is None or self._detector_options != options:
-                detector = WeatherDetector(self.hass, self.entry.options)
-                self._detector = detector
-                self._detector_options = options
-
-            # Store analyzers on coordinator for weather entity access
-            self.atmospheric_analyzer = detector.atmospheric_analyzer
-            self.solar_analyzer = detector.solar_analyzer
-            self.trends_analyzer = detector.trends_analyzer
-            self.core_analyzer = detector.core_analyzer
-            return detector.get_weather_data()
+            detector = self.get_detector()
+            # Read states on the event loop, then run the analysis off it
+            sensor_data = detector.read_sensor_values()
+            async with self.analysis_lock:
+                weather_data = await self.hass.async_add_executor_job(
+                    detector.get_weather_data, sensor_data
+                )
+                self._adapt_update_interval(detector)
+            return weather_data
         except Exception as err:
             _LOGGER.error("Error updating weather data: %s", err)
             raise UpdateFailed(f"Failed to update weather data: {err}") from err
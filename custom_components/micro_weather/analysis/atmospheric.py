@@ -7,13 +7,13 @@ This module handles:
 - Atmospheric stability calculations
 """
 
+from bisect import bisect_left, bisect_right
 from collections import deque
-from datetime import datetime, timedelta
 import logging
-import statistics
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from homeassistant.components.weather import ATTR_CONDITION_FOG
+import numpy as np
 
 from ..meteorological_constants import (
     FogThresholds,
@@ -24,6 +24,90 @@ from .trends import TrendsAnalyzer
 
 _LOGGER = logging.getLogger(__name__)
 
+# Barometric formula terms for station-to-sea-level pressure reduction
+_LAPSE_RATE = PhysicsConstants.LAPSE_RATE
+_STD_TEMP_SEA_LEVEL = PhysicsConstants.STD_TEMP_SEA_LEVEL
+_BAROMETRIC_EXPONENT = (PhysicsConstants.G * PhysicsConstants.M_AIR) / (
+    PhysicsConstants.R * PhysicsConstants.LAPSE_RATE
+)
+
+# Sea-level pressure classification thresholds (inHg)
+_SEA_LEVEL_PRESSURE_THRESHOLDS: Dict[str, float] = {
+    "very_high": PressureThresholds.VERY_HIGH,
+    "high": PressureThresholds.HIGH,
+    "normal_high": PressureThresholds.NORMAL_HIGH,
+    "normal_low": PressureThresholds.NORMAL_LOW,
+    "low": PressureThresholds.LOW,
+    "very_low": PressureThresholds.VERY_LOW,
+    "extremely_low": PressureThresholds.EXTREMELY_LOW,
+}
+
+# Fog scoring ladders as ascending threshold tables. Each score list has one
+# more entry than its thresholds; the bisect index selects the band.
+# Humidity scores when humidity >= threshold
+_FOG_HUMIDITY_THRESHOLDS = (
+    FogThresholds.HUMIDITY_MARGINAL_FOG,
+    FogThresholds.HUMIDITY_POSSIBLE_FOG,
+    FogThresholds.HUMIDITY_PROBABLE_FOG,
+    FogThresholds.HUMIDITY_DENSE_FOG,
+)
+_FOG_HUMIDITY_SCORES = (
+    0,
+    FogThresholds.SCORE_MARGINAL,
+    FogThresholds.SCORE_POSSIBLE,
+    FogThresholds.SCORE_PROBABLE,
+    FogThresholds.SCORE_DENSE,
+)
+# Spread scores when spread <= threshold
+_FOG_SPREAD_THRESHOLDS = (
+    FogThresholds.SPREAD_SATURATED,
+    FogThresholds.SPREAD_VERY_CLOSE,
+    FogThresholds.SPREAD_CLOSE,
+    FogThresholds.SPREAD_MARGINAL,
+)
+_FOG_SPREAD_SCORES = (
+    FogThresholds.SCORE_SPREAD_SATURATED,
+    FogThresholds.SCORE_SPREAD_VERY_CLOSE,
+    FogThresholds.SCORE_SPREAD_CLOSE,
+    FogThresholds.SCORE_SPREAD_MARGINAL,
+    0,
+)
+# Wind scores when wind speed <= threshold
+_FOG_WIND_THRESHOLDS = (
+    FogThresholds.WIND_CALM,
+    FogThresholds.WIND_LIGHT,
+    FogThresholds.WIND_MODERATE,
+)
+_FOG_WIND_SCORES = (
+    FogThresholds.SCORE_WIND_CALM,
+    FogThresholds.SCORE_WIND_LIGHT,
+    FogThresholds.SCORE_WIND_MODERATE,
+    FogThresholds.PENALTY_WIND_STRONG,
+)
+# Daytime solar scores when radiation < threshold
+_FOG_SOLAR_THRESHOLDS = (
+    FogThresholds.SOLAR_VERY_LOW,
+    FogThresholds.SOLAR_LOW,
+    FogThresholds.SOLAR_REDUCED,
+)
+_FOG_SOLAR_SCORES = (
+    FogThresholds.SCORE_SOLAR_DENSE,
+    FogThresholds.SCORE_SOLAR_MODERATE,
+    FogThresholds.SCORE_SOLAR_LIGHT,
+    -15,  # Normal/high daytime radiation is a strong indicator against fog
+)
+_FOG_EVAPORATION_BONUS = 5
+_FOG_NIGHT_PENALTY = 10
+
+# Best score the spread, wind, solar and night factors can still add once the
+# humidity score is known (evaporation bonus is added separately)
+_FOG_MAX_REMAINING_DAY = (
+    max(_FOG_SPREAD_SCORES) + max(_FOG_WIND_SCORES) + max(_FOG_SOLAR_SCORES)
+)
+_FOG_MAX_REMAINING_NIGHT = (
+    max(_FOG_SPREAD_SCORES) + max(_FOG_WIND_SCORES) - _FOG_NIGHT_PENALTY
+)
+
 
 class AtmosphericAnalyzer:
     """Analyzes atmospheric conditions including pressure and fog."""
@@ -47,6 +131,13 @@ class AtmosphericAnalyzer:
                 "trend calculations to TrendsAnalyzer to avoid code duplication."
             )
         self._trends_analyzer = trends_analyzer
+        # Altitude is a configuration value, so altitude-derived quantities are
+        # memoized for the most recently seen altitude
+        self._sea_level_factor: Optional[Tuple[float, float]] = None
+        self._pressure_thresholds: Optional[Tuple[float, Dict[str, float]]] = None
+        self._pressure_thresholds_hpa: Optional[
+            Tuple[Dict[str, float], Dict[str, float]]
+        ] = None
 
     def adjust_pressure_for_altitude(
         self, pressure_inhg: float, altitude_m: Optional[float], pressure_type: str
@@ -61,34 +152,40 @@ class AtmosphericAnalyzer:
         Returns:
             Pressure adjusted to sea-level equivalent in inHg
         """
-        altitude_m = altitude_m or 0.0
+        if pressure_type == "atmospheric":
+            return pressure_inhg
 
-        if pressure_type == "atmospheric" or altitude_m == 0:
+        # Below sea level no reduction is applied
+        altitude_m = altitude_m or 0.0
+        if altitude_m <= 0:
             return pressure_inhg
 
-        # Convert to hPa for calculation
-        pressure_hpa = pressure_inhg * PhysicsConstants.INHG_TO_HPA
+        return pressure_inhg * self.sea_level_pressure_factor(altitude_m)
 
-        # Barometric formula constants
-        L = PhysicsConstants.LAPSE_RATE
-        T0 = PhysicsConstants.STD_TEMP_SEA_LEVEL
-        g = PhysicsConstants.G
-        M = PhysicsConstants.M_AIR
-        R = PhysicsConstants.R
+    def sea_level_pressure_factor(self, altitude_m: Optional[float]) -> float:
+        """Get the station-to-sea-level pressure ratio for an altitude.
 
-        # Calculate exponent
-        exponent = (g * M) / (R * L)
+        The barometric reduction is linear in pressure at a fixed altitude,
+        so callers adjusting many readings can multiply by this factor.
 
-        # Calculate sea-level pressure
-        if altitude_m > 0:
-            sea_level_pressure_hpa = (
-                pressure_hpa * (1 - (L * altitude_m) / T0) ** exponent
-            )
-        else:
-            sea_level_pressure_hpa = pressure_hpa
+        Args:
+            altitude_m: Altitude in meters above sea level
 
-        # Convert back to inHg
-        return sea_level_pressure_hpa / PhysicsConstants.INHG_TO_HPA
+        Returns:
+            Factor applied to relative pressure readings (1.0 at or below
+            sea level)
+        """
+        altitude_m = altitude_m or 0.0
+        if altitude_m <= 0:
+            return 1.0
+
+        if self._sea_level_factor is None or self._sea_level_factor[0] != altitude_m:
+            self._sea_level_factor = (
+                altitude_m,
+                (1 - (_LAPSE_RATE * altitude_m) / _STD_TEMP_SEA_LEVEL)
+                ** _BAROMETRIC_EXPONENT,
+            )
+        return self._sea_level_factor[1]
 
     def get_altitude_adjusted_pressure_thresholds(
         self, altitude_m: Optional[float]
@@ -99,36 +196,28 @@ class AtmosphericAnalyzer:
             altitude_m: Altitude in meters above sea level
 
         Returns:
-            Dictionary of pressure thresholds in inHg
+            Dictionary of pressure thresholds in inHg. The dictionary is
+            shared between calls and must not be modified.
         """
         altitude_m = altitude_m or 0.0
 
-        # Base thresholds at sea level
-        base_thresholds = {
-            "very_high": PressureThresholds.VERY_HIGH,
-            "high": PressureThresholds.HIGH,
-            "normal_high": PressureThresholds.NORMAL_HIGH,
-            "normal_low": PressureThresholds.NORMAL_LOW,
-            "low": PressureThresholds.LOW,
-            "very_low": PressureThresholds.VERY_LOW,
-            "extremely_low": PressureThresholds.EXTREMELY_LOW,
-        }
-
         if altitude_m == 0:
-            return base_thresholds
+            return _SEA_LEVEL_PRESSURE_THRESHOLDS
 
-        # Adjust for altitude (~1 hPa per 8 meters)
-        altitude_adjustment_hpa = altitude_m / 8.0
-        altitude_adjustment_inhg = (
-            altitude_adjustment_hpa / PhysicsConstants.INHG_TO_HPA
-        )
-
-        # Apply adjustment
-        adjusted_thresholds = {}
-        for key, threshold_inhg in base_thresholds.items():
-            adjusted_thresholds[key] = threshold_inhg - altitude_adjustment_inhg
-
-        return adjusted_thresholds
+        if (
+            self._pressure_thresholds is None
+            or self._pressure_thresholds[0] != altitude_m
+        ):
+            # Adjust for altitude (~1 hPa per 8 meters)
+            altitude_adjustment_inhg = altitude_m / 8.0 / PhysicsConstants.INHG_TO_HPA
+            self._pressure_thresholds = (
+                altitude_m,
+                {
+                    key: threshold_inhg - altitude_adjustment_inhg
+                    for key, threshold_inhg in _SEA_LEVEL_PRESSURE_THRESHOLDS.items()
+                },
+            )
+        return self._pressure_thresholds[1]
 
     def get_altitude_adjusted_pressure_thresholds_hpa(
         self, altitude_m: Optional[float]
@@ -139,14 +228,23 @@ class AtmosphericAnalyzer:
             altitude_m: Altitude in meters above sea level
 
         Returns:
-            Dictionary of pressure thresholds in hPa
+            Dictionary of pressure thresholds in hPa. The dictionary is
+            shared between calls and must not be modified.
         """
-        # Get thresholds in inHg and convert to hPa
+        # Get thresholds in inHg and convert to hPa once per inHg table
         inhg_thresholds = self.get_altitude_adjusted_pressure_thresholds(altitude_m)
-        hpa_thresholds = {}
-        for key, value_inhg in inhg_thresholds.items():
-            hpa_thresholds[key] = value_inhg * PhysicsConstants.INHG_TO_HPA
-        return hpa_thresholds
+        if (
+            self._pressure_thresholds_hpa is None
+            or self._pressure_thresholds_hpa[0] is not inhg_thresholds
+        ):
+            self._pressure_thresholds_hpa = (
+                inhg_thresholds,
+                {
+                    key: value_inhg * PhysicsConstants.INHG_TO_HPA
+                    for key, value_inhg in inhg_thresholds.items()
+                },
+            )
+        return self._pressure_thresholds_hpa[1]
 
     def analyze_fog_conditions(
         self,
@@ -182,56 +280,122 @@ class AtmosphericAnalyzer:
         Returns:
             ATTR_CONDITION_FOG if fog detected, None otherwise
         """
-        fog_score = 0
+        fog_score = self._fog_score(
+            temp, humidity, spread, wind_speed, solar_rad, is_daytime
+        )
+        if fog_score is None:
+            return None
+
+        # Checked once per call; logging levels can change at runtime
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(
+                "Fog score: %.1f (humidity=%.1f%%, spread=%.2f°F, "
+                "wind=%.1f mph, solar=%.1f W/m², temp=%.1f°F, daytime=%s)",
+                fog_score,
+                humidity,
+                spread,
+                wind_speed,
+                solar_rad,
+                temp,
+                is_daytime,
+            )
+
+        # Determine fog based on score
+        # Use conservative thresholds to avoid false positives
+        if fog_score >= FogThresholds.THRESHOLD_DENSE_FOG:
+            if debug_enabled:
+                _LOGGER.debug("Dense fog detected (score: %.1f)", fog_score)
+            return ATTR_CONDITION_FOG
+        elif fog_score >= FogThresholds.THRESHOLD_MODERATE_FOG:
+            # For moderate fog, also require tight dewpoint spread as confirmation
+            if spread <= FogThresholds.SPREAD_CLOSE:
+                if debug_enabled:
+                    _LOGGER.debug("Moderate fog detected (score: %.1f)", fog_score)
+                return ATTR_CONDITION_FOG
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Moderate fog score but spread too large (%.1f > %.1f)",
+                    spread,
+                    FogThresholds.SPREAD_CLOSE,
+                )
+        elif fog_score >= FogThresholds.THRESHOLD_LIGHT_FOG:
+            # For light fog, require both high humidity AND tight spread
+            if (
+                humidity >= FogThresholds.HUMIDITY_PROBABLE_FOG
+                and spread <= FogThresholds.SPREAD_VERY_CLOSE
+            ):
+                if debug_enabled:
+                    _LOGGER.debug("Light fog detected (score: %.1f)", fog_score)
+                return ATTR_CONDITION_FOG
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Light fog score but conditions not met "
+                    "(humidity=%.1f, spread=%.1f)",
+                    humidity,
+                    spread,
+                )
 
+        if debug_enabled:
+            _LOGGER.debug("No fog detected (score: %.1f)", fog_score)
+        return None
+
+    def _fog_score(
+        self,
+        temp: float,
+        humidity: float,
+        spread: float,
+        wind_speed: float,
+        solar_rad: float,
+        is_daytime: bool,
+    ) -> Optional[float]:
+        """Score how strongly the current conditions indicate fog.
+
+        Args:
+            temp: Temperature in Fahrenheit
+            humidity: Relative humidity percentage
+            spread: Temperature minus dewpoint in Fahrenheit
+            wind_speed: Wind speed in mph
+            solar_rad: Solar radiation in W/m²
+            is_daytime: Boolean indicating daytime
+
+        Returns:
+            Fog score, or None if no fog band is reachable at this humidity
+        """
         # 1. Humidity factor (0-40 points)
         # Fog requires very high humidity - near saturation
-        if humidity >= FogThresholds.HUMIDITY_DENSE_FOG:
-            fog_score += FogThresholds.SCORE_DENSE
-        elif humidity >= FogThresholds.HUMIDITY_PROBABLE_FOG:
-            fog_score += FogThresholds.SCORE_PROBABLE
-        elif humidity >= FogThresholds.HUMIDITY_POSSIBLE_FOG:
-            fog_score += FogThresholds.SCORE_POSSIBLE
-        elif humidity >= FogThresholds.HUMIDITY_MARGINAL_FOG:
-            fog_score += FogThresholds.SCORE_MARGINAL
+        fog_score = _FOG_HUMIDITY_SCORES[
+            bisect_right(_FOG_HUMIDITY_THRESHOLDS, humidity)
+        ]
+
+        # Skip the remaining factors when no fog band is reachable. Light fog
+        # also requires probable-fog humidity, so below it moderate is the floor.
+        if humidity >= FogThresholds.HUMIDITY_PROBABLE_FOG:
+            lowest_fog_threshold = FogThresholds.THRESHOLD_LIGHT_FOG
+        else:
+            lowest_fog_threshold = FogThresholds.THRESHOLD_MODERATE_FOG
+        if is_daytime:
+            max_score = fog_score + _FOG_MAX_REMAINING_DAY + _FOG_EVAPORATION_BONUS
+        else:
+            max_score = fog_score + _FOG_MAX_REMAINING_NIGHT
+        if max_score < lowest_fog_threshold:
+            return None
 
         # 2. Temperature-dewpoint spread (0-30 points)
         # Critical for fog - air must be near saturation
-        if spread <= FogThresholds.SPREAD_SATURATED:
-            fog_score += FogThresholds.SCORE_SPREAD_SATURATED
-        elif spread <= FogThresholds.SPREAD_VERY_CLOSE:
-            fog_score += FogThresholds.SCORE_SPREAD_VERY_CLOSE
-        elif spread <= FogThresholds.SPREAD_CLOSE:
-            fog_score += FogThresholds.SCORE_SPREAD_CLOSE
-        elif spread <= FogThresholds.SPREAD_MARGINAL:
-            fog_score += FogThresholds.SCORE_SPREAD_MARGINAL
+        fog_score += _FOG_SPREAD_SCORES[bisect_left(_FOG_SPREAD_THRESHOLDS, spread)]
 
         # 3. Wind factor (0-15 points)
         # Fog requires calm to light winds - strong winds disperse fog
-        if wind_speed <= FogThresholds.WIND_CALM:
-            fog_score += FogThresholds.SCORE_WIND_CALM
-        elif wind_speed <= FogThresholds.WIND_LIGHT:
-            fog_score += FogThresholds.SCORE_WIND_LIGHT
-        elif wind_speed <= FogThresholds.WIND_MODERATE:
-            fog_score += FogThresholds.SCORE_WIND_MODERATE
-        else:
-            # Strong winds are a strong negative indicator for fog
-            fog_score += FogThresholds.PENALTY_WIND_STRONG
+        fog_score += _FOG_WIND_SCORES[bisect_left(_FOG_WIND_THRESHOLDS, wind_speed)]
 
         # 4. Solar radiation factor (0-15 points)
         # During daytime, fog significantly reduces solar radiation
         # At night, solar radiation is naturally zero - this is NOT evidence of fog
         if is_daytime:
-            if solar_rad < FogThresholds.SOLAR_VERY_LOW:
-                fog_score += FogThresholds.SCORE_SOLAR_DENSE
-            elif solar_rad < FogThresholds.SOLAR_LOW:
-                fog_score += FogThresholds.SCORE_SOLAR_MODERATE
-            elif solar_rad < FogThresholds.SOLAR_REDUCED:
-                fog_score += FogThresholds.SCORE_SOLAR_LIGHT
-            else:
-                # If solar radiation is normal/high during daytime,
-                # this is a strong indicator against fog
-                fog_score -= 15
+            fog_score += _FOG_SOLAR_SCORES[
+                bisect_right(_FOG_SOLAR_THRESHOLDS, solar_rad)
+            ]
         else:
             # At night, solar radiation being zero is EXPECTED and provides
             # no evidence for or against fog. Only during twilight when we'd
@@ -250,7 +414,7 @@ class AtmosphericAnalyzer:
             and humidity >= FogThresholds.HUMIDITY_PROBABLE_FOG
             and spread <= FogThresholds.SPREAD_CLOSE
         ):
-            fog_score += 5
+            fog_score += _FOG_EVAPORATION_BONUS
 
         # 6. Nighttime penalty - high humidity is NORMAL at night
         # Without visibility sensors, we must be very conservative about
@@ -259,54 +423,9 @@ class AtmosphericAnalyzer:
         if not is_daytime:
             # Apply a penalty to counteract the naturally high humidity
             # at night. Only truly extreme conditions should trigger fog.
-            fog_score -= 10
-
-        _LOGGER.debug(
-            "Fog score: %.1f (humidity=%.1f%%, spread=%.2f°F, "
-            "wind=%.1f mph, solar=%.1f W/m², temp=%.1f°F, daytime=%s)",
-            fog_score,
-            humidity,
-            spread,
-            wind_speed,
-            solar_rad,
-            temp,
-            is_daytime,
-        )
-
-        # Determine fog based on score
-        # Use conservative thresholds to avoid false positives
-        if fog_score >= FogThresholds.THRESHOLD_DENSE_FOG:
-            _LOGGER.debug("Dense fog detected (score: %.1f)", fog_score)
-            return ATTR_CONDITION_FOG
-        elif fog_score >= FogThresholds.THRESHOLD_MODERATE_FOG:
-            # For moderate fog, also require tight dewpoint spread as confirmation
-            if spread <= FogThresholds.SPREAD_CLOSE:
-                _LOGGER.debug("Moderate fog detected (score: %.1f)", fog_score)
-                return ATTR_CONDITION_FOG
-            else:
-                _LOGGER.debug(
-                    "Moderate fog score but spread too large (%.1f > %.1f)",
-                    spread,
-                    FogThresholds.SPREAD_CLOSE,
-                )
-        elif fog_score >= FogThresholds.THRESHOLD_LIGHT_FOG:
-            # For light fog, require both high humidity AND tight spread
-            if (
-                humidity >= FogThresholds.HUMIDITY_PROBABLE_FOG
-                and spread <= FogThresholds.SPREAD_VERY_CLOSE
-            ):
-                _LOGGER.debug("Light fog detected (score: %.1f)", fog_score)
-                return ATTR_CONDITION_FOG
-            else:
-                _LOGGER.debug(
-                    "Light fog score but conditions not met "
-                    "(humidity=%.1f, spread=%.1f)",
-                    humidity,
-                    spread,
-                )
+            fog_score -= _FOG_NIGHT_PENALTY
 
-        _LOGGER.debug("No fog detected (score: %.1f)", fog_score)
-        return None
+        return fog_score
 
     def analyze_wind_direction_trends(self) -> Dict[str, Any]:
         """Analyze wind direction trends for weather prediction.
@@ -329,88 +448,49 @@ class AtmosphericAnalyzer:
             - direction_change_rate: Degrees per hour wind shift rate
             - significant_shift: Boolean indicating major direction change (>45°)
         """
-        if "wind_direction" not in self._sensor_history:
+        history = self._sensor_history.get("wind_direction")
+        if not history:
             return {
                 "direction_stability": 0.5,
                 "direction_change_rate": 0.0,
                 "significant_shift": False,
             }
 
-        if not self._sensor_history["wind_direction"]:
+        recent_data, is_numeric_timestamp = self._trends_analyzer.select_recent_entries(
+            history, 24, "wind_direction"
+        )
+        if len(recent_data) < 3:
             return {
                 "direction_stability": 0.5,
                 "direction_change_rate": 0.0,
                 "significant_shift": False,
             }
 
-        # Separate numeric and datetime timestamps to handle mixed data
-        numeric_data = []
-        datetime_data = []
-
-        for entry in self._sensor_history["wind_direction"]:
-            timestamp = entry["timestamp"]
-            if isinstance(timestamp, (int, float)):
-                numeric_data.append(entry)
-            elif isinstance(timestamp, datetime):
-                datetime_data.append(entry)
-
-        # Prefer datetime data if we have enough, otherwise use numeric
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        if datetime_data:
-            recent_data = [
-                entry for entry in datetime_data if entry["timestamp"] > cutoff_time
-            ]
-            is_numeric_timestamp = False
-        elif numeric_data:
-            recent_data = numeric_data
-            is_numeric_timestamp = True
-        else:
-            return {
-                "direction_stability": 0.5,
-                "direction_change_rate": 0.0,
-                "significant_shift": False,
-            }
+        time_offsets, directions = self._trends_analyzer.history_arrays(
+            recent_data, is_numeric_timestamp
+        )
 
-        if len(recent_data) < 3:
-            return {
-                "direction_stability": 0.5,
-                "direction_change_rate": 0.0,
-                "significant_shift": False,
-            }
+        # Calculate stability (at least three samples, so stdev is defined)
+        volatility = float(directions.std(ddof=1))
+        stability = max(0.0, 1.0 - (volatility / 180.0))
 
-        directions = [entry["value"] for entry in recent_data]
-        timestamps = [entry["timestamp"] for entry in recent_data]
-
-        # Calculate stability
-        try:
-            volatility = statistics.stdev(directions) if len(directions) > 1 else 0
-            stability = max(0.0, 1.0 - (volatility / 180.0))
-        except statistics.StatisticsError:
-            stability = 0.5
-
-        # Calculate change rate
-        direction_changes = []
-        for i in range(1, len(directions)):
-            change = self._calculate_angular_difference(
-                directions[i - 1], directions[i]
-            )
-            direction_changes.append(change)
+        # Calculate change rate: shortest signed angular step between
+        # consecutive samples, as in _calculate_angular_difference
+        direction_changes = np.mod(np.diff(directions), 360.0)
+        direction_changes[direction_changes > 180] -= 360.0
 
         # Calculate time span
-        if is_numeric_timestamp:
-            total_time_hours = float(timestamps[-1] - timestamps[0])
-        else:
-            total_time_hours = (timestamps[-1] - timestamps[0]).total_seconds() / 3600
+        total_time_hours = float(time_offsets[-1])
         if total_time_hours > 0:
             avg_change_per_hour = (
-                sum(abs(c) for c in direction_changes) / total_time_hours
+                float(np.abs(direction_changes).sum()) / total_time_hours
             )
         else:
             avg_change_per_hour = 0.0
 
         # Detect significant shift
         recent_change = self._calculate_angular_difference(
-            directions[0], directions[-1]
+            float(directions[0]), float(directions[-1])
         )
         significant_shift = abs(recent_change) > 45
 
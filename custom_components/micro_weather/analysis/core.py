@@ -4,9 +4,11 @@ This module contains the main weather condition determination logic,
 simplified and focused on clarity and maintainability.
 """
 
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
 import logging
 import math
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, cast
 
 from homeassistant.components.weather import (
     ATTR_CONDITION_CLEAR_NIGHT,
@@ -21,6 +23,8 @@ from homeassistant.components.weather import (
     ATTR_CONDITION_SUNNY,
     ATTR_CONDITION_WINDY,
 )
+import numpy as np
+from numpy.typing import NDArray
 
 from ..const import (
     KEY_DEWPOINT,
@@ -46,6 +50,281 @@ from ..meteorological_constants import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Rain state sensor values that mean "wet" once lowercased and stripped
+_WET_RAIN_STATES = ("wet", "raining", "rain", "precipitation", "1", "true", "on")
+
+# Decision tables for the solar-less condition fallbacks. Each predicate is
+# evaluated once into a bit of a mask, and the first rule whose required
+# bits are all set decides the condition.
+_FB_DRY = 1 << 0  # humidity < HUMIDITY_MODERATE and spread > SPREAD_MODERATE
+_FB_FAIR = 1 << 1  # humidity < HUMIDITY_MODERATE_HIGH and spread > SPREAD_HUMID
+_FB_NORMAL_PRESSURE = 1 << 2  # normal_low <= pressure <= normal_high
+_FB_HIGH_PRESSURE = 1 << 3  # pressure > high
+_FB_LOW_PRESSURE = 1 << 4  # pressure < low
+_FB_HUMIDITY_LOW = 1 << 5  # humidity < HUMIDITY_FALLBACK_LOW
+_FB_HUMIDITY_MEDIUM = 1 << 6  # humidity < HUMIDITY_FALLBACK_MEDIUM
+_FB_HUMIDITY_HIGH = 1 << 7  # humidity >= HUMIDITY_FALLBACK_HIGH
+
+_FALLBACK_RULES: Tuple[Tuple[int, str], ...] = (
+    (_FB_DRY, ATTR_CONDITION_SUNNY),
+    (_FB_FAIR | _FB_NORMAL_PRESSURE, ATTR_CONDITION_SUNNY),
+    (_FB_HIGH_PRESSURE | _FB_HUMIDITY_LOW, ATTR_CONDITION_SUNNY),
+    (_FB_LOW_PRESSURE | _FB_HUMIDITY_MEDIUM, ATTR_CONDITION_PARTLYCLOUDY),
+    (_FB_HUMIDITY_HIGH, ATTR_CONDITION_CLOUDY),
+)
+
+_NIGHT_LOW_PRESSURE = 1 << 0  # pressure < low
+_NIGHT_HIGH_PRESSURE = 1 << 1  # pressure > high
+_NIGHT_VERY_HIGH_PRESSURE = 1 << 2  # pressure > very_high
+_NIGHT_NORMAL_PRESSURE = 1 << 3  # normal_low <= pressure <= normal_high
+_NIGHT_STILL = 1 << 4  # wind < 3 mph
+_NIGHT_CALM = 1 << 5  # wind < CALM
+_NIGHT_LIGHT_WIND = 1 << 6  # CALM <= wind < LIGHT_BREEZE
+_NIGHT_STEADY_GUSTS = 1 << 7  # gust factor <= GUST_FACTOR_MODERATE
+_NIGHT_SATURATED = 1 << 8  # humidity > HUMIDITY_HIGH
+_NIGHT_HUMIDITY_BELOW_65 = 1 << 9
+_NIGHT_HUMIDITY_BELOW_70 = 1 << 10  # humidity < HUMIDITY_MODERATE_HIGH
+_NIGHT_HUMIDITY_BELOW_80 = 1 << 11
+_NIGHT_HUMIDITY_BELOW_85 = 1 << 12
+_NIGHT_HUMIDITY_BELOW_90 = 1 << 13
+_NIGHT_HUMIDITY_ABOVE_90 = 1 << 14
+
+_NIGHT_RULES: Tuple[Tuple[int, str], ...] = (
+    # Most specific: low pressure, saturated and still air
+    (
+        _NIGHT_LOW_PRESSURE | _NIGHT_SATURATED | _NIGHT_STILL,
+        ATTR_CONDITION_CLOUDY,
+    ),
+    # Clear night conditions
+    (
+        _NIGHT_VERY_HIGH_PRESSURE | _NIGHT_CALM | _NIGHT_HUMIDITY_BELOW_70,
+        ATTR_CONDITION_CLEAR_NIGHT,
+    ),
+    (
+        _NIGHT_HIGH_PRESSURE | _NIGHT_STEADY_GUSTS | _NIGHT_HUMIDITY_BELOW_80,
+        ATTR_CONDITION_CLEAR_NIGHT,
+    ),
+    (_NIGHT_LOW_PRESSURE | _NIGHT_HUMIDITY_BELOW_65, ATTR_CONDITION_CLEAR_NIGHT),
+    # Partly cloudy night
+    (
+        _NIGHT_NORMAL_PRESSURE | _NIGHT_LIGHT_WIND | _NIGHT_HUMIDITY_BELOW_85,
+        ATTR_CONDITION_PARTLYCLOUDY,
+    ),
+    (_NIGHT_LOW_PRESSURE | _NIGHT_HUMIDITY_BELOW_90, ATTR_CONDITION_PARTLYCLOUDY),
+    # Cloudy night
+    (_NIGHT_HUMIDITY_ABOVE_90, ATTR_CONDITION_CLOUDY),
+)
+
+# Light-level comparisons packed into one byte by the batch path, bit 0
+# first: radiation > 5, lux > 50, UV > 0.1, lux > 10, lux < 100,
+# radiation > 1, radiation < 50. The tables map every byte to the daytime
+# (any of the first three) and twilight (lux or radiation window) flags.
+_DAYTIME_LUT = np.array([bool(bits & 0b0000111) for bits in range(128)])
+_TWILIGHT_LUT = np.array(
+    [
+        bits & 0b0011000 == 0b0011000 or bits & 0b1100000 == 0b1100000
+        for bits in range(128)
+    ]
+)
+
+# Time-of-day regimes, indexing WeatherConditionAnalyzer._REGIME_CONDITIONS
+_REGIME_DAY = 0
+_REGIME_TWILIGHT = 1
+_REGIME_NIGHT = 2
+
+# Precipitation intensity labels, selected by rain_rate >= threshold
+_INTENSITY_THRESHOLDS = (
+    PrecipitationThresholds.SIGNIFICANT,
+    PrecipitationThresholds.LIGHT,
+    PrecipitationThresholds.HEAVY,
+)
+_INTENSITY_LABELS = ("trace", "light", "moderate", "heavy")
+
+# Visibility bands (km) as ascending threshold tables. Each distance list
+# has one more entry than its thresholds; the bisect index selects the band.
+_FOG_VISIBILITY_HUMIDITY = (92.0, 95.0)  # humidity >= threshold
+_FOG_VISIBILITY_KM = (2.0, 1.0, 0.5)
+_CLEAR_NIGHT_VISIBILITY_HUMIDITY = (50.0, 70.0)  # humidity >= threshold
+_CLEAR_NIGHT_VISIBILITY_KM = (25.0, 20.0, 15.0)
+# radiation > threshold; 600 W/m² is inclusive, hence the float just below it
+_SUNNY_VISIBILITY_RADIATION = (400.0, math.nextafter(600.0, 0.0), 800.0)
+_SUNNY_VISIBILITY_KM = (15.0, 20.0, 25.0, 30.0)
+_CLOUDY_DAY_VISIBILITY_LUX = (5000.0, 20000.0, 50000.0)  # lux > threshold
+_CLOUDY_DAY_VISIBILITY_KM = (12.0, 15.0, 20.0, 25.0)
+_CLOUDY_NIGHT_VISIBILITY_HUMIDITY = (75.0, 85.0)  # humidity >= threshold
+_CLOUDY_NIGHT_VISIBILITY_KM = (18.0, 15.0, 12.0)
+
+# Magnus formula constants (Celsius)
+_MAGNUS_A = 17.27
+_MAGNUS_B = 237.7
+
+
+def _magnus_dewpoint(temp_f: float, humidity: float) -> float:
+    """Return the Magnus dewpoint in Fahrenheit for a positive humidity."""
+    temp_c = (temp_f - 32) * 5 / 9
+    gamma = (_MAGNUS_A * temp_c) / (_MAGNUS_B + temp_c) + math.log(humidity / 100.0)
+    return (_MAGNUS_B * gamma) / (_MAGNUS_A - gamma) * 9 / 5 + 32
+
+
+def _sensor_column(
+    columns: Mapping[str, Any], key: str, rows: int, default: float
+) -> NDArray[np.float64]:
+    """Return a sensor column as floats, substituting the scalar default.
+
+    Mirrors ``float(value or default)`` in ``_extract_sensors``: missing,
+    None/NaN and zero readings all take the default.
+    """
+    values = columns.get(key)
+    if values is None:
+        return np.full(rows, default)
+    column = np.asarray(values, dtype=float)
+    return np.where(np.isnan(column) | (column == 0), default, column)
+
+
+@dataclass(frozen=True, slots=True)
+class SensorReadings:
+    """Normalized sensor readings used by the condition checks.
+
+    Numeric readings default to neutral values when missing; the optional
+    fields stay None when the sensor is not configured.
+    """
+
+    rain_rate: float = 0.0
+    rain_state: str = "dry"
+    wind_speed: float = 0.0
+    wind_gust: float = 0.0
+    solar_radiation: float = 0.0
+    solar_lux: float = 0.0
+    uv_index: float = 0.0
+    outdoor_temp: float = 70.0
+    humidity: float = 50.0
+    pressure: float = 29.92
+    dewpoint_raw: Any = None
+    solar_elevation: Optional[float] = None
+    lightning_count: Optional[float] = None
+    lightning_distance: Optional[float] = None
+    lightning_time: Any = None
+
+    @classmethod
+    def from_raw(cls, sensor_data: Dict[str, Any]) -> "SensorReadings":
+        """Extract sensor values from raw readings, applying defaults.
+
+        Args:
+            sensor_data: Dictionary containing raw sensor readings
+
+        Returns:
+            Normalized sensor readings (numeric values are never None)
+        """
+        # Safely extract rain rate - ensure it's a valid number
+        rain_rate = sensor_data.get(KEY_RAIN_RATE)
+        if rain_rate is None or (isinstance(rain_rate, float) and rain_rate < 0):
+            rain_rate = 0.0
+        else:
+            rain_rate = float(rain_rate) if rain_rate else 0.0
+
+        # Safely extract rain state - normalize to lowercase
+        rain_state = sensor_data.get("rain_state", "dry")
+        if rain_state is None:
+            rain_state = "dry"
+        rain_state = str(rain_state).lower().strip()
+        # Normalize common rain state variations
+        if rain_state in _WET_RAIN_STATES:
+            rain_state = "wet"
+        elif rain_state in ["not raining", "no rain", "0", "false", "off"]:
+            rain_state = "dry"
+
+        # Extract lightning sensor data (None means sensor not configured)
+        lightning_count_raw = sensor_data.get(KEY_LIGHTNING_COUNT)
+        lightning_distance_raw = sensor_data.get(KEY_LIGHTNING_DISTANCE)
+
+        return cls(
+            rain_rate=rain_rate,
+            rain_state=rain_state,
+            wind_speed=float(sensor_data.get(KEY_WIND_SPEED) or 0.0),
+            wind_gust=float(sensor_data.get(KEY_WIND_GUST) or 0.0),
+            solar_radiation=float(sensor_data.get(KEY_SOLAR_RADIATION) or 0.0),
+            solar_lux=float(sensor_data.get(KEY_SOLAR_LUX_INTERNAL) or 0.0),
+            uv_index=float(sensor_data.get(KEY_UV_INDEX) or 0.0),
+            outdoor_temp=float(sensor_data.get(KEY_OUTDOOR_TEMP) or 70.0),
+            humidity=float(sensor_data.get(KEY_HUMIDITY) or 50.0),
+            pressure=float(sensor_data.get(KEY_PRESSURE) or 29.92),
+            dewpoint_raw=sensor_data.get(KEY_DEWPOINT),
+            solar_elevation=sensor_data.get("solar_elevation"),
+            lightning_count=(
+                float(lightning_count_raw) if lightning_count_raw is not None else None
+            ),
+            lightning_distance=(
+                float(lightning_distance_raw)
+                if lightning_distance_raw is not None
+                else None
+            ),
+            lightning_time=sensor_data.get(KEY_LIGHTNING_TIME),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PressureBands:
+    """Altitude-adjusted pressure thresholds in inHg."""
+
+    extremely_low: float
+    very_low: float
+    low: float
+    normal_low: float
+    normal_high: float
+    high: float
+    very_high: float
+
+    @classmethod
+    def from_thresholds(cls, thresholds: Mapping[str, float]) -> "PressureBands":
+        """Build bands from a get_altitude_adjusted_pressure_thresholds dict.
+
+        Args:
+            thresholds: Pressure thresholds keyed by band name
+
+        Returns:
+            PressureBands with the same values
+        """
+        return cls(
+            extremely_low=thresholds["extremely_low"],
+            very_low=thresholds["very_low"],
+            low=thresholds["low"],
+            normal_low=thresholds["normal_low"],
+            normal_high=thresholds["normal_high"],
+            high=thresholds["high"],
+            very_high=thresholds["very_high"],
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DerivedParameters:
+    """Meteorological parameters derived from one set of sensor readings."""
+
+    dewpoint: float
+    temp_dewpoint_spread: float
+    is_freezing: bool
+    is_daytime: bool
+    is_twilight: bool  # only evaluated when not daytime
+    has_solar_data: bool  # any positive radiation, lux or UV reading
+    regime: int  # _REGIME_DAY, _REGIME_TWILIGHT or _REGIME_NIGHT
+    altitude: float
+    adjusted_pressure: float
+    pressure_thresholds: PressureBands
+    gust_factor: float
+    # Storm indicators shared by the thunderstorm, severe and windy checks
+    storm_pressure: bool  # pressure < extremely_low
+    low_pressure: bool  # pressure < very_low
+    wind_strong_band: bool  # FRESH_BREEZE <= wind < NEAR_GALE
+    strong_turbulence: bool  # gust factor > GUST_FACTOR_STRONG
+    severe_turbulence: bool  # severe gust factor with severe gusts, or extreme gusts
+    extreme_gusts: bool  # gusts > GUST_EXTREME
+
+
+def _precipitation_visibility(base: float, sensors: SensorReadings) -> float:
+    """Return rain/snow visibility in km from the clear-precipitation base."""
+    intensity_factor = 0.3 if sensors.rain_rate > 0.5 else 0.7
+    wind_factor = max(0.6, 1.0 - (sensors.wind_speed / 50))
+    return round(max(0.5, base * intensity_factor * wind_factor), 1)
+
 
 class WeatherConditionAnalyzer:
     """Analyzes weather conditions based on sensor data.
@@ -70,6 +349,14 @@ class WeatherConditionAnalyzer:
         self.atmospheric = atmospheric_analyzer
         self.solar = solar_analyzer
         self.trends = trends_analyzer
+        # One-slot memos so estimate_visibility reuses the values computed by
+        # determine_condition for the same readings
+        self._sensors_memo: Optional[Tuple[Dict[str, Any], SensorReadings]] = None
+        self._params_memo: Optional[Tuple[SensorReadings, float, DerivedParameters]] = (
+            None
+        )
+        # Station altitude rarely changes: (altitude, pressure factor, thresholds)
+        self._altitude_memo: Optional[Tuple[float, float, PressureBands]] = None
 
     def determine_condition(
         self,
@@ -94,6 +381,41 @@ class WeatherConditionAnalyzer:
         # Calculate derived parameters
         params = self._calculate_parameters(sensors, altitude)
 
+        return self._classify(sensors, params)
+
+    def evaluate(
+        self,
+        sensor_data: Dict[str, Any],
+        altitude: Optional[float] = 0.0,
+    ) -> Tuple[str, float]:
+        """Determine the weather condition and its estimated visibility.
+
+        Equivalent to determine_condition followed by estimate_visibility,
+        but extracts the sensor readings and derived parameters only once.
+
+        Args:
+            sensor_data: Dictionary of current sensor readings
+            altitude: Altitude in meters for pressure correction
+
+        Returns:
+            Tuple of (weather condition string, visibility in kilometers)
+        """
+        sensors = self._extract_sensors(sensor_data)
+        condition = self._classify(
+            sensors, self._calculate_parameters(sensors, altitude)
+        )
+        return condition, self._visibility(condition, sensors)
+
+    def _classify(self, sensors: SensorReadings, params: DerivedParameters) -> str:
+        """Run the condition priority checks for determine_condition.
+
+        Args:
+            sensors: Normalized sensor readings
+            params: Derived parameters for the readings
+
+        Returns:
+            Weather condition string
+        """
         # Priority 0: Real lightning sensor detection (highest priority)
         if condition := self._check_lightning_sensor(sensors, params):
             return condition
@@ -110,76 +432,270 @@ class WeatherConditionAnalyzer:
         if condition := self._check_severe_weather(sensors, params):
             return condition
 
-        # Priority 4: Daytime/nighttime cloud-based conditions
-        if params["is_daytime"]:
-            return self._determine_daytime_condition(sensors, params)
-        elif params["is_twilight"]:
-            return self._determine_twilight_condition(sensors, params)
-        else:
-            return self._determine_nighttime_condition(sensors, params)
+        # Priority 4: Daytime/twilight/nighttime cloud-based conditions
+        return self._REGIME_CONDITIONS[params.regime](self, sensors, params)
 
-    def _extract_sensors(self, sensor_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract and validate sensor values with defaults.
+    def determine_conditions(
+        self,
+        sensor_columns: Mapping[str, Any],
+        altitude: Optional[float] = 0.0,
+    ) -> List[str]:
+        """Determine weather conditions for many sensor readings at once.
 
-        Extracts all relevant sensor readings from the sensor data dictionary
-        and applies default values for missing or None values to ensure
-        consistent processing downstream.
+        Batch counterpart of ``determine_condition`` for historical series or
+        multi-station data. Columns use the same keys as ``sensor_data`` and
+        must all have the same length; missing values may be None or NaN.
+
+        The stateless priority gates (precipitation, severe weather, twilight
+        and night) are evaluated as NumPy masks over all rows. Rows that need
+        history - a nearby lightning sensor reading, fog candidates and
+        daytime cloud cover with its hysteresis - go through
+        ``determine_condition`` in row order, so results match calling it
+        row by row.
 
         Args:
-            sensor_data: Dictionary containing raw sensor readings
+            sensor_columns: Mapping of sensor key to a sequence of readings
+            altitude: Altitude in meters for pressure correction
 
         Returns:
-            Dictionary with normalized sensor values (never None)
+            Weather condition string for each row
         """
-        # Safely extract rain rate - ensure it's a valid number
-        rain_rate = sensor_data.get(KEY_RAIN_RATE)
-        if rain_rate is None or (isinstance(rain_rate, float) and rain_rate < 0):
-            rain_rate = 0.0
+        if not sensor_columns:
+            return []
+        rows = len(next(iter(sensor_columns.values())))
+        if rows == 0:
+            return []
+
+        rain_rate = _sensor_column(sensor_columns, KEY_RAIN_RATE, rows, 0.0)
+        rain_rate = np.maximum(rain_rate, 0.0)
+        wind_speed = _sensor_column(sensor_columns, KEY_WIND_SPEED, rows, 0.0)
+        wind_gust = _sensor_column(sensor_columns, KEY_WIND_GUST, rows, 0.0)
+        solar_radiation = _sensor_column(sensor_columns, KEY_SOLAR_RADIATION, rows, 0.0)
+        solar_lux = _sensor_column(sensor_columns, KEY_SOLAR_LUX_INTERNAL, rows, 0.0)
+        uv_index = _sensor_column(sensor_columns, KEY_UV_INDEX, rows, 0.0)
+        outdoor_temp = _sensor_column(sensor_columns, KEY_OUTDOOR_TEMP, rows, 70.0)
+        humidity = _sensor_column(sensor_columns, KEY_HUMIDITY, rows, 50.0)
+        pressure = _sensor_column(sensor_columns, KEY_PRESSURE, rows, 29.92)
+
+        rain_state = sensor_columns.get("rain_state")
+        is_wet: NDArray[np.bool_]
+        if rain_state is None:
+            is_wet = np.zeros(rows, dtype=bool)
         else:
-            rain_rate = float(rain_rate) if rain_rate else 0.0
+            states = np.char.strip(np.char.lower(np.asarray(rain_state, dtype=str)))
+            is_wet = np.isin(states, _WET_RAIN_STATES)
+
+        # Magnus dewpoint where the station does not report one
+        with np.errstate(invalid="ignore", divide="ignore"):
+            temp_c = (outdoor_temp - 32) * 5 / 9
+            gamma = (_MAGNUS_A * temp_c) / (_MAGNUS_B + temp_c) + np.log(
+                humidity / 100.0
+            )
+            calculated = (_MAGNUS_B * gamma) / (_MAGNUS_A - gamma) * 9 / 5 + 32
+        calculated = np.where(humidity <= 0, outdoor_temp - 50, calculated)
+        dewpoint = sensor_columns.get(KEY_DEWPOINT)
+        if dewpoint is not None:
+            reported = np.asarray(dewpoint, dtype=float)
+            calculated = np.where(np.isnan(reported), calculated, reported)
+        spread = outdoor_temp - calculated
+
+        solar_elevation = sensor_columns.get("solar_elevation")
+        elevation = (
+            np.full(rows, np.nan)
+            if solar_elevation is None
+            else np.asarray(solar_elevation, dtype=float)
+        )
+        light_bits = np.packbits(
+            np.stack(
+                (
+                    solar_radiation > 5,
+                    solar_lux > 50,
+                    uv_index > 0.1,
+                    solar_lux > 10,
+                    solar_lux < 100,
+                    solar_radiation > 1,
+                    solar_radiation < 50,
+                )
+            ),
+            axis=0,
+            bitorder="little",
+        )[0]
+        no_solar_data = (solar_radiation == 0) & (solar_lux == 0) & (uv_index == 0)
+        is_daytime = _DAYTIME_LUT[light_bits] | ((elevation > 0) & no_solar_data)
+        is_twilight = _TWILIGHT_LUT[light_bits]
+
+        pressure_factor, thresholds = self._altitude_corrections(altitude or 0.0)
+        adjusted = pressure * pressure_factor
+        gust_factor = wind_gust / np.maximum(wind_speed, 1.0)
+        normal_pressure = (thresholds.normal_low <= adjusted) & (
+            adjusted <= thresholds.normal_high
+        )
 
-        # Safely extract rain state - normalize to lowercase
-        rain_state = sensor_data.get("rain_state", "dry")
-        if rain_state is None:
-            rain_state = "dry"
-        rain_state = str(rain_state).lower().strip()
-        # Normalize common rain state variations
-        if rain_state in ["raining", "rain", "precipitation", "1", "true", "on"]:
-            rain_state = "wet"
-        elif rain_state in ["not raining", "no rain", "0", "false", "off"]:
-            rain_state = "dry"
+        # Lightning sensor readings need the strike timestamp checked per row
+        lightning_count = sensor_columns.get(KEY_LIGHTNING_COUNT)
+        lightning_distance = sensor_columns.get(KEY_LIGHTNING_DISTANCE)
+        lightning_nearby: NDArray[np.bool_]
+        if lightning_count is None or lightning_distance is None:
+            lightning_nearby = np.zeros(rows, dtype=bool)
+        else:
+            lightning_nearby = (
+                np.asarray(lightning_count, dtype=float)
+                >= LightningThresholds.MIN_STRIKES
+            ) & (
+                np.asarray(lightning_distance, dtype=float)
+                <= LightningThresholds.NEARBY
+            )
 
-        # Extract lightning sensor data (None means sensor not configured)
-        lightning_count_raw = sensor_data.get(KEY_LIGHTNING_COUNT)
-        lightning_distance_raw = sensor_data.get(KEY_LIGHTNING_DISTANCE)
+        # Priority 1: precipitation, excluding wet sensors that are likely dew
+        significant_rain = rain_rate > PrecipitationThresholds.SIGNIFICANT
+        likely_dew = (
+            ~significant_rain
+            & is_wet
+            & (wind_speed < 2.0)
+            & (humidity >= 95)
+            & (spread < 2.0)
+        )
+        has_precipitation = ~likely_dew & (
+            significant_rain
+            | (is_wet & (rain_rate >= PrecipitationThresholds.SIGNIFICANT / 2))
+        )
+        is_thunderstorm = (
+            (adjusted < thresholds.extremely_low)
+            | (
+                (adjusted < thresholds.very_low)
+                & (wind_speed >= WindThresholds.FRESH_BREEZE)
+                & (rain_rate > PrecipitationThresholds.LIGHT)
+            )
+            | (
+                (adjusted < thresholds.very_low)
+                & (gust_factor > WindThresholds.GUST_FACTOR_STRONG)
+                & (rain_rate > PrecipitationThresholds.MODERATE)
+            )
+            | (
+                (
+                    (
+                        (gust_factor > WindThresholds.GUST_FACTOR_SEVERE)
+                        & (wind_gust > WindThresholds.GUST_SEVERE)
+                    )
+                    | (wind_gust > WindThresholds.GUST_EXTREME)
+                )
+                & (rain_rate > PrecipitationThresholds.STORM_MIN_RATE)
+            )
+        )
+        precipitation = np.select(
+            [
+                outdoor_temp <= TemperatureThresholds.FREEZING,
+                is_thunderstorm,
+                rain_rate >= PrecipitationThresholds.MODERATE,
+            ],
+            [
+                ATTR_CONDITION_SNOWY,
+                ATTR_CONDITION_LIGHTNING_RAINY,
+                ATTR_CONDITION_POURING,
+            ],
+            ATTR_CONDITION_RAINY,
+        )
 
-        return {
-            "rain_rate": rain_rate,
-            "rain_state": rain_state,
-            "wind_speed": float(sensor_data.get(KEY_WIND_SPEED) or 0.0),
-            "wind_gust": float(sensor_data.get(KEY_WIND_GUST) or 0.0),
-            "solar_radiation": float(sensor_data.get(KEY_SOLAR_RADIATION) or 0.0),
-            "solar_lux": float(sensor_data.get(KEY_SOLAR_LUX_INTERNAL) or 0.0),
-            "uv_index": float(sensor_data.get(KEY_UV_INDEX) or 0.0),
-            "outdoor_temp": float(sensor_data.get(KEY_OUTDOOR_TEMP) or 70.0),
-            "humidity": float(sensor_data.get(KEY_HUMIDITY) or 50.0),
-            "pressure": float(sensor_data.get(KEY_PRESSURE) or 29.92),
-            "dewpoint_raw": sensor_data.get(KEY_DEWPOINT),
-            "solar_elevation": sensor_data.get("solar_elevation"),
-            "lightning_count": (
-                float(lightning_count_raw) if lightning_count_raw is not None else None
-            ),
-            "lightning_distance": (
-                float(lightning_distance_raw)
-                if lightning_distance_raw is not None
-                else None
-            ),
-            "lightning_time": sensor_data.get(KEY_LIGHTNING_TIME),
-        }
+        # Priority 3: severe weather without precipitation
+        wind_strong = (wind_speed >= WindThresholds.FRESH_BREEZE) & (
+            wind_speed < WindThresholds.NEAR_GALE
+        )
+        is_severe = (
+            (adjusted < thresholds.very_low)
+            & wind_strong
+            & (gust_factor > WindThresholds.GUST_FACTOR_STRONG)
+        ) | (wind_gust > WindThresholds.GUST_EXTREME)
+        is_gale = wind_speed >= WindThresholds.NEAR_GALE
+
+        # Priority 4: twilight and night from pressure, humidity and wind
+        twilight = np.where(
+            (solar_lux > 50) & normal_pressure,
+            ATTR_CONDITION_PARTLYCLOUDY,
+            ATTR_CONDITION_CLOUDY,
+        )
+        night = np.select(
+            [
+                (adjusted < thresholds.low)
+                & (humidity > TemperatureThresholds.HUMIDITY_HIGH)
+                & (wind_speed < 3),
+                (adjusted > thresholds.very_high)
+                & (wind_speed < WindThresholds.CALM)
+                & (humidity < TemperatureThresholds.HUMIDITY_MODERATE_HIGH),
+                (adjusted > thresholds.high)
+                & (gust_factor <= WindThresholds.GUST_FACTOR_MODERATE)
+                & (humidity < 80),
+                (adjusted < thresholds.low) & (humidity < 65),
+                normal_pressure
+                & (wind_speed >= WindThresholds.CALM)
+                & (wind_speed < WindThresholds.LIGHT_BREEZE)
+                & (humidity < 85),
+                (adjusted < thresholds.low) & (humidity < 90),
+                humidity > 90,
+            ],
+            [
+                ATTR_CONDITION_CLOUDY,
+                ATTR_CONDITION_CLEAR_NIGHT,
+                ATTR_CONDITION_CLEAR_NIGHT,
+                ATTR_CONDITION_CLEAR_NIGHT,
+                ATTR_CONDITION_PARTLYCLOUDY,
+                ATTR_CONDITION_PARTLYCLOUDY,
+                ATTR_CONDITION_CLOUDY,
+            ],
+            ATTR_CONDITION_PARTLYCLOUDY,
+        )
+
+        conditions = cast(
+            List[str],
+            np.select(
+                [has_precipitation, is_severe, is_gale, is_twilight & ~is_daytime],
+                [
+                    precipitation,
+                    ATTR_CONDITION_LIGHTNING,
+                    ATTR_CONDITION_WINDY,
+                    twilight,
+                ],
+                night,
+            ).tolist(),
+        )
+
+        # Rows that depend on analyzer history are resolved in order
+        needs_history = lightning_nearby | (
+            ~has_precipitation
+            & ((humidity >= 88) | (~is_severe & ~is_gale & is_daytime))
+        )
+        for row in np.flatnonzero(needs_history):
+            sensor_data = {}
+            for key, values in sensor_columns.items():
+                value = values[row]
+                # NaN marks a missing reading, which the scalar path expects as None
+                sensor_data[key] = (
+                    None if isinstance(value, float) and math.isnan(value) else value
+                )
+            conditions[row] = self.determine_condition(sensor_data, altitude)
+
+        return conditions
+
+    def _extract_sensors(self, sensor_data: Dict[str, Any]) -> SensorReadings:
+        """Extract and validate sensor values with defaults.
+
+        Args:
+            sensor_data: Dictionary containing raw sensor readings
+
+        Returns:
+            Normalized sensor readings, reused while the raw readings are
+            unchanged
+        """
+        memo = self._sensors_memo
+        if memo is not None and memo[0] == sensor_data:
+            return memo[1]
+
+        sensors = SensorReadings.from_raw(sensor_data)
+        self._sensors_memo = (dict(sensor_data), sensors)
+        return sensors
 
     def _calculate_parameters(
-        self, sensors: Dict[str, float], altitude: Optional[float]
-    ) -> Dict[str, Any]:
+        self, sensors: SensorReadings, altitude: Optional[float]
+    ) -> DerivedParameters:
         """Calculate derived meteorological parameters.
 
         Computes derived values needed for condition determination including
@@ -187,57 +703,116 @@ class WeatherConditionAnalyzer:
         time-of-day classification, pressure corrections, and gust factors.
 
         Args:
-            sensors: Dictionary of normalized sensor values
+            sensors: Normalized sensor readings
             altitude: Station altitude in meters for pressure correction
 
         Returns:
-            Dictionary of calculated parameters including dewpoint, spreads,
-            boolean flags, and adjusted thresholds
+            Calculated parameters including dewpoint, spreads, boolean flags,
+            and adjusted thresholds
         """
+        altitude = altitude or 0.0
+        memo = self._params_memo
+        if memo is not None and memo[0] is sensors and memo[1] == altitude:
+            return memo[2]
+
+        pressure_factor, thresholds = self._altitude_corrections(altitude)
+        outdoor_temp = sensors.outdoor_temp
+        solar_radiation = sensors.solar_radiation
+        solar_lux = sensors.solar_lux
+        uv_index = sensors.uv_index
+        solar_elevation = sensors.solar_elevation
+
+        adjusted_pressure = sensors.pressure * pressure_factor
+        wind_gust = sensors.wind_gust
+        wind_speed = sensors.wind_speed
+        gust_factor = wind_gust / (1 if wind_speed < 1 else wind_speed)
+        extreme_gusts = wind_gust > WindThresholds.GUST_EXTREME
+
         # Calculate dewpoint (use sensor if available, otherwise calculate)
-        if sensors["dewpoint_raw"] is not None:
-            dewpoint = float(sensors["dewpoint_raw"])
+        if sensors.dewpoint_raw is not None:
+            dewpoint = float(sensors.dewpoint_raw)
         else:
-            dewpoint = self.calculate_dewpoint(
-                sensors["outdoor_temp"], sensors["humidity"]
+            dewpoint = self.calculate_dewpoint(outdoor_temp, sensors.humidity)
+
+        is_daytime = (
+            solar_radiation > 5
+            or solar_lux > 50
+            or uv_index > 0.1
+            or (
+                # Fallback for users without solar/lux/UV sensors:
+                # use solar_elevation (always available via sun.sun) to
+                # determine daytime. Only apply when no solar sensor data
+                # exists, to avoid masking valid low-radiation conditions
+                # (heavy overcast, heavy rain).
+                solar_elevation is not None
+                and solar_elevation > 0
+                and solar_radiation == 0
+                and solar_lux == 0
+                and uv_index == 0
             )
+        )
 
-        return {
-            "dewpoint": dewpoint,
-            "temp_dewpoint_spread": sensors["outdoor_temp"] - dewpoint,
-            "is_freezing": sensors["outdoor_temp"] <= TemperatureThresholds.FREEZING,
-            "is_daytime": (
-                sensors["solar_radiation"] > 5
-                or sensors["solar_lux"] > 50
-                or sensors["uv_index"] > 0.1
-                or (
-                    # Fallback for users without solar/lux/UV sensors:
-                    # use solar_elevation (always available via sun.sun) to
-                    # determine daytime. Only apply when no solar sensor data
-                    # exists, to avoid masking valid low-radiation conditions
-                    # (heavy overcast, heavy rain).
-                    sensors["solar_elevation"] is not None
-                    and sensors["solar_elevation"] > 0
-                    and sensors["solar_radiation"] == 0
-                    and sensors["solar_lux"] == 0
-                    and sensors["uv_index"] == 0
-                )
-            ),
-            "is_twilight": (
-                (sensors["solar_lux"] > 10 and sensors["solar_lux"] < 100)
-                or (sensors["solar_radiation"] > 1 and sensors["solar_radiation"] < 50)
-            ),
-            "adjusted_pressure": self.atmospheric.adjust_pressure_for_altitude(
-                sensors["pressure"], altitude or 0.0, "relative"
+        is_twilight = not is_daytime and (
+            (10 < solar_lux < 100) or (1 < solar_radiation < 50)
+        )
+
+        params = DerivedParameters(
+            dewpoint=dewpoint,
+            temp_dewpoint_spread=outdoor_temp - dewpoint,
+            is_freezing=outdoor_temp <= TemperatureThresholds.FREEZING,
+            is_daytime=is_daytime,
+            # Twilight is only consulted once daytime has been ruled out
+            is_twilight=is_twilight,
+            has_solar_data=solar_radiation > 0 or solar_lux > 0 or uv_index > 0,
+            regime=(
+                _REGIME_DAY
+                if is_daytime
+                else _REGIME_TWILIGHT if is_twilight else _REGIME_NIGHT
             ),
-            "pressure_thresholds": self.atmospheric.get_altitude_adjusted_pressure_thresholds(
-                altitude or 0.0
+            altitude=altitude,
+            adjusted_pressure=adjusted_pressure,
+            pressure_thresholds=thresholds,
+            gust_factor=gust_factor,
+            storm_pressure=adjusted_pressure < thresholds.extremely_low,
+            low_pressure=adjusted_pressure < thresholds.very_low,
+            wind_strong_band=(
+                WindThresholds.FRESH_BREEZE <= wind_speed < WindThresholds.NEAR_GALE
             ),
-            "gust_factor": sensors["wind_gust"] / max(sensors["wind_speed"], 1),
-        }
+            strong_turbulence=gust_factor > WindThresholds.GUST_FACTOR_STRONG,
+            severe_turbulence=(
+                gust_factor > WindThresholds.GUST_FACTOR_SEVERE
+                and wind_gust > WindThresholds.GUST_SEVERE
+            )
+            or extreme_gusts,
+            extreme_gusts=extreme_gusts,
+        )
+        self._params_memo = (sensors, altitude, params)
+        return params
+
+    def _altitude_corrections(self, altitude: float) -> Tuple[float, PressureBands]:
+        """Return the sea-level pressure factor and thresholds for an altitude.
+
+        Args:
+            altitude: Station altitude in meters
+
+        Returns:
+            Tuple of (factor for relative pressure readings, pressure
+            thresholds in inHg)
+        """
+        memo = self._altitude_memo
+        if memo is None or memo[0] != altitude:
+            memo = (
+                altitude,
+                self.atmospheric.sea_level_pressure_factor(altitude),
+                PressureBands.from_thresholds(
+                    self.atmospheric.get_altitude_adjusted_pressure_thresholds(altitude)
+                ),
+            )
+            self._altitude_memo = memo
+        return memo[1], memo[2]
 
     def _check_lightning_sensor(
-        self, sensors: Dict[str, Any], params: Dict[str, Any]
+        self, sensors: SensorReadings, params: DerivedParameters
     ) -> Optional[str]:
         """Check for lightning using a dedicated hardware sensor.
 
@@ -250,16 +825,16 @@ class WeatherConditionAnalyzer:
         a single morning strike would show "lightning" all day.
 
         Args:
-            sensors: Dictionary of sensor values including lightning data
-            params: Dictionary of calculated parameters
+            sensors: Normalized sensor readings including lightning data
+            params: Derived parameters
 
         Returns:
             Weather condition string if lightning detected, None otherwise
             Possible returns: lightning, lightning-rainy
         """
-        lightning_count = sensors.get("lightning_count")
-        lightning_distance = sensors.get("lightning_distance")
-        lightning_time = sensors.get("lightning_time")
+        lightning_count = sensors.lightning_count
+        lightning_distance = sensors.lightning_distance
+        lightning_time = sensors.lightning_time
 
         # No lightning sensor configured (need all three)
         if lightning_count is None or lightning_distance is None:
@@ -327,8 +902,8 @@ class WeatherConditionAnalyzer:
         )
 
         # Check if it's also raining
-        rain_rate = sensors["rain_rate"]
-        rain_state = sensors["rain_state"]
+        rain_rate = sensors.rain_rate
+        rain_state = sensors.rain_state
         has_rain = (
             rain_rate > PrecipitationThresholds.SIGNIFICANT or rain_state == "wet"
         )
@@ -338,7 +913,7 @@ class WeatherConditionAnalyzer:
         return ATTR_CONDITION_LIGHTNING
 
     def _check_precipitation(
-        self, sensors: Dict[str, float], params: Dict[str, Any]
+        self, sensors: SensorReadings, params: DerivedParameters
     ) -> Optional[str]:
         """Check for active precipitation conditions.
 
@@ -353,17 +928,18 @@ class WeatherConditionAnalyzer:
            either a meaningful rain rate OR wet state with supporting conditions
 
         Args:
-            sensors: Dictionary of sensor values
-            params: Dictionary of calculated parameters
+            sensors: Normalized sensor readings
+            params: Derived parameters
 
         Returns:
             Weather condition string if precipitation detected, None otherwise
             Possible returns: rainy, pouring, snowy, lightning-rainy
         """
-        rain_rate = sensors["rain_rate"]
-        rain_state = sensors["rain_state"]
-        humidity = sensors["humidity"]
-        wind_speed = sensors["wind_speed"]
+        rain_rate = sensors.rain_rate
+        rain_state = sensors.rain_state
+        humidity = sensors.humidity
+        wind_speed = sensors.wind_speed
+        spread = params.temp_dewpoint_spread
 
         # Primary check: Significant rain rate (most reliable indicator)
         has_significant_rain_rate = rain_rate > PrecipitationThresholds.SIGNIFICANT
@@ -383,7 +959,7 @@ class WeatherConditionAnalyzer:
             is_likely_dew = (
                 wind_speed < 2.0
                 and humidity >= 95
-                and params["temp_dewpoint_spread"] < 2.0
+                and spread < 2.0
                 and rain_rate < PrecipitationThresholds.SIGNIFICANT
             )
             if is_likely_dew:
@@ -393,7 +969,7 @@ class WeatherConditionAnalyzer:
                     "(wind=%.1f, humidity=%.1f%%, spread=%.1f°F, rate=%.3f)",
                     wind_speed,
                     humidity,
-                    params["temp_dewpoint_spread"],
+                    spread,
                     rain_rate,
                 )
                 return None
@@ -408,26 +984,21 @@ class WeatherConditionAnalyzer:
             return None
 
         # Determine precipitation type based on temperature
-        if params["is_freezing"]:
+        if params.is_freezing:
             return ATTR_CONDITION_SNOWY
 
         # Check for thunderstorm conditions
         if self._is_thunderstorm(sensors, params):
             return ATTR_CONDITION_LIGHTNING_RAINY
 
-        # Classify rain intensity based on rate
-        if rain_rate >= PrecipitationThresholds.HEAVY:
+        # Moderate or heavier rain is pouring; light rain or a wet sensor
+        # with minimal rate is rainy
+        if rain_rate >= PrecipitationThresholds.MODERATE:
             return ATTR_CONDITION_POURING
-        elif rain_rate >= PrecipitationThresholds.MODERATE:
-            return ATTR_CONDITION_POURING
-        elif rain_rate >= PrecipitationThresholds.LIGHT:
-            return ATTR_CONDITION_RAINY
-        else:
-            # Light rain or wet sensor with minimal rate
-            return ATTR_CONDITION_RAINY
+        return ATTR_CONDITION_RAINY
 
     def _is_thunderstorm(
-        self, sensors: Dict[str, float], params: Dict[str, Any]
+        self, sensors: SensorReadings, params: DerivedParameters
     ) -> bool:
         """Determine if conditions indicate thunderstorm activity.
 
@@ -436,52 +1007,39 @@ class WeatherConditionAnalyzer:
         precipitation to detect thunderstorm conditions.
 
         Args:
-            sensors: Dictionary of sensor values
-            params: Dictionary of calculated parameters including pressure thresholds
+            sensors: Normalized sensor readings
+            params: Derived parameters including storm indicators
 
         Returns:
             True if thunderstorm conditions are detected, False otherwise
         """
-        thresholds = params["pressure_thresholds"]
-        pressure = params["adjusted_pressure"]
-        gust_factor = params["gust_factor"]
-
-        # Severe storm pressure
-        if pressure < thresholds["extremely_low"]:
-            return True
-
-        # Storm pressure + strong winds + moderate+ rain
-        if (
-            pressure < thresholds["very_low"]
-            and sensors["wind_speed"] >= WindThresholds.FRESH_BREEZE
-            and sensors["rain_rate"] > PrecipitationThresholds.LIGHT
-        ):
-            return True
-
-        # Storm pressure + very gusty + heavy rain
-        if (
-            pressure < thresholds["very_low"]
-            and gust_factor > WindThresholds.GUST_FACTOR_STRONG
-            and sensors["rain_rate"] > PrecipitationThresholds.MODERATE
-        ):
-            return True
-
-        # Severe turbulence indicator
-        is_severe_turbulence = (
-            gust_factor > WindThresholds.GUST_FACTOR_SEVERE
-            and sensors["wind_gust"] > WindThresholds.GUST_SEVERE
-        ) or sensors["wind_gust"] > WindThresholds.GUST_EXTREME
-
-        if (
-            is_severe_turbulence
-            and sensors["rain_rate"] > PrecipitationThresholds.STORM_MIN_RATE
-        ):
-            return True
-
-        return False
+        rain_rate = sensors.rain_rate
+        low_pressure = params.low_pressure
+
+        return (
+            # Severe storm pressure
+            params.storm_pressure
+            # Storm pressure + strong winds + moderate+ rain
+            or (
+                low_pressure
+                and sensors.wind_speed >= WindThresholds.FRESH_BREEZE
+                and rain_rate > PrecipitationThresholds.LIGHT
+            )
+            # Storm pressure + very gusty + heavy rain
+            or (
+                low_pressure
+                and params.strong_turbulence
+                and rain_rate > PrecipitationThresholds.MODERATE
+            )
+            # Severe turbulence indicator
+            or (
+                params.severe_turbulence
+                and rain_rate > PrecipitationThresholds.STORM_MIN_RATE
+            )
+        )
 
     def _check_fog(
-        self, sensors: Dict[str, float], params: Dict[str, Any]
+        self, sensors: SensorReadings, params: DerivedParameters
     ) -> Optional[str]:
         """Check for fog conditions using atmospheric analyzer.
 
@@ -494,23 +1052,25 @@ class WeatherConditionAnalyzer:
         reduces visibility and solar radiation.
 
         Args:
-            sensors: Dictionary of sensor values
-            params: Dictionary of calculated parameters including dewpoint
+            sensors: Normalized sensor readings
+            params: Derived parameters including dewpoint
 
         Returns:
             ATTR_CONDITION_FOG if fog detected, None otherwise
         """
         # Quick pre-check: fog requires very high humidity
         # Skip fog analysis if humidity is below 88%
-        if sensors["humidity"] < 88:
+        humidity = sensors.humidity
+        if humidity < 88:
             return None
 
         # Additional pre-check: during daytime, fog should significantly
         # reduce solar radiation. If solar radiation is close to clear-sky
         # values for the current solar elevation, it's not fog.
-        if params["is_daytime"]:
-            solar_elevation = sensors.get("solar_elevation", 45.0)
-            solar_rad = sensors.get("solar_radiation", 0)
+        is_daytime = params.is_daytime
+        solar_rad = sensors.solar_radiation
+        if is_daytime:
+            solar_elevation = sensors.solar_elevation
 
             if solar_elevation and solar_elevation > 0:
                 # Calculate expected clear-sky radiation for this elevation
@@ -565,20 +1125,20 @@ class WeatherConditionAnalyzer:
         # If conditions were sunny/clear during the day, be more skeptical of fog
         # in the early evening hours
         was_clear_day = self._was_recent_day_clear()
-        if was_clear_day and not params["is_daytime"]:
+        if was_clear_day and not is_daytime:
             _LOGGER.debug(
                 "Skipping fog check: day was clear, fog unlikely in early evening"
             )
             return None
 
         fog_result = self.atmospheric.analyze_fog_conditions(
-            sensors["outdoor_temp"],
-            sensors["humidity"],
-            params["dewpoint"],
-            params["temp_dewpoint_spread"],
-            sensors["wind_speed"],
-            sensors["solar_radiation"],
-            params["is_daytime"],
+            sensors.outdoor_temp,
+            humidity,
+            params.dewpoint,
+            params.temp_dewpoint_spread,
+            sensors.wind_speed,
+            solar_rad,
+            is_daytime,
         )
 
         # If atmospheric analysis says fog and conditions are favorable, return fog
@@ -652,7 +1212,7 @@ class WeatherConditionAnalyzer:
             return False
 
     def _check_severe_weather(
-        self, sensors: Dict[str, float], params: Dict[str, Any]
+        self, sensors: SensorReadings, params: DerivedParameters
     ) -> Optional[str]:
         """Check for severe weather without precipitation.
 
@@ -661,44 +1221,27 @@ class WeatherConditionAnalyzer:
         wind speed, gusts, and turbulence indicators.
 
         Args:
-            sensors: Dictionary of sensor values
-            params: Dictionary of calculated parameters including pressure thresholds
+            sensors: Normalized sensor readings
+            params: Derived parameters including storm indicators
 
         Returns:
             Weather condition string if severe weather detected, None otherwise
             Possible returns: lightning, windy
         """
-        thresholds = params["pressure_thresholds"]
-        pressure = params["adjusted_pressure"]
-        gust_factor = params["gust_factor"]
-
         # Severe turbulence or very low pressure with strong winds
-        is_severe = (
-            gust_factor > WindThresholds.GUST_FACTOR_SEVERE
-            and sensors["wind_gust"] > WindThresholds.GUST_EXTREME
-        ) or sensors["wind_gust"] > WindThresholds.GUST_EXTREME
-
-        wind_strong = (
-            WindThresholds.FRESH_BREEZE
-            <= sensors["wind_speed"]
-            < WindThresholds.NEAR_GALE
-        )
-
-        if (
-            pressure < thresholds["very_low"]
-            and wind_strong
-            and gust_factor > WindThresholds.GUST_FACTOR_STRONG
-        ) or is_severe:
+        if params.extreme_gusts or (
+            params.low_pressure and params.wind_strong_band and params.strong_turbulence
+        ):
             return ATTR_CONDITION_LIGHTNING
 
         # Gale force winds
-        if sensors["wind_speed"] >= WindThresholds.NEAR_GALE:
+        if sensors.wind_speed >= WindThresholds.NEAR_GALE:
             return ATTR_CONDITION_WINDY
 
         return None
 
     def _determine_daytime_condition(
-        self, sensors: Dict[str, float], params: Dict[str, Any]
+        self, sensors: SensorReadings, params: DerivedParameters
     ) -> str:
         """Determine daytime condition based on cloud cover.
 
@@ -707,29 +1250,27 @@ class WeatherConditionAnalyzer:
         cloudy, windy). Includes hysteresis to prevent rapid oscillation.
 
         Args:
-            sensors: Dictionary of sensor values including solar measurements
-            params: Dictionary of calculated parameters
+            sensors: Normalized sensor readings including solar measurements
+            params: Derived parameters
 
         Returns:
             Daytime weather condition string (sunny, partlycloudy, cloudy, windy)
         """
         # Get solar elevation with fallback
-        solar_elevation = sensors["solar_elevation"]
-        has_solar_data = (
-            sensors["solar_radiation"] > 0
-            or sensors["solar_lux"] > 0
-            or sensors["uv_index"] > 0
-        )
+        solar_elevation = sensors.solar_elevation
+        solar_radiation = sensors.solar_radiation
+        solar_lux = sensors.solar_lux
+        uv_index = sensors.uv_index
 
         if solar_elevation is None:
-            if has_solar_data:
+            if params.has_solar_data:
                 # Estimate solar elevation based on radiation intensity
                 # Higher radiation = higher sun typically
-                if sensors["solar_radiation"] > 600:
+                if solar_radiation > 600:
                     solar_elevation = 60.0  # High sun
-                elif sensors["solar_radiation"] > 300:
+                elif solar_radiation > 300:
                     solar_elevation = 45.0  # Mid-day
-                elif sensors["solar_radiation"] > 100:
+                elif solar_radiation > 100:
                     solar_elevation = 25.0  # Morning/afternoon
                 else:
                     solar_elevation = 15.0  # Early morning/late afternoon
@@ -738,15 +1279,13 @@ class WeatherConditionAnalyzer:
                 return self._atmospheric_fallback_condition(sensors, params)
 
         # Analyze pressure trends for cloud prediction
-        pressure_trends = self.trends.analyze_pressure_trends(
-            params.get("altitude", 0.0)
-        )
+        pressure_trends = self.trends.analyze_pressure_trends(params.altitude)
 
         # Analyze cloud cover
         cloud_cover = self.solar.analyze_cloud_cover(
-            sensors["solar_radiation"],
-            sensors["solar_lux"],
-            sensors["uv_index"],
+            solar_radiation,
+            solar_lux,
+            uv_index,
             solar_elevation,
             pressure_trends,
         )
@@ -756,9 +1295,9 @@ class WeatherConditionAnalyzer:
             "Cloud cover analysis: %.1f%% (radiation=%.1f W/m², lux=%.0f, "
             "uv=%.1f, elevation=%.1f°)",
             cloud_cover,
-            sensors["solar_radiation"],
-            sensors["solar_lux"],
-            sensors["uv_index"],
+            solar_radiation,
+            solar_lux,
+            uv_index,
             solar_elevation,
         )
 
@@ -768,27 +1307,20 @@ class WeatherConditionAnalyzer:
 
         # Override with windy if conditions are right
         # Windy only applies on sunny days - cloudy + wind = cloudy
-        wind_strong = (
-            WindThresholds.FRESH_BREEZE
-            <= sensors["wind_speed"]
-            < WindThresholds.NEAR_GALE
-        )
-        gust_factor = params["gust_factor"]
         is_very_gusty = (
-            gust_factor > WindThresholds.GUST_FACTOR_STRONG
-            and sensors["wind_gust"] > WindThresholds.GUST_STRONG
+            params.strong_turbulence and sensors.wind_gust > WindThresholds.GUST_STRONG
         )
 
         if final == ATTR_CONDITION_SUNNY and (
-            wind_strong
-            or (is_very_gusty and sensors["wind_speed"] >= WindThresholds.LIGHT_BREEZE)
+            params.wind_strong_band
+            or (is_very_gusty and sensors.wind_speed >= WindThresholds.LIGHT_BREEZE)
         ):
             return ATTR_CONDITION_WINDY
 
         return final
 
     def _atmospheric_fallback_condition(
-        self, sensors: Dict[str, float], params: Dict[str, Any]
+        self, sensors: SensorReadings, params: DerivedParameters
     ) -> str:
         """Fallback condition determination using atmospheric data.
 
@@ -797,46 +1329,61 @@ class WeatherConditionAnalyzer:
         atmospheric pressure patterns.
 
         Args:
-            sensors: Dictionary of sensor values
-            params: Dictionary of calculated parameters including pressure
+            sensors: Normalized sensor readings
+            params: Derived parameters including pressure
 
         Returns:
             Weather condition string based on atmospheric indicators
         """
-        humidity = sensors["humidity"]
-        spread = params["temp_dewpoint_spread"]
-        pressure = params["adjusted_pressure"]
-        thresholds = params["pressure_thresholds"]
+        humidity = sensors.humidity
+        spread = params.temp_dewpoint_spread
+        pressure = params.adjusted_pressure
+        thresholds = params.pressure_thresholds
+
+        mask = (
+            (
+                _FB_DRY
+                if humidity < TemperatureThresholds.HUMIDITY_MODERATE
+                and spread > TemperatureThresholds.SPREAD_MODERATE
+                else 0
+            )
+            | (
+                _FB_FAIR
+                if humidity < TemperatureThresholds.HUMIDITY_MODERATE_HIGH
+                and spread > TemperatureThresholds.SPREAD_HUMID
+                else 0
+            )
+            | (
+                _FB_NORMAL_PRESSURE
+                if thresholds.normal_low <= pressure <= thresholds.normal_high
+                else 0
+            )
+            | (_FB_HIGH_PRESSURE if pressure > thresholds.high else 0)
+            | (_FB_LOW_PRESSURE if pressure < thresholds.low else 0)
+            | (
+                _FB_HUMIDITY_LOW
+                if humidity < TemperatureThresholds.HUMIDITY_FALLBACK_LOW
+                else 0
+            )
+            | (
+                _FB_HUMIDITY_MEDIUM
+                if humidity < TemperatureThresholds.HUMIDITY_FALLBACK_MEDIUM
+                else 0
+            )
+            | (
+                _FB_HUMIDITY_HIGH
+                if humidity >= TemperatureThresholds.HUMIDITY_FALLBACK_HIGH
+                else 0
+            )
+        )
 
-        # Clear conditions
-        if (
-            humidity < TemperatureThresholds.HUMIDITY_MODERATE
-            and spread > TemperatureThresholds.SPREAD_MODERATE
-        ):
-            return ATTR_CONDITION_SUNNY
-        elif (
-            humidity < TemperatureThresholds.HUMIDITY_MODERATE_HIGH
-            and spread > TemperatureThresholds.SPREAD_HUMID
-            and thresholds["normal_low"] <= pressure <= thresholds["normal_high"]
-        ):
-            return ATTR_CONDITION_SUNNY
-        elif (
-            pressure > thresholds["high"]
-            and humidity < TemperatureThresholds.HUMIDITY_FALLBACK_LOW
-        ):
-            return ATTR_CONDITION_SUNNY
-        elif (
-            pressure < thresholds["low"]
-            and humidity < TemperatureThresholds.HUMIDITY_FALLBACK_MEDIUM
-        ):
-            return ATTR_CONDITION_PARTLYCLOUDY
-        elif humidity >= TemperatureThresholds.HUMIDITY_FALLBACK_HIGH:
-            return ATTR_CONDITION_CLOUDY
-        else:
-            return ATTR_CONDITION_PARTLYCLOUDY
+        for required, condition in _FALLBACK_RULES:
+            if mask & required == required:
+                return condition
+        return ATTR_CONDITION_PARTLYCLOUDY
 
     def _determine_twilight_condition(
-        self, sensors: Dict[str, float], params: Dict[str, Any]
+        self, sensors: SensorReadings, params: DerivedParameters
     ) -> str:
         """Determine twilight condition.
 
@@ -845,25 +1392,25 @@ class WeatherConditionAnalyzer:
         data combined with pressure to estimate conditions.
 
         Args:
-            sensors: Dictionary of sensor values
-            params: Dictionary of calculated parameters including pressure
+            sensors: Normalized sensor readings
+            params: Derived parameters including pressure
 
         Returns:
             Weather condition string for twilight (partlycloudy or cloudy)
         """
-        thresholds = params["pressure_thresholds"]
-        pressure = params["adjusted_pressure"]
+        thresholds = params.pressure_thresholds
+        pressure = params.adjusted_pressure
 
         if (
-            sensors["solar_lux"] > 50
-            and thresholds["normal_low"] <= pressure <= thresholds["normal_high"]
+            sensors.solar_lux > 50
+            and thresholds.normal_low <= pressure <= thresholds.normal_high
         ):
             return ATTR_CONDITION_PARTLYCLOUDY
         else:
             return ATTR_CONDITION_CLOUDY
 
     def _determine_nighttime_condition(
-        self, sensors: Dict[str, float], params: Dict[str, Any]
+        self, sensors: SensorReadings, params: DerivedParameters
     ) -> str:
         """Determine nighttime condition based on atmospheric data.
 
@@ -873,60 +1420,74 @@ class WeatherConditionAnalyzer:
         and cloudy conditions.
 
         Args:
-            sensors: Dictionary of sensor values
-            params: Dictionary of calculated parameters
+            sensors: Normalized sensor readings
+            params: Derived parameters
 
         Returns:
             Nighttime weather condition string (clear-night, partlycloudy, cloudy)
         """
-        humidity = sensors["humidity"]
-        pressure = params["adjusted_pressure"]
-        thresholds = params["pressure_thresholds"]
-        wind_speed = sensors["wind_speed"]
-        gust_factor = params["gust_factor"]
-
-        # Most specific: Combined conditions
-        if (
-            pressure < thresholds["low"]
-            and humidity > TemperatureThresholds.HUMIDITY_HIGH
-            and wind_speed < 3
-        ):
-            return ATTR_CONDITION_CLOUDY
-
-        # Clear night conditions
-        if (
-            pressure > thresholds["very_high"]
-            and wind_speed < WindThresholds.CALM
-            and humidity < TemperatureThresholds.HUMIDITY_MODERATE_HIGH
-        ):
-            return ATTR_CONDITION_CLEAR_NIGHT
-        elif (
-            pressure > thresholds["high"]
-            and gust_factor <= WindThresholds.GUST_FACTOR_MODERATE
-            and humidity < 80
-        ):
-            return ATTR_CONDITION_CLEAR_NIGHT
-        elif pressure < thresholds["low"] and humidity < 65:
-            return ATTR_CONDITION_CLEAR_NIGHT
+        humidity = sensors.humidity
+        pressure = params.adjusted_pressure
+        thresholds = params.pressure_thresholds
+        wind_speed = sensors.wind_speed
+
+        mask = (
+            (_NIGHT_LOW_PRESSURE if pressure < thresholds.low else 0)
+            | (_NIGHT_HIGH_PRESSURE if pressure > thresholds.high else 0)
+            | (_NIGHT_VERY_HIGH_PRESSURE if pressure > thresholds.very_high else 0)
+            | (
+                _NIGHT_NORMAL_PRESSURE
+                if thresholds.normal_low <= pressure <= thresholds.normal_high
+                else 0
+            )
+            | (_NIGHT_STILL if wind_speed < 3 else 0)
+            | (_NIGHT_CALM if wind_speed < WindThresholds.CALM else 0)
+            | (
+                _NIGHT_LIGHT_WIND
+                if WindThresholds.CALM <= wind_speed < WindThresholds.LIGHT_BREEZE
+                else 0
+            )
+            | (
+                _NIGHT_STEADY_GUSTS
+                if params.gust_factor <= WindThresholds.GUST_FACTOR_MODERATE
+                else 0
+            )
+            | (
+                _NIGHT_SATURATED
+                if humidity > TemperatureThresholds.HUMIDITY_HIGH
+                else 0
+            )
+            | (_NIGHT_HUMIDITY_BELOW_65 if humidity < 65 else 0)
+            | (
+                _NIGHT_HUMIDITY_BELOW_70
+                if humidity < TemperatureThresholds.HUMIDITY_MODERATE_HIGH
+                else 0
+            )
+            | (_NIGHT_HUMIDITY_BELOW_80 if humidity < 80 else 0)
+            | (_NIGHT_HUMIDITY_BELOW_85 if humidity < 85 else 0)
+            | (_NIGHT_HUMIDITY_BELOW_90 if humidity < 90 else 0)
+            | (_NIGHT_HUMIDITY_ABOVE_90 if humidity > 90 else 0)
+        )
 
-        # Partly cloudy night
-        if (
-            thresholds["normal_low"] <= pressure <= thresholds["normal_high"]
-            and WindThresholds.CALM <= wind_speed < WindThresholds.LIGHT_BREEZE
-            and humidity < 85
-        ):
-            return ATTR_CONDITION_PARTLYCLOUDY
-        elif pressure < thresholds["low"] and humidity < 90:
-            return ATTR_CONDITION_PARTLYCLOUDY
-
-        # Cloudy night
-        if humidity > 90:
-            return ATTR_CONDITION_CLOUDY
+        for required, condition in _NIGHT_RULES:
+            if mask & required == required:
+                return condition
 
         # Default night condition
         return ATTR_CONDITION_PARTLYCLOUDY
 
-    def calculate_dewpoint(self, temp_f: float, humidity: Optional[float]) -> float:
+    # Cloud-based condition handler per DerivedParameters.regime
+    _REGIME_CONDITIONS: Tuple[
+        Callable[["WeatherConditionAnalyzer", SensorReadings, DerivedParameters], str],
+        ...,
+    ] = (
+        _determine_daytime_condition,
+        _determine_twilight_condition,
+        _determine_nighttime_condition,
+    )
+
+    @staticmethod
+    def calculate_dewpoint(temp_f: float, humidity: Optional[float]) -> float:
         """Calculate dewpoint using Magnus formula.
 
         Args:
@@ -939,21 +1500,52 @@ class WeatherConditionAnalyzer:
         if humidity is None or humidity <= 0:
             return temp_f - 50  # Approximate for very dry conditions
 
-        # Convert to Celsius
-        temp_c = (temp_f - 32) * 5 / 9
+        return _magnus_dewpoint(temp_f, humidity)
+
+    @staticmethod
+    def calculate_dewpoint_fast(temp_f: float, humidity: Optional[float]) -> float:
+        """Approximate dewpoint without a logarithm for humid air.
+
+        Uses Lawrence's polynomial form for humidity >= 50%, which stays
+        within about 1.1°F of the Magnus result between -4°F and 122°F.
+        Drier air uses the Magnus formula, as the linear low-humidity
+        fits drift by several degrees there.
 
-        # Magnus formula constants
-        a = 17.27
-        b = 237.7
+        Args:
+            temp_f: Temperature in Fahrenheit
+            humidity: Relative humidity as percentage (0-100), or None
 
-        # Calculate dewpoint in Celsius
-        gamma = (a * temp_c) / (b + temp_c) + math.log(humidity / 100.0)
-        dewpoint_c = (b * gamma) / (a - gamma)
+        Returns:
+            Dewpoint temperature in Fahrenheit
+        """
+        if humidity is None or humidity <= 0:
+            return temp_f - 50  # Approximate for very dry conditions
+        if humidity < 50:
+            return _magnus_dewpoint(temp_f, humidity)
 
-        # Convert back to Fahrenheit
+        temp_c = (temp_f - 32) * 5 / 9
+        kelvin_ratio = (temp_c + 273.15) / 300.0
+        dewpoint_c = (
+            temp_c
+            - (100.0 - humidity) / 5.0 * kelvin_ratio * kelvin_ratio
+            - 0.00135 * (humidity - 84.0) ** 2
+            + 0.35
+        )
         return dewpoint_c * 9 / 5 + 32
 
-    def classify_precipitation_intensity(self, rain_rate: float) -> str:
+    def _calculated_dewpoint(self, sensors: SensorReadings) -> float:
+        """Return the Magnus dewpoint for extracted sensors.
+
+        Reuses the dewpoint from the last _calculate_parameters call when it
+        was calculated, rather than reported by a sensor, for these readings.
+        """
+        memo = self._params_memo
+        if memo is not None and memo[0] is sensors and sensors.dewpoint_raw is None:
+            return memo[2].dewpoint
+        return self.calculate_dewpoint(sensors.outdoor_temp, sensors.humidity)
+
+    @staticmethod
+    def classify_precipitation_intensity(rain_rate: float) -> str:
         """Classify precipitation intensity.
 
         Args:
@@ -962,14 +1554,7 @@ class WeatherConditionAnalyzer:
         Returns:
             Intensity classification: "trace", "light", "moderate", or "heavy"
         """
-        if rain_rate >= PrecipitationThresholds.HEAVY:
-            return "heavy"
-        elif rain_rate >= PrecipitationThresholds.LIGHT:
-            return "moderate"
-        elif rain_rate >= PrecipitationThresholds.SIGNIFICANT:
-            return "light"
-        else:
-            return "trace"
+        return _INTENSITY_LABELS[bisect_right(_INTENSITY_THRESHOLDS, rain_rate)]
 
     def estimate_visibility(self, condition: str, sensor_data: Dict[str, Any]) -> float:
         """Estimate visibility based on weather condition.
@@ -981,85 +1566,77 @@ class WeatherConditionAnalyzer:
         Returns:
             Estimated visibility in kilometers
         """
-        sensors = self._extract_sensors(sensor_data)
+        return self._visibility(condition, self._extract_sensors(sensor_data))
 
-        # Fog has most reduced visibility
-        if condition == ATTR_CONDITION_FOG:
-            if (
-                sensors["humidity"] >= 98
-                and (
-                    sensors["outdoor_temp"]
-                    - self.calculate_dewpoint(
-                        sensors["outdoor_temp"], sensors["humidity"]
-                    )
-                )
-                <= 0.5
-            ):
-                return 0.2  # Dense fog
-            elif sensors["humidity"] >= 95:
-                return 0.5  # Thick fog
-            elif sensors["humidity"] >= 92:
-                return 1.0  # Moderate fog
-            else:
-                return 2.0  # Light fog
-
-        # Precipitation reduces visibility
-        if condition in [ATTR_CONDITION_RAINY, ATTR_CONDITION_SNOWY]:
-            base = 15.0 if condition == ATTR_CONDITION_RAINY else 8.0
-            intensity_factor = 0.3 if sensors["rain_rate"] > 0.5 else 0.7
-            wind_factor = max(0.6, 1.0 - (sensors["wind_speed"] / 50))
-            return round(max(0.5, base * intensity_factor * wind_factor), 1)
-
-        # Thunderstorms
-        if condition == ATTR_CONDITION_LIGHTNING_RAINY:
-            if sensors["rain_rate"] > 0.1:
-                return round(max(0.8, 3.0 - (sensors["rain_rate"] * 2)), 1)
-            else:
-                return round(max(0.8, 8.0 - (sensors["wind_gust"] / 10)), 1)
-
-        # Clear conditions
-        if condition == ATTR_CONDITION_CLEAR_NIGHT:
-            if sensors["humidity"] < 50:
-                return 25.0
-            elif sensors["humidity"] < 70:
-                return 20.0
-            else:
-                return 15.0
-
-        # Sunny conditions
-        if condition == ATTR_CONDITION_SUNNY:
-            if sensors["solar_radiation"] > 800:
-                return 30.0
-            elif sensors["solar_radiation"] >= 600:
-                return 25.0
-            elif sensors["solar_radiation"] > 400:
-                return 20.0
-            else:
-                return 15.0
-
-        # Cloudy/partly cloudy
-        if condition in [ATTR_CONDITION_PARTLYCLOUDY, ATTR_CONDITION_CLOUDY]:
-            is_daytime = (
-                sensors["solar_radiation"] > 5
-                or sensors["solar_lux"] > 50
-                or sensors["uv_index"] > 0.1
-            )
-            if is_daytime:
-                if sensors["solar_lux"] > 50000:
-                    return 25.0
-                elif sensors["solar_lux"] > 20000:
-                    return 20.0
-                elif sensors["solar_lux"] > 5000:
-                    return 15.0
-                else:
-                    return 12.0
-            else:
-                if sensors["humidity"] < 75:
-                    return 18.0
-                elif sensors["humidity"] < 85:
-                    return 15.0
-                else:
-                    return 12.0
+    def _visibility(self, condition: str, sensors: SensorReadings) -> float:
+        """Return the visibility in km for a condition and extracted readings."""
+        estimator = self._VISIBILITY_ESTIMATORS.get(condition)
+        if estimator is None:
+            return 15.0  # Default
+        return estimator(self, sensors)
 
-        # Default
-        return 15.0
+    def _fog_visibility(self, sensors: SensorReadings) -> float:
+        """Fog has the most reduced visibility."""
+        if (
+            sensors.humidity >= 98
+            and sensors.outdoor_temp - self._calculated_dewpoint(sensors) <= 0.5
+        ):
+            return 0.2  # Dense fog
+        # Thick (>= 95%), moderate (>= 92%) or light fog
+        return _FOG_VISIBILITY_KM[
+            bisect_right(_FOG_VISIBILITY_HUMIDITY, sensors.humidity)
+        ]
+
+    def _rain_visibility(self, sensors: SensorReadings) -> float:
+        """Rain reduces visibility with intensity and wind-driven spray."""
+        return _precipitation_visibility(15.0, sensors)
+
+    def _snow_visibility(self, sensors: SensorReadings) -> float:
+        """Snow reduces visibility more than rain at the same intensity."""
+        return _precipitation_visibility(8.0, sensors)
+
+    def _thunderstorm_visibility(self, sensors: SensorReadings) -> float:
+        """Thunderstorms are limited by rain, or by gust-driven dust when dry."""
+        if sensors.rain_rate > 0.1:
+            return round(max(0.8, 3.0 - (sensors.rain_rate * 2)), 1)
+        return round(max(0.8, 8.0 - (sensors.wind_gust / 10)), 1)
+
+    def _clear_night_visibility(self, sensors: SensorReadings) -> float:
+        """Clear nights are limited by humidity haze."""
+        return _CLEAR_NIGHT_VISIBILITY_KM[
+            bisect_right(_CLEAR_NIGHT_VISIBILITY_HUMIDITY, sensors.humidity)
+        ]
+
+    def _sunny_visibility(self, sensors: SensorReadings) -> float:
+        """Sunny visibility scales with how clean the solar signal is."""
+        return _SUNNY_VISIBILITY_KM[
+            bisect_left(_SUNNY_VISIBILITY_RADIATION, sensors.solar_radiation)
+        ]
+
+    def _cloudy_visibility(self, sensors: SensorReadings) -> float:
+        """Cloudy visibility follows light levels by day and humidity at night."""
+        is_daytime = (
+            sensors.solar_radiation > 5
+            or sensors.solar_lux > 50
+            or sensors.uv_index > 0.1
+        )
+        if is_daytime:
+            return _CLOUDY_DAY_VISIBILITY_KM[
+                bisect_left(_CLOUDY_DAY_VISIBILITY_LUX, sensors.solar_lux)
+            ]
+        return _CLOUDY_NIGHT_VISIBILITY_KM[
+            bisect_right(_CLOUDY_NIGHT_VISIBILITY_HUMIDITY, sensors.humidity)
+        ]
+
+    _VISIBILITY_ESTIMATORS: Dict[
+        str, Callable[["WeatherConditionAnalyzer", SensorReadings], float]
+    ] = {
+        ATTR_CONDITION_FOG: _fog_visibility,
+        ATTR_CONDITION_RAINY: _rain_visibility,
+        ATTR_CONDITION_SNOWY: _snow_visibility,
+        ATTR_CONDITION_LIGHTNING_RAINY: _thunderstorm_visibility,
+        ATTR_CONDITION_CLEAR_NIGHT: _clear_night_visibility,
+        ATTR_CONDITION_SUNNY: _sunny_visibility,
+        ATTR_CONDITION_PARTLYCLOUDY: _cloudy_visibility,
+        ATTR_CONDITION_CLOUDY: _cloudy_visibility,
+    }
@@ -8,17 +8,22 @@ This module handles:
 - Hysteresis for stable condition reporting
 """
 
+from bisect import bisect_right
 from collections import deque
 from datetime import datetime, timedelta
+from itertools import islice
 import logging
 import math
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from homeassistant.components.weather import (
+    ATTR_CONDITION_CLEAR_NIGHT,
     ATTR_CONDITION_CLOUDY,
     ATTR_CONDITION_PARTLYCLOUDY,
     ATTR_CONDITION_SUNNY,
 )
+import numpy as np
+from numpy.typing import NDArray
 
 from ..const import DEFAULT_ZENITH_MAX_RADIATION
 from ..meteorological_constants import (
@@ -27,27 +32,95 @@ from ..meteorological_constants import (
     SolarAnalysisConstants,
     SolarPhysicsConstants,
 )
+from .trends import TrendsAnalyzer
 
 _LOGGER = logging.getLogger(__name__)
 
+# Beer-Lambert exponents add, so the four extinction factors are one exp
+_EXTINCTION_TOTAL = (
+    SolarPhysicsConstants.EXTINCTION_RAYLEIGH
+    + SolarPhysicsConstants.EXTINCTION_OZONE
+    + SolarPhysicsConstants.EXTINCTION_WATER
+    + SolarPhysicsConstants.EXTINCTION_AEROSOL
+)
+
+# cloud cover <= threshold; bounds are inclusive, hence the float just above
+_CLOUD_COVER_CONDITION_BOUNDS = (
+    math.nextafter(CloudCoverThresholds.THRESHOLD_SUNNY, math.inf),
+    math.nextafter(CloudCoverThresholds.THRESHOLD_PARTLY_CLOUDY, math.inf),
+)
+_CLOUD_COVER_CONDITIONS = (
+    ATTR_CONDITION_SUNNY,
+    ATTR_CONDITION_PARTLYCLOUDY,
+    # Everything above THRESHOLD_PARTLY_CLOUDY (60%) is cloudy
+    # THRESHOLD_CLOUDY (85%) represents "very cloudy/overcast" which
+    # still maps to CLOUDY condition (precipitation would override)
+    ATTR_CONDITION_CLOUDY,
+)
+
+_CLEAR_CONDITIONS = frozenset((ATTR_CONDITION_SUNNY, ATTR_CONDITION_CLEAR_NIGHT))
+
+
+def _clamp_cloud_cover(value: float) -> float:
+    """Clamp a cloud cover percentage to the 0-100 range.
+
+    Equivalent to max(MIN_CLOUD_COVER, min(MAX_CLOUD_COVER, value)) without
+    the two builtin calls; NaN maps to MAX_CLOUD_COVER as it does there.
+    """
+    if value > SolarAnalysisConstants.MIN_CLOUD_COVER:
+        return (
+            value
+            if value < SolarAnalysisConstants.MAX_CLOUD_COVER
+            else SolarAnalysisConstants.MAX_CLOUD_COVER
+        )
+    if value <= SolarAnalysisConstants.MIN_CLOUD_COVER:
+        return SolarAnalysisConstants.MIN_CLOUD_COVER
+    return SolarAnalysisConstants.MAX_CLOUD_COVER
+
 
 class SolarAnalyzer:
     """Analyzes solar radiation for cloud cover assessment."""
 
+    # Cloud cover change required to accept a condition transition - larger
+    # changes are required for stability to prevent oscillation
+    _HYSTERESIS_THRESHOLDS: Dict[Tuple[str, str], float] = {
+        # Transitioning from sunny to other conditions requires more confidence
+        (ATTR_CONDITION_SUNNY, ATTR_CONDITION_PARTLYCLOUDY): 15.0,
+        (ATTR_CONDITION_PARTLYCLOUDY, ATTR_CONDITION_SUNNY): 12.0,
+        # Transitioning between partly cloudy and cloudy
+        (ATTR_CONDITION_PARTLYCLOUDY, ATTR_CONDITION_CLOUDY): 15.0,
+        (ATTR_CONDITION_CLOUDY, ATTR_CONDITION_PARTLYCLOUDY): 12.0,
+        # Direct transitions between sunny and cloudy require significant change
+        (ATTR_CONDITION_SUNNY, ATTR_CONDITION_CLOUDY): 25.0,
+        (ATTR_CONDITION_CLOUDY, ATTR_CONDITION_SUNNY): 20.0,
+    }
+
     def __init__(
         self,
         sensor_history: Optional[Dict[str, deque[Dict[str, Any]]]] = None,
         zenith_max_radiation: float = DEFAULT_ZENITH_MAX_RADIATION,
+        trends_analyzer: Optional[TrendsAnalyzer] = None,
     ):
         """Initialize with sensor history and calibration data.
 
         Args:
             sensor_history: Dictionary of sensor historical data deques
             zenith_max_radiation: Maximum solar radiation at zenith (W/m²)
+            trends_analyzer: TrendsAnalyzer that writes the shared history,
+                used to locate look-back windows by binary search.
         """
         self._sensor_history = sensor_history or {}
+        self._trends_analyzer = trends_analyzer
         self._condition_history: deque[Dict[str, Any]] = deque()
         self.zenith_max_radiation = zenith_max_radiation
+        # Solar geometry is evaluated several times per update for the same
+        # elevation, so the most recent results are memoized:
+        # (elevation, air mass) and
+        # (elevation, day of year, zenith max, clear-sky max)
+        self._air_mass: Optional[Tuple[float, float]] = None
+        self._clear_sky_max: Optional[Tuple[float, int, float, float]] = None
+        # Moving-average weights and their sum per window length
+        self._weights_by_count: Dict[int, Tuple[NDArray[np.float64], float]] = {}
 
     def analyze_cloud_cover(
         self,
@@ -81,11 +154,16 @@ class SolarAnalyzer:
         solar_lux = solar_lux or 0.0
         uv_index = uv_index or 0.0
 
+        # One clock reading for every time-based step of this analysis
+        now = datetime.now()
+
         # Use moving average to filter fluctuations
-        avg_solar_radiation = self._get_solar_radiation_average(solar_radiation)
+        avg_solar_radiation = self._get_solar_radiation_average(solar_radiation, now)
 
         # Calculate theoretical clear-sky maximum
-        max_solar_radiation = self._calculate_clear_sky_max_radiation(solar_elevation)
+        max_solar_radiation = self._calculate_clear_sky_max_radiation(
+            solar_elevation, now
+        )
 
         # Handle very low radiation with historical bias
         relative_threshold = (
@@ -98,7 +176,7 @@ class SolarAnalyzer:
             and solar_elevation < SolarAnalysisConstants.LOW_ELEVATION_THRESHOLD
         ):
             historical_bias = self._get_historical_weather_bias(
-                hours=SolarAnalysisConstants.HISTORICAL_BIAS_HOURS
+                hours=SolarAnalysisConstants.HISTORICAL_BIAS_HOURS, now=now
             )
             bias_adjustment = 0.0
 
@@ -158,13 +236,7 @@ class SolarAnalyzer:
             pressure_adjustment = self._calculate_pressure_trend_cloud_adjustment(
                 pressure_trends
             )
-            cloud_cover = max(
-                SolarAnalysisConstants.MIN_CLOUD_COVER,
-                min(
-                    SolarAnalysisConstants.MAX_CLOUD_COVER,
-                    cloud_cover + pressure_adjustment,
-                ),
-            )
+            cloud_cover = _clamp_cloud_cover(cloud_cover + pressure_adjustment)
 
         # Apply hysteresis to prevent extreme jumps
         cloud_cover = self._apply_cloud_cover_hysteresis(cloud_cover)
@@ -173,7 +245,7 @@ class SolarAnalyzer:
         if "cloud_cover" not in self._sensor_history:
             self._sensor_history["cloud_cover"] = deque(maxlen=50)
         self._sensor_history["cloud_cover"].append(
-            {"timestamp": datetime.now(), "value": cloud_cover}
+            {"timestamp": now, "value": cloud_cover}
         )
 
         return cloud_cover
@@ -220,12 +292,8 @@ class SolarAnalyzer:
             radiation_ratio = 1.0
 
         # Calculate cloud cover from each measurement
-        solar_cloud_cover = max(
-            SolarAnalysisConstants.MIN_CLOUD_COVER,
-            min(
-                SolarAnalysisConstants.MAX_CLOUD_COVER,
-                SolarAnalysisConstants.MAX_CLOUD_COVER - (radiation_ratio * 100),
-            ),
+        solar_cloud_cover = _clamp_cloud_cover(
+            SolarAnalysisConstants.MAX_CLOUD_COVER - (radiation_ratio * 100)
         )
 
         # Calculate lux and UV maximums
@@ -237,21 +305,11 @@ class SolarAnalyzer:
             * math.exp(SolarPhysicsConstants.UV_ATTENUATION * air_mass),
         )
 
-        lux_cloud_cover = max(
-            SolarAnalysisConstants.MIN_CLOUD_COVER,
-            min(
-                SolarAnalysisConstants.MAX_CLOUD_COVER,
-                SolarAnalysisConstants.MAX_CLOUD_COVER
-                - (solar_lux / max_solar_lux * 100),
-            ),
+        lux_cloud_cover = _clamp_cloud_cover(
+            SolarAnalysisConstants.MAX_CLOUD_COVER - (solar_lux / max_solar_lux * 100)
         )
-        uv_cloud_cover = max(
-            SolarAnalysisConstants.MIN_CLOUD_COVER,
-            min(
-                SolarAnalysisConstants.MAX_CLOUD_COVER,
-                SolarAnalysisConstants.MAX_CLOUD_COVER
-                - (uv_index / max_uv_index * 100),
-            ),
+        uv_cloud_cover = _clamp_cloud_cover(
+            SolarAnalysisConstants.MAX_CLOUD_COVER - (uv_index / max_uv_index * 100)
         )
 
         # Weight the measurements
@@ -315,6 +373,15 @@ class SolarAnalyzer:
         now = current_date if current_date is not None else datetime.now()
         day_of_year = now.timetuple().tm_yday
 
+        memo = self._clear_sky_max
+        if (
+            memo is not None
+            and memo[0] == solar_elevation
+            and memo[1] == day_of_year
+            and memo[2] == self.zenith_max_radiation
+        ):
+            return memo[3]
+
         # Solar constant variation (±3.3% due to elliptical orbit)
         solar_constant_variation = (
             1
@@ -322,32 +389,17 @@ class SolarAnalyzer:
             * math.cos(2 * math.pi * (day_of_year - 4) / 365.25)
         )
 
-        # Calculate air mass and atmospheric transmission
-        air_mass = self._calculate_air_mass(solar_elevation)
+        # cos(zenith) == sin(elevation), shared by air mass and scaling
+        sin_elevation = math.sin(math.radians(solar_elevation))
 
-        # Atmospheric extinction components
-        rayleigh_extinction = math.exp(
-            SolarPhysicsConstants.EXTINCTION_RAYLEIGH * air_mass
-        )
-        ozone_extinction = math.exp(SolarPhysicsConstants.EXTINCTION_OZONE * air_mass)
-        water_vapor_extinction = math.exp(
-            SolarPhysicsConstants.EXTINCTION_WATER * air_mass
-        )
-        aerosol_extinction = math.exp(
-            SolarPhysicsConstants.EXTINCTION_AEROSOL * air_mass
-        )
+        # Calculate air mass and atmospheric transmission
+        air_mass = self._calculate_air_mass(solar_elevation, sin_elevation)
 
-        atmospheric_transmission = (
-            rayleigh_extinction
-            * ozone_extinction
-            * water_vapor_extinction
-            * aerosol_extinction
-        )
+        # Rayleigh, ozone, water vapor and aerosol extinction combined
+        atmospheric_transmission = math.exp(_EXTINCTION_TOTAL * air_mass)
 
         # Calculate astronomical scaling
-        astronomical_scaling = atmospheric_transmission * math.sin(
-            math.radians(solar_elevation)
-        )
+        astronomical_scaling = atmospheric_transmission * sin_elevation
 
         # Apply calibration
         calibrated_max_radiation = (
@@ -372,16 +424,34 @@ class SolarAnalyzer:
             astronomical_scaling,
         )
 
+        self._clear_sky_max = (
+            solar_elevation,
+            day_of_year,
+            self.zenith_max_radiation,
+            calibrated_max_radiation,
+        )
         return calibrated_max_radiation
 
-    def _calculate_air_mass(self, solar_elevation: float) -> float:
-        """Calculate air mass using Gueymard 2003 formula."""
+    def _calculate_air_mass(
+        self, solar_elevation: float, sin_elevation: Optional[float] = None
+    ) -> float:
+        """Calculate air mass using Gueymard 2003 formula.
+
+        Args:
+            solar_elevation: Solar elevation angle in degrees
+            sin_elevation: Precomputed sine of the elevation, if available
+        """
         if solar_elevation <= 0:
             return SolarAnalysisConstants.MAX_AIR_MASS
 
-        zenith_angle = 90.0 - solar_elevation
-        zenith_rad = math.radians(zenith_angle)
-        cos_z = math.cos(zenith_rad)
+        memo = self._air_mass
+        if memo is not None and memo[0] == solar_elevation:
+            return memo[1]
+
+        # cos(90° - elevation) == sin(elevation)
+        if sin_elevation is None:
+            sin_elevation = math.sin(math.radians(solar_elevation))
+        cos_z = sin_elevation
 
         # Gueymard 2003 formula
         cos_z_squared = cos_z * cos_z
@@ -392,10 +462,36 @@ class SolarAnalyzer:
             cos_z_cubed + 0.149864 * cos_z_squared + 0.0102963 * cos_z + 0.000303978
         )
 
-        air_mass = numerator / denominator
-        return max(1.0, air_mass)
+        air_mass = max(1.0, numerator / denominator)
+        self._air_mass = (solar_elevation, air_mass)
+        return air_mass
+
+    def _window_entries(
+        self, sensor_key: str, cutoff_time: datetime
+    ) -> Iterable[Dict[str, Any]]:
+        """Return a sensor's history from the look-back window start if known.
+
+        History indexed by the trends analyzer starts at the first entry newer
+        than cutoff_time; any other history is returned whole. Callers still
+        filter entries against the cutoff.
 
-    def _get_solar_radiation_average(self, current_radiation: float) -> float:
+        Args:
+            sensor_key: Key of the history in the shared sensor history
+            cutoff_time: Start of the look-back window (exclusive)
+
+        Returns:
+            Iterable of historical entries
+        """
+        history = self._sensor_history[sensor_key]
+        if self._trends_analyzer is not None:
+            start = self._trends_analyzer.window_start(sensor_key, history, cutoff_time)
+            if start is not None:
+                return islice(history, start, None)
+        return history
+
+    def _get_solar_radiation_average(
+        self, current_radiation: float, now: Optional[datetime] = None
+    ) -> float:
         """Calculate moving average of solar radiation.
 
         Applies a weighted moving average over recent readings to smooth
@@ -404,6 +500,7 @@ class SolarAnalyzer:
 
         Args:
             current_radiation: Most recent radiation reading in W/m²
+            now: Reference time for the averaging window (defaults to now)
 
         Returns:
             Weighted average radiation in W/m², or current value if
@@ -415,12 +512,14 @@ class SolarAnalyzer:
         if "solar_radiation" not in self._sensor_history:
             return current_radiation
 
-        cutoff_time = datetime.now() - timedelta(
+        if now is None:
+            now = datetime.now()
+        cutoff_time = now - timedelta(
             minutes=SolarAnalysisConstants.AVERAGING_WINDOW_MINUTES
         )
         recent_readings = [
             entry["value"]
-            for entry in self._sensor_history["solar_radiation"]
+            for entry in self._window_entries("solar_radiation", cutoff_time)
             if entry["timestamp"] > cutoff_time and entry["value"] > 0
         ]
 
@@ -428,25 +527,40 @@ class SolarAnalyzer:
             return current_radiation
 
         # Weighted average favoring recent readings
-        weights = []
-        for i in range(len(recent_readings)):
-            weight = SolarAnalysisConstants.RECENT_READING_WEIGHT_MIN + (
-                SolarAnalysisConstants.RECENT_READING_WEIGHT_MAX
-                * i
-                / (len(recent_readings) - 1)
-            )
-            weights.append(weight)
-
-        weighted_sum = sum(
-            value * weight for value, weight in zip(recent_readings, weights)
-        )
-        total_weight = sum(weights)
+        count = len(recent_readings)
+        weights, total_weight = self._average_weights(count)
 
         if total_weight > 0:
-            return weighted_sum / total_weight
+            values = np.fromiter(recent_readings, dtype=np.float64, count=count)
+            return float(np.dot(values, weights)) / total_weight
 
         return current_radiation
 
+    def _average_weights(self, count: int) -> Tuple[NDArray[np.float64], float]:
+        """Return the moving-average weights and their sum for a window size.
+
+        Weights rise linearly from RECENT_READING_WEIGHT_MIN for the oldest
+        reading by RECENT_READING_WEIGHT_MAX to the newest one.
+
+        Args:
+            count: Number of readings in the window (at least 2)
+
+        Returns:
+            Tuple of (weights oldest first, total weight)
+        """
+        cached = self._weights_by_count.get(count)
+        if cached is None:
+            weights: NDArray[np.float64] = np.linspace(
+                SolarAnalysisConstants.RECENT_READING_WEIGHT_MIN,
+                SolarAnalysisConstants.RECENT_READING_WEIGHT_MIN
+                + SolarAnalysisConstants.RECENT_READING_WEIGHT_MAX,
+                count,
+                dtype=np.float64,
+            )
+            cached = (weights, float(weights.sum()))
+            self._weights_by_count[count] = cached
+        return cached
+
     def _calculate_pressure_trend_cloud_adjustment(
         self, pressure_trends: Dict[str, Any]
     ) -> float:
@@ -538,7 +652,7 @@ class SolarAnalyzer:
 
         if len(recent_readings) > 0:
             last_reading = None
-            for entry in reversed(list(recent_readings)[-10:]):
+            for entry in islice(reversed(recent_readings), 10):
                 if entry["value"] is not None:
                     last_reading = entry["value"]
                     break
@@ -563,7 +677,9 @@ class SolarAnalyzer:
 
         return cloud_cover
 
-    def _get_historical_weather_bias(self, hours: int = 6) -> Dict[str, Any]:
+    def _get_historical_weather_bias(
+        self, hours: int = 6, now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """Calculate historical weather bias for low-elevation adjustments.
 
         Analyzes recent weather condition history to apply bias when solar
@@ -572,6 +688,7 @@ class SolarAnalyzer:
 
         Args:
             hours: Number of hours of history to analyze
+            now: Reference time for the look-back window (defaults to now)
 
         Returns:
             Dictionary containing:
@@ -589,13 +706,14 @@ class SolarAnalyzer:
                 "is_morning": False,
             }
 
-        current_hour = datetime.now().hour
-        is_morning = current_hour < 12
+        if now is None:
+            now = datetime.now()
+        is_morning = now.hour < 12
 
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff_time = now - timedelta(hours=hours)
         recent_conditions = [
             entry["value"]
-            for entry in self._sensor_history["weather_condition"]
+            for entry in self._window_entries("weather_condition", cutoff_time)
             if entry["timestamp"] > cutoff_time
         ]
 
@@ -609,14 +727,8 @@ class SolarAnalyzer:
             }
 
         # Count clear conditions
-        from homeassistant.components.weather import (
-            ATTR_CONDITION_CLEAR_NIGHT,
-            ATTR_CONDITION_SUNNY,
-        )
-
-        clear_conditions = [ATTR_CONDITION_SUNNY, ATTR_CONDITION_CLEAR_NIGHT]
         clear_count = sum(
-            1 for condition in recent_conditions if condition in clear_conditions
+            condition in _CLEAR_CONDITIONS for condition in recent_conditions
         )
         total_count = len(recent_conditions)
         clear_percentage = (clear_count / total_count) * 100 if total_count > 0 else 0.0
@@ -648,15 +760,9 @@ class SolarAnalyzer:
         of "cloudy" before it becomes "overcast". For the sunny->partly cloudy
         and partly cloudy->cloudy transitions, we use the thresholds directly.
         """
-        if cloud_cover <= CloudCoverThresholds.THRESHOLD_SUNNY:
-            return ATTR_CONDITION_SUNNY
-        elif cloud_cover <= CloudCoverThresholds.THRESHOLD_PARTLY_CLOUDY:
-            return ATTR_CONDITION_PARTLYCLOUDY
-        else:
-            # Everything above THRESHOLD_PARTLY_CLOUDY (60%) is cloudy
-            # THRESHOLD_CLOUDY (85%) represents "very cloudy/overcast" which
-            # still maps to CLOUDY condition (precipitation would override)
-            return ATTR_CONDITION_CLOUDY
+        return _CLOUD_COVER_CONDITIONS[
+            bisect_right(_CLOUD_COVER_CONDITION_BOUNDS, cloud_cover)
+        ]
 
     def apply_condition_hysteresis(
         self, proposed_condition: str, current_cloud_cover: float
@@ -667,35 +773,41 @@ class SolarAnalyzer:
         a change. It requires a meaningful change in cloud cover before
         allowing a condition transition.
         """
-        # Clean up old entries (keep last 24 hours)
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        self._condition_history = deque(
-            [
-                entry
-                for entry in self._condition_history
-                if entry["timestamp"] > cutoff_time
-            ]
+        # Clean up old entries (keep last 24 hours). Entries are appended in
+        # time order, so expired ones are always at the left end.
+        now = datetime.now()
+        cutoff_time = now - timedelta(hours=24)
+        history = self._condition_history
+        if not isinstance(history, deque):
+            history = self._condition_history = deque(history)
+        while history and history[0]["timestamp"] <= cutoff_time:
+            history.popleft()
+
+        # Get the newest entries from the last hour, most recent first; only
+        # the last entry and the five newest are consulted
+        hysteresis_cutoff = now - timedelta(hours=1)
+        recent_history = list(
+            islice(
+                (
+                    entry
+                    for entry in reversed(history)
+                    if entry["timestamp"] > hysteresis_cutoff
+                ),
+                5,
+            )
         )
 
-        # Get recent history (last 1 hour)
-        hysteresis_cutoff = datetime.now() - timedelta(hours=1)
-        recent_history = [
-            entry
-            for entry in self._condition_history
-            if entry["timestamp"] > hysteresis_cutoff
-        ]
-
         if not recent_history:
             self._condition_history.append(
                 {
                     "condition": proposed_condition,
                     "cloud_cover": current_cloud_cover,
-                    "timestamp": datetime.now(),
+                    "timestamp": now,
                 }
             )
             return proposed_condition
 
-        last_entry = recent_history[-1]
+        last_entry = recent_history[0]
         last_condition = last_entry["condition"]
         last_cloud_cover = last_entry["cloud_cover"]
 
@@ -704,7 +816,7 @@ class SolarAnalyzer:
                 {
                     "condition": proposed_condition,
                     "cloud_cover": current_cloud_cover,
-                    "timestamp": datetime.now(),
+                    "timestamp": now,
                 }
             )
             return proposed_condition
@@ -712,29 +824,13 @@ class SolarAnalyzer:
         # Calculate cloud cover difference
         cloud_cover_change = abs(current_cloud_cover - last_cloud_cover)
 
-        # Define hysteresis thresholds - require larger changes for stability
-        # These thresholds prevent oscillation between conditions
-        hysteresis_thresholds = {
-            # Transitioning from sunny to other conditions requires more confidence
-            (ATTR_CONDITION_SUNNY, ATTR_CONDITION_PARTLYCLOUDY): 15.0,
-            (ATTR_CONDITION_PARTLYCLOUDY, ATTR_CONDITION_SUNNY): 12.0,
-            # Transitioning between partly cloudy and cloudy
-            (ATTR_CONDITION_PARTLYCLOUDY, ATTR_CONDITION_CLOUDY): 15.0,
-            (ATTR_CONDITION_CLOUDY, ATTR_CONDITION_PARTLYCLOUDY): 12.0,
-            # Direct transitions between sunny and cloudy require significant change
-            (ATTR_CONDITION_SUNNY, ATTR_CONDITION_CLOUDY): 25.0,
-            (ATTR_CONDITION_CLOUDY, ATTR_CONDITION_SUNNY): 20.0,
-        }
-
         transition_key = (last_condition, proposed_condition)
-        hysteresis_threshold = hysteresis_thresholds.get(transition_key, 10.0)
+        hysteresis_threshold = self._HYSTERESIS_THRESHOLDS.get(transition_key, 10.0)
 
         # Also check trend - if multiple recent readings support the change, allow it
         # Count how many recent readings match the proposed condition
         recent_matches = sum(
-            1
-            for entry in recent_history[-5:]
-            if entry["condition"] == proposed_condition
+            1 for entry in recent_history if entry["condition"] == proposed_condition
         )
         if recent_matches >= 2:
             # The trend supports this change, use lower threshold
@@ -754,7 +850,7 @@ class SolarAnalyzer:
                 {
                     "condition": proposed_condition,
                     "cloud_cover": current_cloud_cover,
-                    "timestamp": datetime.now(),
+                    "timestamp": now,
                 }
             )
             return proposed_condition
@@ -772,7 +868,7 @@ class SolarAnalyzer:
                 {
                     "condition": last_condition,
                     "cloud_cover": current_cloud_cover,
-                    "timestamp": datetime.now(),
+                    "timestamp": now,
                 }
             )
             return last_condition
@@ -7,11 +7,17 @@ This module handles:
 - Seasonal factors
 """
 
+from bisect import bisect_right
 from collections import deque
 from datetime import datetime, timedelta
+from itertools import chain, islice
 import logging
-import statistics
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..meteorological_constants import PressureTrendConstants, TrendConstants
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +34,31 @@ class TrendsAnalyzer:
             sensor_history: Dictionary of sensor historical data deques
         """
         self._sensor_history = sensor_history or {}
+        # Ascending timestamps of the entries written by
+        # store_historical_data(), per sensor, for bisecting history windows
+        self._history_timestamps: Dict[str, List[datetime]] = {}
+        self._now: Optional[datetime] = None
+        # (batch time, altitude, history length, newest entry, analysis)
+        self._pressure_trends_memo: Optional[
+            Tuple[datetime, float, int, Optional[Dict[str, Any]], Dict[str, Any]]
+        ] = None
+
+    def begin_batch(self) -> None:
+        """Freeze the reference time used by trend queries for one update.
+
+        All history windows evaluated until end_batch() share a single
+        ``datetime.now()`` reading instead of querying the clock per sensor.
+        """
+        self._now = datetime.now()
+
+    def end_batch(self) -> None:
+        """Release the reference time frozen by begin_batch()."""
+        self._now = None
+        self._pressure_trends_memo = None
+
+    def current_time(self) -> datetime:
+        """Return the batch reference time, or the wall clock outside a batch."""
+        return self._now or datetime.now()
 
     def store_historical_data(
         self, sensor_data: Dict[str, Any], weather_condition: Optional[str] = None
@@ -42,17 +73,139 @@ class TrendsAnalyzer:
 
         for sensor_key, value in sensor_data.items():
             if sensor_key in self._sensor_history and value is not None:
-                self._sensor_history[sensor_key].append(
-                    {"timestamp": timestamp, "value": value}
-                )
+                self._append_history(sensor_key, timestamp, value)
 
         # Store weather condition if provided
         if weather_condition:
             if "weather_condition" not in self._sensor_history:
                 self._sensor_history["weather_condition"] = deque(maxlen=50)
-            self._sensor_history["weather_condition"].append(
-                {"timestamp": timestamp, "value": weather_condition}
+            self._append_history("weather_condition", timestamp, weather_condition)
+
+    def _append_history(self, sensor_key: str, timestamp: datetime, value: Any) -> None:
+        """Append a history entry and keep the sensor's timestamp index in step.
+
+        The index restarts whenever the buffer was written to elsewhere or the
+        clock went backwards, so it only ever holds ascending timestamps. It
+        describes the whole buffer again once older entries have rolled out.
+        """
+        history = self._sensor_history[sensor_key]
+        timestamps = self._history_timestamps.get(sensor_key)
+        if not (
+            timestamps
+            and history
+            and history[-1]["timestamp"] is timestamps[-1]
+            and timestamps[-1] <= timestamp
+        ):
+            timestamps = self._history_timestamps[sensor_key] = []
+
+        history.append({"timestamp": timestamp, "value": value})
+        timestamps.append(timestamp)
+        if len(timestamps) > len(history):
+            del timestamps[0]
+
+    def window_start(
+        self, sensor_key: str, entries: Sequence[Dict[str, Any]], cutoff_time: datetime
+    ) -> Optional[int]:
+        """Return the index of the first entry newer than cutoff_time.
+
+        Only histories whose every entry was written by store_historical_data()
+        are indexed; for anything else (hand-built, reversed or mixed
+        histories) None is returned and callers filter linearly.
+
+        Args:
+            sensor_key: Key the entries are stored under
+            entries: The sensor's historical entries
+            cutoff_time: Start of the look-back window (exclusive)
+
+        Returns:
+            Index of the window start, or None if the history is not indexed
+        """
+        timestamps = self._history_timestamps.get(sensor_key)
+        if (
+            not timestamps
+            or len(timestamps) != len(entries)
+            or entries[0]["timestamp"] is not timestamps[0]
+            or entries[-1]["timestamp"] is not timestamps[-1]
+        ):
+            return None
+        return bisect_right(timestamps, cutoff_time)
+
+    def select_recent_entries(
+        self,
+        entries: Sequence[Dict[str, Any]],
+        hours: float,
+        sensor_key: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Select history entries inside the look-back window.
+
+        When sensor_key names a history indexed by store_historical_data(),
+        the window start is located by binary search (see window_start()).
+        Otherwise entries are classified and window-filtered in a single
+        linear pass. Numeric timestamps are only used when no datetime entries
+        exist, and are not window-filtered.
+
+        Args:
+            entries: Historical entries with "timestamp" and "value" keys
+            hours: Number of hours to look back
+            sensor_key: Key the entries are stored under, if any
+
+        Returns:
+            Tuple of (selected entries, whether timestamps are numeric)
+        """
+        cutoff_time = self.current_time() - timedelta(hours=hours)
+
+        if sensor_key is not None:
+            start = self.window_start(sensor_key, entries, cutoff_time)
+            if start is not None:
+                return list(islice(entries, start, None)), False
+
+        recent_data: List[Dict[str, Any]] = []
+        numeric_data: List[Dict[str, Any]] = []
+        has_datetime = False
+
+        for entry in entries:
+            timestamp = entry["timestamp"]
+            if isinstance(timestamp, datetime):
+                has_datetime = True
+                if timestamp > cutoff_time:
+                    recent_data.append(entry)
+            elif isinstance(timestamp, (int, float)):
+                numeric_data.append(entry)
+
+        # Prefer datetime data whenever any exists
+        if has_datetime:
+            return recent_data, False
+        return numeric_data, bool(numeric_data)
+
+    def history_arrays(
+        self, entries: Sequence[Dict[str, Any]], is_numeric_timestamp: bool
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Unpack history entries into time offsets and values in one pass.
+
+        Args:
+            entries: Non-empty historical entries with "timestamp" and "value"
+            is_numeric_timestamp: Whether timestamps are numeric hours (tests)
+                rather than datetimes
+
+        Returns:
+            Tuple of (hours since the first entry, values) arrays
+        """
+        start = entries[0]["timestamp"]
+        if is_numeric_timestamp:
+            pairs = ((entry["timestamp"] - start, entry["value"]) for entry in entries)
+        else:
+            pairs = (
+                ((entry["timestamp"] - start).total_seconds(), entry["value"])
+                for entry in entries
             )
+        table = np.fromiter(
+            chain.from_iterable(pairs), dtype=np.float64, count=2 * len(entries)
+        ).reshape(-1, 2)
+
+        offsets = table[:, 0]
+        if not is_numeric_timestamp:
+            offsets = offsets / 3600
+        return offsets, table[:, 1]
 
     def get_historical_trends(self, sensor_key: str, hours: int = 24) -> Dict[str, Any]:
         """Calculate historical trends for a sensor.
@@ -69,81 +222,34 @@ class TrendsAnalyzer:
             - min/max: Min/max values
             - volatility: Standard deviation
         """
-        if sensor_key not in self._sensor_history:
-            return {}
-
-        # Get data from the last N hours
-        if sensor_key not in self._sensor_history:
-            return {}
-
-        if not self._sensor_history[sensor_key]:
-            return {}
-
-        # Separate numeric and datetime timestamps to handle mixed data
-        # (some tests inject numeric timestamps)
-        numeric_data = []
-        datetime_data = []
-
-        for entry in self._sensor_history[sensor_key]:
-            timestamp = entry["timestamp"]
-            if isinstance(timestamp, (int, float)):
-                numeric_data.append(entry)
-            elif isinstance(timestamp, datetime):
-                datetime_data.append(entry)
-
-        # Prefer datetime data if we have enough, otherwise use numeric
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        if datetime_data:
-            recent_data = [
-                entry for entry in datetime_data if entry["timestamp"] > cutoff_time
-            ]
-            is_numeric_timestamp = False
-        elif numeric_data:
-            recent_data = numeric_data
-            is_numeric_timestamp = True
-        else:
+        history = self._sensor_history.get(sensor_key)
+        if not history:
             return {}
 
+        recent_data, is_numeric_timestamp = self.select_recent_entries(
+            history, hours, sensor_key
+        )
         if len(recent_data) < 2:
             return {}
 
-        values = [entry["value"] for entry in recent_data]
-        timestamps = [entry["timestamp"] for entry in recent_data]
+        sample_count = len(recent_data)
+        time_diffs, values = self.history_arrays(recent_data, is_numeric_timestamp)
 
-        # Calculate time differences in hours
-        if is_numeric_timestamp:
-            # For numeric timestamps (testing), use values directly as hours
-            time_diffs = [float(t - timestamps[0]) for t in timestamps]
-        else:
-            # For datetime timestamps, calculate time differences
-            time_diffs = [
-                (t - timestamps[0]).total_seconds() / 3600 for t in timestamps
-            ]
-
-        try:
-            # Basic statistics
-            current = values[-1]
-            average = statistics.mean(values)
-            minimum = min(values)
-            maximum = max(values)
-            volatility = statistics.stdev(values) if len(values) > 1 else 0
-
-            # Trend calculation (linear regression slope)
-            trend = self.calculate_trend(time_diffs, values)
-
-            return {
-                "current": current,
-                "average": average,
-                "trend": trend,  # Change per hour
-                "min": minimum,
-                "max": maximum,
-                "volatility": volatility,
-                "sample_count": len(values),
-            }
-        except statistics.StatisticsError:
-            return {}
+        return {
+            "current": recent_data[-1]["value"],
+            "average": float(values.mean()),
+            "trend": self.calculate_trend(time_diffs, values),  # Change per hour
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "volatility": float(values.std(ddof=1)),
+            "sample_count": sample_count,
+        }
 
-    def calculate_trend(self, x_values: List[float], y_values: List[float]) -> float:
+    def calculate_trend(
+        self,
+        x_values: Sequence[float] | NDArray[np.float64],
+        y_values: Sequence[float] | NDArray[np.float64],
+    ) -> float:
         """Calculate linear trend (slope) using simple linear regression.
 
         Args:
@@ -156,18 +262,20 @@ class TrendsAnalyzer:
         if len(x_values) != len(y_values) or len(x_values) < 2:
             return 0.0
 
-        n = len(x_values)
-        sum_x = sum(x_values)
-        sum_y = sum(y_values)
-        sum_xy = sum(x * y for x, y in zip(x_values, y_values))
-        sum_x2 = sum(x * x for x in x_values)
+        x = np.asarray(x_values, dtype=np.float64)
+        y = np.asarray(y_values, dtype=np.float64)
 
-        denominator = n * sum_x2 - sum_x * sum_x
+        # All samples at the same instant: the slope is undefined
+        if x.max() == x.min():
+            return 0.0
+
+        # Closed-form OLS on mean-centred data (numerically stable)
+        x_centered = x - x.mean()
+        denominator = np.dot(x_centered, x_centered)
         if denominator == 0:
             return 0.0
 
-        slope = (n * sum_xy - sum_x * sum_y) / denominator
-        return slope
+        return float(np.dot(x_centered, y - y.mean()) / denominator)
 
     def analyze_historical_patterns(self) -> Dict[str, Any]:
         """Analyze historical weather patterns for pattern recognition.
@@ -342,6 +450,29 @@ class TrendsAnalyzer:
             Dictionary with the raw trend statistics plus the classification
             keys, or an empty dict when there is insufficient history.
         """
+        now = self._now
+        if now is None:
+            return self._compute_pressure_trends()
+
+        # Within a batch the result only changes when pressure is stored
+        history = self._sensor_history.get("pressure")
+        length = len(history) if history else 0
+        newest = history[-1] if history else None
+        memo = self._pressure_trends_memo
+        if (
+            memo is None
+            or memo[0] != now
+            or memo[1] != altitude
+            or memo[2] != length
+            or memo[3] is not newest
+        ):
+            memo = (now, altitude, length, newest, self._compute_pressure_trends())
+            self._pressure_trends_memo = memo
+        # Callers may fill in missing keys, so hand out a copy
+        return dict(memo[4])
+
+    def _compute_pressure_trends(self) -> Dict[str, Any]:
+        """Compute the pressure trend analysis for analyze_pressure_trends."""
         from ..weather_utils import convert_to_hpa
 
         long_trend = self.get_historical_trends("pressure", hours=24)
@@ -398,29 +529,53 @@ class TrendsAnalyzer:
             float: Acceleration in inHg/3h² (negative = fall speeding up,
                    positive = fall slowing, ~0.0 = steady or insufficient data)
         """
-        if "pressure" not in self._sensor_history:
+        history = self._sensor_history.get("pressure")
+        if not history or len(history) < 4:
             return 0.0
 
-        entries = list(self._sensor_history["pressure"])
-        if len(entries) < 4:
-            return 0.0
+        time_offsets, values = self.history_arrays(
+            history, isinstance(history[0]["timestamp"], (int, float))
+        )
 
-        midpoint = len(entries) // 2
-        first_half = entries[:midpoint]
-        second_half = entries[midpoint:]
+        # Slopes are invariant to the time origin, so both halves can share
+        # offsets measured from the first reading
+        midpoint = len(history) // 2
+        return self.calculate_trend(
+            time_offsets[midpoint:], values[midpoint:]
+        ) - self.calculate_trend(time_offsets[:midpoint], values[:midpoint])
 
-        def _slope(half: list[dict[str, Any]]) -> float:
-            timestamps = [e["timestamp"] for e in half]
-            values = [e["value"] for e in half]
-            if isinstance(timestamps[0], (int, float)):
-                time_diffs = [float(t - timestamps[0]) for t in timestamps]
-            else:
-                time_diffs = [
-                    (t - timestamps[0]).total_seconds() / 3600 for t in timestamps
-                ]
-            return self.calculate_trend(time_diffs, values)
+    def is_weather_quiescent(self, hours: int = 3) -> bool:
+        """Check whether recent history shows calm, settled weather.
 
-        return _slope(second_half) - _slope(first_half)
+        Weather is quiescent when the short-term pressure change is within
+        the stable band, no rain was recorded and wind speed has been steady
+        over the window. Missing pressure history is treated as not quiescent
+        so new installations keep the configured refresh rate.
+
+        Args:
+            hours: Look-back window in hours
+
+        Returns:
+            True if conditions have been quiescent over the window
+        """
+        pressure_trends = self.analyze_pressure_trends()
+        if not pressure_trends:
+            return False
+        if (
+            abs(pressure_trends["current_trend"])
+            >= PressureTrendConstants.STABLE_THRESHOLD
+        ):
+            return False
+
+        rain_trends = self.get_historical_trends("rain_rate", hours=hours)
+        if rain_trends and rain_trends["max"] > 0:
+            return False
+
+        wind_trends = self.get_historical_trends("wind_speed", hours=hours)
+        return (
+            not wind_trends
+            or wind_trends["volatility"] < TrendConstants.VOLATILITY_ACTIVE
+        )
 
     def calculate_circular_mean(self, directions: List[float]) -> float:
         """Calculate the circular mean of wind directions.
@@ -434,18 +589,8 @@ class TrendsAnalyzer:
         if not directions:
             return 0.0
 
-        import math
-
-        # Convert to radians
-        radians = [math.radians(d) for d in directions]
-
-        # Calculate circular mean
-        sin_sum = sum(math.sin(r) for r in radians)
-        cos_sum = sum(math.cos(r) for r in radians)
-
-        mean_radians = math.atan2(sin_sum, cos_sum)
+        radians = np.radians(np.asarray(directions, dtype=np.float64))
+        mean_radians = np.arctan2(np.sin(radians).sum(), np.cos(radians).sum())
 
         # Convert back to degrees (0-360)
-        mean_degrees = math.degrees(mean_radians) % 360
-
-        return mean_degrees
+        return float(np.degrees(mean_radians) % 360)
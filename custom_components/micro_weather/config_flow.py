@@ -21,6 +21,7 @@ from .const import (
     CONF_PRESSURE_SENSOR,
     CONF_RAIN_RATE_SENSOR,
     CONF_RAIN_STATE_SENSOR,
+    CONF_REFRESH_ON_STARTUP,
     CONF_SOLAR_LUX_SENSOR,
     CONF_SOLAR_RADIATION_SENSOR,
     CONF_SUN_SENSOR,
@@ -30,6 +31,7 @@ from .const import (
     CONF_WIND_GUST_SENSOR,
     CONF_WIND_SPEED_SENSOR,
     CONF_ZENITH_MAX_RADIATION,
+    DEFAULT_REFRESH_ON_STARTUP,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_ZENITH_MAX_RADIATION,
     DOMAIN,
@@ -37,6 +39,221 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Selectors are immutable descriptors, so they are built once and shared by the
+# config and options flows instead of being recreated on every form render.
+_TEMPERATURE_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor", device_class="temperature")
+)
+_HUMIDITY_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor", device_class="humidity")
+)
+_PRESSURE_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(
+        domain="sensor",
+        device_class=["pressure", "atmospheric_pressure"],
+    )
+)
+_WIND_SPEED_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor", device_class="wind_speed")
+)
+_SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor")
+)
+_RAIN_RATE_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(
+        domain="sensor", device_class="precipitation_intensity"
+    )
+)
+_RAIN_STATE_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="binary_sensor")
+)
+_SOLAR_RADIATION_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor", device_class="irradiance")
+)
+_SOLAR_LUX_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor", device_class="illuminance")
+)
+_SUN_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain="sun"))
+_LIGHTNING_DISTANCE_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain="sensor", device_class="distance")
+)
+_ANY_ENTITY_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig())
+_UPDATE_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=60, step=1, unit_of_measurement="min")
+)
+_ZENITH_MAX_RADIATION_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=400,
+        max=1800,
+        step=10,
+        unit_of_measurement="W/m²",
+    )
+)
+
+# Shared by every menu render, so immutable
+_OPTIONS_MENU = (
+    "atmospheric",
+    "wind",
+    "rain",
+    "solar",
+    "lightning",
+    "device_config",
+)
+
+
+# Options written back from the accumulated options flow data
+_STEP_FIELDS = frozenset(
+    (
+        CONF_OUTDOOR_TEMP_SENSOR,
+        CONF_DEWPOINT_SENSOR,
+        CONF_HUMIDITY_SENSOR,
+        CONF_PRESSURE_SENSOR,
+        CONF_ALTITUDE,
+        CONF_WIND_SPEED_SENSOR,
+        CONF_WIND_DIRECTION_SENSOR,
+        CONF_WIND_GUST_SENSOR,
+        CONF_RAIN_RATE_SENSOR,
+        CONF_RAIN_STATE_SENSOR,
+        CONF_SOLAR_RADIATION_SENSOR,
+        CONF_SOLAR_LUX_SENSOR,
+        CONF_UV_INDEX_SENSOR,
+        CONF_SUN_SENSOR,
+        CONF_ZENITH_MAX_RADIATION,
+        CONF_LIGHTNING_COUNT_SENSOR,
+        CONF_LIGHTNING_DISTANCE_SENSOR,
+        CONF_LIGHTNING_TIME_SENSOR,
+    )
+)
+# Optional fields each options step fills with None when left empty
+_ATMOSPHERIC_OPTIONAL_FIELDS = frozenset(
+    (CONF_DEWPOINT_SENSOR, CONF_HUMIDITY_SENSOR, CONF_PRESSURE_SENSOR, CONF_ALTITUDE)
+)
+_WIND_OPTIONAL_FIELDS = frozenset(
+    (CONF_WIND_SPEED_SENSOR, CONF_WIND_DIRECTION_SENSOR, CONF_WIND_GUST_SENSOR)
+)
+_RAIN_OPTIONAL_FIELDS = frozenset((CONF_RAIN_RATE_SENSOR, CONF_RAIN_STATE_SENSOR))
+_SOLAR_OPTIONAL_FIELDS = frozenset(
+    (
+        CONF_SOLAR_RADIATION_SENSOR,
+        CONF_SOLAR_LUX_SENSOR,
+        CONF_UV_INDEX_SENSOR,
+        CONF_SUN_SENSOR,
+    )
+)
+_SOLAR_OPTIONAL_FIELDS_WITH_ZENITH = _SOLAR_OPTIONAL_FIELDS | {
+    CONF_ZENITH_MAX_RADIATION
+}
+_LIGHTNING_OPTIONAL_FIELDS = frozenset(
+    (
+        CONF_LIGHTNING_COUNT_SENSOR,
+        CONF_LIGHTNING_DISTANCE_SENSOR,
+        CONF_LIGHTNING_TIME_SENSOR,
+    )
+)
+# Submitted values that mean "cleared"
+_EMPTY_VALUES = frozenset(("", "None"))
+
+
+def _option_value(field: str, value: Any) -> Any:
+    """Normalize a submitted option, mapping cleared fields to None."""
+    if field == CONF_ALTITUDE:
+        # Altitude can be 0, so check for None explicitly
+        return value if value is not None and str(value) not in _EMPTY_VALUES else None
+    # For entity fields, empty string means clear the field
+    return value if value and value != "None" else None
+
+
+# Atmospheric sensors shared by initial setup and the atmospheric options step;
+# each adds its own altitude field, which follows the HA unit system
+_ATMOSPHERIC_SENSOR_SCHEMA = vol.Schema(
+    {
+        # Outdoor temp is required and should have a value
+        vol.Required(CONF_OUTDOOR_TEMP_SENSOR): _TEMPERATURE_SELECTOR,
+        vol.Optional(CONF_DEWPOINT_SENSOR): _TEMPERATURE_SELECTOR,
+        vol.Optional(CONF_HUMIDITY_SENSOR): _HUMIDITY_SELECTOR,
+        vol.Optional(CONF_PRESSURE_SENSOR): _PRESSURE_SELECTOR,
+    }
+)
+# Initial setup fields following altitude - all sensors available
+_USER_SENSOR_FIELDS = {
+    vol.Optional(CONF_WIND_SPEED_SENSOR): _WIND_SPEED_SELECTOR,
+    vol.Optional(CONF_WIND_DIRECTION_SENSOR): _SENSOR_SELECTOR,
+    vol.Optional(CONF_WIND_GUST_SENSOR): _WIND_SPEED_SELECTOR,
+    vol.Optional(CONF_RAIN_RATE_SENSOR): _RAIN_RATE_SELECTOR,
+    vol.Optional(CONF_RAIN_STATE_SENSOR): _RAIN_STATE_SELECTOR,
+    vol.Optional(CONF_SOLAR_RADIATION_SENSOR): _SOLAR_RADIATION_SELECTOR,
+    vol.Optional(CONF_SOLAR_LUX_SENSOR): _SOLAR_LUX_SELECTOR,
+    vol.Optional(CONF_UV_INDEX_SENSOR): _SENSOR_SELECTOR,
+    vol.Optional(CONF_SUN_SENSOR): _SUN_SELECTOR,
+    vol.Optional(CONF_LIGHTNING_COUNT_SENSOR): _SENSOR_SELECTOR,
+    vol.Optional(CONF_LIGHTNING_DISTANCE_SENSOR): _LIGHTNING_DISTANCE_SELECTOR,
+    vol.Optional(CONF_LIGHTNING_TIME_SENSOR): _ANY_ENTITY_SELECTOR,
+    vol.Optional(
+        CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
+    ): _UPDATE_INTERVAL_SELECTOR,
+}
+
+# Options flow schemas that do not depend on the current options
+_WIND_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_WIND_SPEED_SENSOR, default=vol.UNDEFINED
+        ): _WIND_SPEED_SELECTOR,
+        vol.Optional(
+            CONF_WIND_DIRECTION_SENSOR, default=vol.UNDEFINED
+        ): _SENSOR_SELECTOR,
+        vol.Optional(
+            CONF_WIND_GUST_SENSOR, default=vol.UNDEFINED
+        ): _WIND_SPEED_SELECTOR,
+    }
+)
+_RAIN_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_RAIN_RATE_SENSOR, default=vol.UNDEFINED): _RAIN_RATE_SELECTOR,
+        vol.Optional(
+            CONF_RAIN_STATE_SENSOR, default=vol.UNDEFINED
+        ): _RAIN_STATE_SELECTOR,
+    }
+)
+_SOLAR_RADIATION_FIELD = {
+    vol.Optional(
+        CONF_SOLAR_RADIATION_SENSOR, default=vol.UNDEFINED
+    ): _SOLAR_RADIATION_SELECTOR,
+}
+# Zenith Max Radiation is only offered once a solar radiation sensor is set
+_ZENITH_MAX_RADIATION_FIELD = {
+    vol.Optional(
+        CONF_ZENITH_MAX_RADIATION,
+        default=DEFAULT_ZENITH_MAX_RADIATION,
+    ): _ZENITH_MAX_RADIATION_SELECTOR,
+}
+_SOLAR_SENSOR_FIELDS = {
+    vol.Optional(CONF_SOLAR_LUX_SENSOR, default=vol.UNDEFINED): _SOLAR_LUX_SELECTOR,
+    vol.Optional(CONF_UV_INDEX_SENSOR, default=vol.UNDEFINED): _SENSOR_SELECTOR,
+    vol.Optional(CONF_SUN_SENSOR, default=vol.UNDEFINED): _SUN_SELECTOR,
+}
+_SOLAR_SCHEMA = vol.Schema({**_SOLAR_RADIATION_FIELD, **_SOLAR_SENSOR_FIELDS})
+_SOLAR_SCHEMA_WITH_ZENITH = vol.Schema(
+    {
+        **_SOLAR_RADIATION_FIELD,
+        **_ZENITH_MAX_RADIATION_FIELD,
+        **_SOLAR_SENSOR_FIELDS,
+    }
+)
+_LIGHTNING_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_LIGHTNING_COUNT_SENSOR, default=vol.UNDEFINED
+        ): _SENSOR_SELECTOR,
+        vol.Optional(
+            CONF_LIGHTNING_DISTANCE_SENSOR, default=vol.UNDEFINED
+        ): _LIGHTNING_DISTANCE_SELECTOR,
+        vol.Optional(
+            CONF_LIGHTNING_TIME_SENSOR, default=vol.UNDEFINED
+        ): _ANY_ENTITY_SELECTOR,
+    }
+)
+
 
 class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Micro Weather Station."""
@@ -83,29 +300,8 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
                 )
 
         # Build schema for initial setup - all sensors available
-        data_schema = vol.Schema(
+        data_schema = _ATMOSPHERIC_SENSOR_SCHEMA.extend(
             {
-                vol.Required(CONF_OUTDOOR_TEMP_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor", device_class="temperature"
-                    )
-                ),
-                vol.Optional(CONF_DEWPOINT_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor", device_class="temperature"
-                    )
-                ),
-                vol.Optional(CONF_HUMIDITY_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor", device_class="humidity"
-                    )
-                ),
-                vol.Optional(CONF_PRESSURE_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor",
-                        device_class=["pressure", "atmospheric_pressure"],
-                    )
-                ),
                 vol.Optional(
                     CONF_ALTITUDE, default=self._get_default_altitude()
                 ): selector.NumberSelector(
@@ -116,61 +312,7 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
                         unit_of_measurement=self._get_altitude_unit(),
                     )
                 ),
-                vol.Optional(CONF_WIND_SPEED_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor", device_class="wind_speed"
-                    )
-                ),
-                vol.Optional(CONF_WIND_DIRECTION_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_WIND_GUST_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor", device_class="wind_speed"
-                    )
-                ),
-                vol.Optional(CONF_RAIN_RATE_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor", device_class="precipitation_intensity"
-                    )
-                ),
-                vol.Optional(CONF_RAIN_STATE_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="binary_sensor")
-                ),
-                vol.Optional(CONF_SOLAR_RADIATION_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor", device_class="irradiance"
-                    )
-                ),
-                vol.Optional(CONF_SOLAR_LUX_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor", device_class="illuminance"
-                    )
-                ),
-                vol.Optional(CONF_UV_INDEX_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_SUN_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sun")
-                ),
-                vol.Optional(CONF_LIGHTNING_COUNT_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_LIGHTNING_DISTANCE_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="sensor", device_class="distance"
-                    )
-                ),
-                vol.Optional(CONF_LIGHTNING_TIME_SENSOR): selector.EntitySelector(
-                    selector.EntitySelectorConfig()
-                ),
-                vol.Optional(
-                    CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1, max=60, step=1, unit_of_measurement="min"
-                    )
-                ),
+                **_USER_SENSOR_FIELDS,
             }
         )
 
@@ -191,6 +333,16 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options flow for Micro Weather Station."""
 
+    # Menu choice -> step handler
+    _MENU_STEPS: dict[str, str] = {
+        "atmospheric": "async_step_atmospheric",
+        "wind": "async_step_wind",
+        "rain": "async_step_rain",
+        "solar": "async_step_solar",
+        "lightning": "async_step_lightning",
+        "device_config": "async_step_device_config",
+    }
+
     def __init__(self):
         """Initialize the options flow."""
         self._data = {}
@@ -198,15 +350,26 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     def _current_options(self) -> dict[str, Any]:
         """Return current options safely (guard against missing config_entry during tests)."""
         try:
-            if hasattr(self, "_config_entry") and self._config_entry is not None:
-                return dict(self._config_entry.options)
-            if hasattr(self, "config_entry") and self.config_entry is not None:
-                return dict(self.config_entry.options)
+            entry = getattr(self, "_config_entry", None) or getattr(
+                self, "config_entry", None
+            )
+            if entry is not None:
+                return dict(entry.options)
         except Exception as exc:
             # Log at debug level instead of silently passing to satisfy Bandit
             _LOGGER.debug("Could not read config_entry.options during tests: %s", exc)
         return {}
 
+    def _pending_options(self) -> dict[str, Any]:
+        """Return current options with values entered earlier in this flow."""
+        options = self._current_options()
+        options.update(
+            (field, _option_value(field, value))
+            for field, value in self._data.items()
+            if field in _STEP_FIELDS
+        )
+        return options
+
     def _get_default_altitude(self) -> float:
         """Get the default altitude in the appropriate unit for the HA system."""
         elevation = self.hass.config.elevation or 0.0
@@ -230,30 +393,11 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     ) -> ConfigFlowResult:
         """Handle the initial options step."""
         if user_input is not None:
-            if user_input["next_step_id"] == "atmospheric":
-                return await self.async_step_atmospheric()
-            elif user_input["next_step_id"] == "wind":
-                return await self.async_step_wind()
-            elif user_input["next_step_id"] == "rain":
-                return await self.async_step_rain()
-            elif user_input["next_step_id"] == "solar":
-                return await self.async_step_solar()
-            elif user_input["next_step_id"] == "lightning":
-                return await self.async_step_lightning()
-            elif user_input["next_step_id"] == "device_config":
-                return await self.async_step_device_config()
-
-        return self.async_show_menu(
-            step_id="init",
-            menu_options=[
-                "atmospheric",
-                "wind",
-                "rain",
-                "solar",
-                "lightning",
-                "device_config",
-            ],
-        )
+            step = self._MENU_STEPS.get(user_input["next_step_id"])
+            if step is not None:
+                return await getattr(self, step)()
+
+        return self.async_show_menu(step_id="init", menu_options=_OPTIONS_MENU)
 
     async def async_step_atmospheric(
         self, user_input: dict[str, Any] | None = None
@@ -266,104 +410,27 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             if not user_input.get(CONF_OUTDOOR_TEMP_SENSOR):
                 errors["base"] = "missing_outdoor_temp"
             else:
-                # Ensure optional fields are present in user_input
-                self._optional_entities(
-                    [
-                        CONF_DEWPOINT_SENSOR,
-                        CONF_HUMIDITY_SENSOR,
-                        CONF_PRESSURE_SENSOR,
-                        CONF_ALTITUDE,
-                    ],
-                    user_input,
-                )
-
-                # Store atmospheric sensor data
-                self._data.update(user_input)
-
-                # Save changes immediately
-                options = dict(self._current_options())
-                for field in user_input:
-                    value = user_input[field]
-                    # Handle different field types appropriately
-                    if field == CONF_ALTITUDE:
-                        # Altitude can be 0, so check for None explicitly
-                        if value is not None and str(value) not in ("", "None"):
-                            options[field] = value
-                        else:
-                            options[field] = None
-                    else:
-                        # For entity fields, empty string means clear the field
-                        if value and value not in ("", "None"):
-                            options[field] = value
-                        else:
-                            options[field] = None
-                entry = getattr(self, "_config_entry", None) or getattr(
-                    self, "config_entry", None
-                )
-                if entry is not None:
-                    self.hass.config_entries.async_update_entry(entry, options=options)
-                else:
-                    # Fallback during tests: stash options and continue
-                    self._data.setdefault("stashed_options", {}).update(options)
-
+                self._store_step(user_input, _ATMOSPHERIC_OPTIONAL_FIELDS)
                 return await self.async_step_init()
 
         # Get current options for defaults
-        current_options = dict(self._current_options())
-
-        # Build atmospheric sensors schema
-        schema_dict: dict[Any, Any] = {}
+        current_options = self._pending_options()
 
-        # Outdoor temp is required and should have a value
-        schema_dict[vol.Required(CONF_OUTDOOR_TEMP_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor", device_class="temperature"
-                )
-            )
-        )
-
-        # Optional sensors - always allow clearing
-        schema_dict[vol.Optional(CONF_DEWPOINT_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor", device_class="temperature"
-                )
-            )
-        )
-
-        schema_dict[vol.Optional(CONF_HUMIDITY_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="sensor", device_class="humidity")
-            )
-        )
-
-        schema_dict[vol.Optional(CONF_PRESSURE_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor",
-                    device_class=["pressure", "atmospheric_pressure"],
+        # Build atmospheric sensors schema - optional sensors always allow clearing
+        schema = _ATMOSPHERIC_SENSOR_SCHEMA.extend(
+            {
+                vol.Optional(CONF_ALTITUDE): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=self._get_altitude_max(),
+                        step=1,
+                        unit_of_measurement=self._get_altitude_unit(),
+                    )
                 )
-            )
-        )
-
-        schema_dict[
-            vol.Optional(
-                CONF_ALTITUDE,
-                default=vol.UNDEFINED,
-            )
-        ] = selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=0,
-                max=self._get_altitude_max(),
-                step=1,
-                unit_of_measurement=self._get_altitude_unit(),
-            )
+            }
         )
 
-        data_schema = self.add_suggested_values_to_schema(
-            vol.Schema(schema_dict), current_options
-        )
+        data_schema = self.add_suggested_values_to_schema(schema, current_options)
 
         return self.async_show_form(
             step_id="atmospheric",
@@ -376,67 +443,14 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     ) -> ConfigFlowResult:
         """Handle wind sensors configuration."""
         if user_input is not None:
-            # Ensure optional fields are present in user_input
-            self._optional_entities(
-                [
-                    CONF_WIND_SPEED_SENSOR,
-                    CONF_WIND_DIRECTION_SENSOR,
-                    CONF_WIND_GUST_SENSOR,
-                ],
-                user_input,
-            )
-
-            # Store wind sensor data
-            self._data.update(user_input)
-
-            # Save changes immediately
-            options = dict(self._current_options())
-            for field in user_input:
-                value = user_input[field]
-                if value and value not in ("", "None"):
-                    options[field] = value
-                else:
-                    options[field] = None
-            entry = getattr(self, "_config_entry", None) or getattr(
-                self, "config_entry", None
-            )
-            if entry is not None:
-                self.hass.config_entries.async_update_entry(entry, options=options)
-            else:
-                # Fallback during tests: stash options and continue
-                self._data.setdefault("stashed_options", {}).update(options)
+            self._store_step(user_input, _WIND_OPTIONAL_FIELDS)
 
             return await self.async_step_init()
 
         # Get current options for defaults
-        current_options = self._current_options()
-
-        # Build wind sensors schema
-        schema_dict: dict[Any, Any] = {}
-
-        schema_dict[vol.Optional(CONF_WIND_SPEED_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor", device_class="wind_speed"
-                )
-            )
-        )
-
-        schema_dict[vol.Optional(CONF_WIND_DIRECTION_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor"))
-        )
-
-        schema_dict[vol.Optional(CONF_WIND_GUST_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor", device_class="wind_speed"
-                )
-            )
-        )
+        current_options = self._pending_options()
 
-        data_schema = self.add_suggested_values_to_schema(
-            vol.Schema(schema_dict), current_options
-        )
+        data_schema = self.add_suggested_values_to_schema(_WIND_SCHEMA, current_options)
 
         return self.async_show_form(
             step_id="wind",
@@ -448,60 +462,14 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     ) -> ConfigFlowResult:
         """Handle rain sensors configuration."""
         if user_input is not None:
-            # Ensure optional fields are present in user_input
-            self._optional_entities(
-                [
-                    CONF_RAIN_RATE_SENSOR,
-                    CONF_RAIN_STATE_SENSOR,
-                ],
-                user_input,
-            )
-
-            # Store rain sensor data
-            self._data.update(user_input)
-
-            # Save changes immediately
-            options = dict(self._current_options())
-            for field in user_input:
-                value = user_input[field]
-                if value and value not in ("", "None"):
-                    options[field] = value
-                else:
-                    options[field] = None
-            entry = getattr(self, "_config_entry", None) or getattr(
-                self, "config_entry", None
-            )
-            if entry is not None:
-                self.hass.config_entries.async_update_entry(entry, options=options)
-            else:
-                # Fallback during tests: stash options and continue
-                self._data.setdefault("stashed_options", {}).update(options)
+            self._store_step(user_input, _RAIN_OPTIONAL_FIELDS)
 
             return await self.async_step_init()
 
         # Get current options for defaults
-        current_options = self._current_options()
-
-        # Build rain sensors schema
-        schema_dict: dict[Any, Any] = {}
+        current_options = self._pending_options()
 
-        schema_dict[vol.Optional(CONF_RAIN_RATE_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor", device_class="precipitation_intensity"
-                )
-            )
-        )
-
-        schema_dict[vol.Optional(CONF_RAIN_STATE_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="binary_sensor")
-            )
-        )
-
-        data_schema = self.add_suggested_values_to_schema(
-            vol.Schema(schema_dict), current_options
-        )
+        data_schema = self.add_suggested_values_to_schema(_RAIN_SCHEMA, current_options)
 
         return self.async_show_form(
             step_id="rain",
@@ -513,95 +481,30 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     ) -> ConfigFlowResult:
         """Handle solar/sun sensors configuration."""
         if user_input is not None:
-            # Ensure optional fields are present in user_input
-            optional_fields = [
-                CONF_SOLAR_RADIATION_SENSOR,
-                CONF_SOLAR_LUX_SENSOR,
-                CONF_UV_INDEX_SENSOR,
-                CONF_SUN_SENSOR,
-            ]
-
             # Only include zenith_max_radiation in optional fields if solar radiation sensor is configured
-            if self._current_options().get(
+            if user_input.get(
                 CONF_SOLAR_RADIATION_SENSOR
-            ) or user_input.get(CONF_SOLAR_RADIATION_SENSOR):
-                optional_fields.append(CONF_ZENITH_MAX_RADIATION)
-
-            self._optional_entities(optional_fields, user_input)
-
-            # Store solar sensor data
-            self._data.update(user_input)
-
-            # Save changes immediately
-            options = dict(self._current_options())
-            for field in user_input:
-                value = user_input[field]
-                if value and value not in ("", "None"):
-                    options[field] = value
-                else:
-                    options[field] = None
-            entry = getattr(self, "_config_entry", None) or getattr(
-                self, "config_entry", None
-            )
-            if entry is not None:
-                self.hass.config_entries.async_update_entry(entry, options=options)
+            ) or self._pending_options().get(CONF_SOLAR_RADIATION_SENSOR):
+                optional_fields = _SOLAR_OPTIONAL_FIELDS_WITH_ZENITH
             else:
-                # Fallback during tests: stash options and continue
-                self._data.setdefault("stashed_options", {}).update(options)
+                optional_fields = _SOLAR_OPTIONAL_FIELDS
+
+            self._store_step(user_input, optional_fields)
 
             return await self.async_step_init()
 
         # Get current options for defaults
-        current_options = self._current_options()
+        current_options = self._pending_options()
 
         # Check if solar radiation sensor is configured
         has_solar_radiation = bool(current_options.get(CONF_SOLAR_RADIATION_SENSOR))
 
-        # Build solar sensors schema
-        schema_dict: dict[Any, Any] = {}
-
-        schema_dict[
-            vol.Optional(CONF_SOLAR_RADIATION_SENSOR, default=vol.UNDEFINED)
-        ] = selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor", device_class="irradiance")
-        )
-
         # Show Zenith Max Radiation if solar radiation sensor is configured
         # Note: If user selects solar radiation sensor in this form, they'll need to
         # submit and return to see the zenith field
-        if has_solar_radiation:
-            schema_dict[
-                vol.Optional(
-                    CONF_ZENITH_MAX_RADIATION,
-                    default=DEFAULT_ZENITH_MAX_RADIATION,
-                )
-            ] = selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=400,
-                    max=1800,
-                    step=10,
-                    unit_of_measurement="W/m²",
-                )
-            )
-
-        schema_dict[vol.Optional(CONF_SOLAR_LUX_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="sensor", device_class="illuminance"
-                )
-            )
-        )
-
-        schema_dict[vol.Optional(CONF_UV_INDEX_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor"))
-        )
-
-        schema_dict[vol.Optional(CONF_SUN_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(selector.EntitySelectorConfig(domain="sun"))
-        )
-
         data_schema = self.add_suggested_values_to_schema(
-            vol.Schema(schema_dict), current_options
+            _SOLAR_SCHEMA_WITH_ZENITH if has_solar_radiation else _SOLAR_SCHEMA,
+            current_options,
         )
 
         return self.async_show_form(
@@ -614,55 +517,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     ) -> ConfigFlowResult:
         """Handle lightning sensor configuration."""
         if user_input is not None:
-            # Ensure optional fields are present in user_input
-            self._optional_entities(
-                [
-                    CONF_LIGHTNING_COUNT_SENSOR,
-                    CONF_LIGHTNING_DISTANCE_SENSOR,
-                    CONF_LIGHTNING_TIME_SENSOR,
-                ],
-                user_input,
-            )
-
-            # Store lightning sensor data
-            self._data.update(user_input)
-
-            # Save changes immediately
-            options = dict(self.config_entry.options)
-            for field in user_input:
-                value = user_input[field]
-                if value and value not in ("", "None"):
-                    options[field] = value
-                else:
-                    options[field] = None
-            self.hass.config_entries.async_update_entry(
-                self.config_entry, options=options
-            )
+            self._store_step(user_input, _LIGHTNING_OPTIONAL_FIELDS)
 
             return await self.async_step_init()
 
         # Get current options for defaults
-        current_options = self.config_entry.options
-
-        # Build lightning sensors schema
-        schema_dict: dict[Any, Any] = {}
-
-        schema_dict[
-            vol.Optional(CONF_LIGHTNING_COUNT_SENSOR, default=vol.UNDEFINED)
-        ] = selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor"))
-
-        schema_dict[
-            vol.Optional(CONF_LIGHTNING_DISTANCE_SENSOR, default=vol.UNDEFINED)
-        ] = selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor", device_class="distance")
-        )
-
-        schema_dict[vol.Optional(CONF_LIGHTNING_TIME_SENSOR, default=vol.UNDEFINED)] = (
-            selector.EntitySelector(selector.EntitySelectorConfig())
-        )
+        current_options = self._pending_options()
 
         data_schema = self.add_suggested_values_to_schema(
-            vol.Schema(schema_dict), current_options
+            _LIGHTNING_SCHEMA, current_options
         )
 
         return self.async_show_form(
@@ -681,55 +544,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 # Store final data
                 self._data.update(user_input)
 
-                # Build new options dict from current options and accumulated data
-                options = dict(self._current_options())
-
-                # Process all sensor fields from accumulated data
-                all_sensor_fields = [
-                    CONF_OUTDOOR_TEMP_SENSOR,
-                    CONF_DEWPOINT_SENSOR,
-                    CONF_HUMIDITY_SENSOR,
-                    CONF_PRESSURE_SENSOR,
-                    CONF_ALTITUDE,
-                    CONF_WIND_SPEED_SENSOR,
-                    CONF_WIND_DIRECTION_SENSOR,
-                    CONF_WIND_GUST_SENSOR,
-                    CONF_RAIN_RATE_SENSOR,
-                    CONF_RAIN_STATE_SENSOR,
-                    CONF_SOLAR_RADIATION_SENSOR,
-                    CONF_SOLAR_LUX_SENSOR,
-                    CONF_UV_INDEX_SENSOR,
-                    CONF_SUN_SENSOR,
-                    CONF_LIGHTNING_COUNT_SENSOR,
-                    CONF_LIGHTNING_DISTANCE_SENSOR,
-                    CONF_LIGHTNING_TIME_SENSOR,
-                ]
-
-                for field in all_sensor_fields:
-                    if field in self._data:
-                        value = self._data[field]
-                        # Handle different field types appropriately
-                        if field == CONF_ALTITUDE:
-                            # Altitude can be 0, so check for None explicitly
-                            if value is not None and str(value) not in ("", "None"):
-                                options[field] = value
-                            else:
-                                options[field] = None
-                        else:
-                            # For entity fields, empty string means clear the field
-                            if value and value not in ("", "None"):
-                                options[field] = value
-                            else:
-                                options[field] = None
+                # Current options with all accumulated sensor fields applied
+                options = self._pending_options()
 
                 # Always update the interval
-                update_interval = self._data.get(
+                options[CONF_UPDATE_INTERVAL] = self._data.get(
                     CONF_UPDATE_INTERVAL,
-                    self._current_options().get(
-                        CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
-                    ),
+                    options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+                )
+                options[CONF_REFRESH_ON_STARTUP] = self._data.get(
+                    CONF_REFRESH_ON_STARTUP,
+                    options.get(CONF_REFRESH_ON_STARTUP, DEFAULT_REFRESH_ON_STARTUP),
                 )
-                options[CONF_UPDATE_INTERVAL] = update_interval
 
                 return self.async_create_entry(title="", data=options)
 
@@ -740,7 +566,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         # Get current options for defaults
         current_options = self._current_options()
 
-        # Build final schema with update interval
+        # Build final schema with update interval and startup behaviour
         data_schema = vol.Schema(
             {
                 vol.Required(
@@ -748,11 +574,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     default=current_options.get(
                         CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
                     ),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1, max=60, step=1, unit_of_measurement="min"
-                    )
-                ),
+                ): _UPDATE_INTERVAL_SELECTOR,
+                vol.Required(
+                    CONF_REFRESH_ON_STARTUP,
+                    default=current_options.get(
+                        CONF_REFRESH_ON_STARTUP, DEFAULT_REFRESH_ON_STARTUP
+                    ),
+                ): selector.BooleanSelector(),
             }
         )
 
@@ -763,14 +591,26 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         )
 
     def _optional_entities(
-        self, keys: list[str], user_input: dict[str, Any] | None = None
+        self, keys: frozenset[str], user_input: dict[str, Any] | None = None
     ) -> None:
         """Set value to None if key does not exist in user_input."""
         if user_input is None:
             return
-        for key in keys:
-            if key not in user_input:
-                user_input[key] = None
+        missing = keys.difference(user_input)
+        if missing:
+            user_input.update(dict.fromkeys(missing))
+
+    def _store_step(
+        self, user_input: dict[str, Any], optional_keys: frozenset[str]
+    ) -> None:
+        """Accumulate a menu step's input until device_config saves the options.
+
+        Every step's fields are written in one config entry update when the
+        flow finishes, rather than one update (and coordinator refresh) per step.
+        """
+        # Ensure optional fields are present in user_input
+        self._optional_entities(optional_keys, user_input)
+        self._data.update(user_input)
 
 
 class CannotConnect(HomeAssistantError):
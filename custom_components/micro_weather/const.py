@@ -8,6 +8,7 @@ CONF_HUMIDITY_RANGE = "humidity_range"
 CONF_PRESSURE_RANGE = "pressure_range"
 CONF_WIND_SPEED_RANGE = "wind_speed_range"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_REFRESH_ON_STARTUP = "refresh_on_startup"
 CONF_WEATHER_PATTERNS = "weather_patterns"
 
 # Sensor entity configuration
@@ -36,6 +37,10 @@ DEFAULT_HUMIDITY_RANGE = (30, 90)  # Percentage
 DEFAULT_PRESSURE_RANGE = (990, 1030)  # hPa
 DEFAULT_WIND_SPEED_RANGE = (0, 25)  # km/h
 DEFAULT_UPDATE_INTERVAL = 5  # minutes
+DEFAULT_REFRESH_ON_STARTUP = True
+# Quiescent weather refreshes at up to this multiple of the configured interval
+CALM_UPDATE_INTERVAL_FACTOR = 3
+MAX_CALM_UPDATE_INTERVAL = 15  # minutes
 DEFAULT_ZENITH_MAX_RADIATION = 1000.0  # W/m² at zenith
 
 # Sensor data keys
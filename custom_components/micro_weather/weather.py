@@ -20,6 +20,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from . import MicroWeatherCoordinator
 from .const import (
     DOMAIN,
     KEY_APPARENT_TEMPERATURE,
@@ -62,7 +63,7 @@ async def async_setup_entry(
     async_add_entities([MicroWeatherEntity(coordinator, config_entry)])
 
 
-class MicroWeatherEntity(CoordinatorEntity, WeatherEntity):
+class MicroWeatherEntity(CoordinatorEntity[MicroWeatherCoordinator], WeatherEntity):
     """Micro Weather Station weather entity."""
 
     _attr_has_entity_name = True
@@ -140,8 +141,11 @@ class MicroWeatherEntity(CoordinatorEntity, WeatherEntity):
     async def async_added_to_hass(self) -> None:
         """Handle entity being added to Home Assistant."""
         await super().async_added_to_hass()
-        # Request refresh if we don't have data yet
-        if not self.coordinator.data:
+        # Request refresh if we don't have data yet, unless the user opted to
+        # wait for the first scheduled update instead of refreshing at startup
+        if not self.coordinator.data and getattr(
+            self.coordinator, "refresh_on_startup", True
+        ):
             await self.coordinator.async_request_refresh()
 
     @property
@@ -350,40 +354,42 @@ class MicroWeatherEntity(CoordinatorEntity, WeatherEntity):
             if hasattr(sunset_time, "_mock_name"):
                 sunset_time = None
 
-            # Get historical patterns from trends analyzer
-            historical_patterns = {}
-            if (
-                hasattr(self.coordinator, "trends_analyzer")
-                and self.coordinator.trends_analyzer
-            ):
-                historical_patterns = (
-                    self.coordinator.trends_analyzer.analyze_historical_patterns()
-                )
+            # The coordinator may be running these analyzers in the executor
+            async with self.coordinator.analysis_lock:
+                # Get historical patterns from trends analyzer
+                historical_patterns = {}
+                if (
+                    hasattr(self.coordinator, "trends_analyzer")
+                    and self.coordinator.trends_analyzer
+                ):
+                    historical_patterns = (
+                        self.coordinator.trends_analyzer.analyze_historical_patterns()
+                    )
 
-            meteorological_state = self._meteorological_analyzer.analyze_state(
-                sensor_data, altitude
-            )
-            if (
-                hasattr(self.coordinator, "trends_analyzer")
-                and self.coordinator.trends_analyzer
-            ):
-                meteorological_state["pressure_acceleration"] = (
-                    self.coordinator.trends_analyzer.compute_pressure_acceleration()
+                meteorological_state = self._meteorological_analyzer.analyze_state(
+                    sensor_data, altitude
+                )
+                if (
+                    hasattr(self.coordinator, "trends_analyzer")
+                    and self.coordinator.trends_analyzer
+                ):
+                    meteorological_state["pressure_acceleration"] = (
+                        self.coordinator.trends_analyzer.compute_pressure_acceleration()
+                    )
+                system_evolution = self._evolution_modeler.model_system_evolution(
+                    meteorological_state, current_condition=current_condition
                 )
-            system_evolution = self._evolution_modeler.model_system_evolution(
-                meteorological_state, current_condition=current_condition
-            )
 
-            forecast_data = self._daily_generator.generate_forecast(
-                current_condition,
-                sensor_data,
-                altitude,
-                meteorological_state,
-                historical_patterns,
-                system_evolution,
-                sunrise_time=sunrise_time,
-                sunset_time=sunset_time,
-            )
+                forecast_data = self._daily_generator.generate_forecast(
+                    current_condition,
+                    sensor_data,
+                    altitude,
+                    meteorological_state,
+                    historical_patterns,
+                    system_evolution,
+                    sunrise_time=sunrise_time,
+                    sunset_time=sunset_time,
+                )
 
             # Convert to Forecast objects
             forecast_list = []
@@ -481,32 +487,34 @@ class MicroWeatherEntity(CoordinatorEntity, WeatherEntity):
                         )
             altitude = altitude_value
 
-            meteorological_state = self._meteorological_analyzer.analyze_state(
-                sensor_data, altitude
-            )
-            if (
-                hasattr(self.coordinator, "trends_analyzer")
-                and self.coordinator.trends_analyzer
-            ):
-                meteorological_state["pressure_acceleration"] = (
-                    self.coordinator.trends_analyzer.compute_pressure_acceleration()
+            # The coordinator may be running these analyzers in the executor
+            async with self.coordinator.analysis_lock:
+                meteorological_state = self._meteorological_analyzer.analyze_state(
+                    sensor_data, altitude
+                )
+                if (
+                    hasattr(self.coordinator, "trends_analyzer")
+                    and self.coordinator.trends_analyzer
+                ):
+                    meteorological_state["pressure_acceleration"] = (
+                        self.coordinator.trends_analyzer.compute_pressure_acceleration()
+                    )
+                micro_evolution = self._evolution_modeler.model_system_evolution(
+                    meteorological_state, current_condition=current_condition
                 )
-            micro_evolution = self._evolution_modeler.model_system_evolution(
-                meteorological_state, current_condition=current_condition
-            )
 
-            forecast_data = self._hourly_generator.generate_forecast(
-                current_temp=float(convert_to_fahrenheit(current_temp) or 68.0),
-                current_condition=current_condition,
-                sensor_data=sensor_data,
-                sunrise_time=sunrise_time,
-                sunset_time=sunset_time,
-                altitude=altitude,
-                meteorological_state=meteorological_state,
-                hourly_patterns={},
-                micro_evolution=micro_evolution,
-                # astronomical_calculator removed - diurnal logic inlined
-            )
+                forecast_data = self._hourly_generator.generate_forecast(
+                    current_temp=float(convert_to_fahrenheit(current_temp) or 68.0),
+                    current_condition=current_condition,
+                    sensor_data=sensor_data,
+                    sunrise_time=sunrise_time,
+                    sunset_time=sunset_time,
+                    altitude=altitude,
+                    meteorological_state=meteorological_state,
+                    hourly_patterns={},
+                    micro_evolution=micro_evolution,
+                    # astronomical_calculator removed - diurnal logic inlined
+                )
             # Convert to Forecast objects
             forecast_list = []
             for hour_data in forecast_data:
@@ -4,7 +4,7 @@ from collections import deque
 from datetime import datetime
 import json
 import logging
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant
@@ -150,7 +150,9 @@ class WeatherDetector:
         self.atmospheric_analyzer = AtmosphericAnalyzer(
             self._sensor_history, self.trends_analyzer
         )
-        self.solar_analyzer = SolarAnalyzer(self._sensor_history, zenith_max_radiation)
+        self.solar_analyzer = SolarAnalyzer(
+            self._sensor_history, zenith_max_radiation, self.trends_analyzer
+        )
         self.core_analyzer = WeatherConditionAnalyzer(
             self.atmospheric_analyzer, self.solar_analyzer, self.trends_analyzer
         )
@@ -200,11 +202,13 @@ class WeatherDetector:
         required_samples = int(cls.HISTORY_RETENTION_HOURS * samples_per_hour)
         return max(cls.MIN_HISTORY_SAMPLES, required_samples)
 
-    def get_weather_data(self) -> Dict[str, Any]:
+    def get_weather_data(
+        self, sensor_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """Get current weather data from sensors.
 
         Orchestrates the complete weather analysis process:
-        1. Reads current sensor values
+        1. Reads current sensor values (unless a snapshot is supplied)
         2. Determines weather condition using meteorological algorithms
         3. Converts units to standard formats
         4. Generates forecast data
@@ -220,14 +224,36 @@ class WeatherDetector:
                 - condition: Current weather condition string
                 - forecast: Weather forecast data
                 - last_updated: ISO timestamp of last update
+
+        Args:
+            sensor_data: Sensor snapshot from read_sensor_values(). When given,
+                the state machine is not accessed, so the analysis can run
+                in an executor thread.
+        """
+        if sensor_data is None:
+            sensor_data = self._get_sensor_values()
+
+        # Share one clock reading across every trend query in this update
+        self.trends_analyzer.begin_batch()
+        try:
+            return self._build_weather_data(sensor_data)
+        finally:
+            self.trends_analyzer.end_batch()
+
+    def read_sensor_values(self) -> Dict[str, Any]:
+        """Snapshot the configured sensor states for get_weather_data().
+
+        Must be called from the event loop.
         """
-        # Get sensor values
-        sensor_data = self._get_sensor_values()
+        return self._get_sensor_values()
+
+    def _build_weather_data(self, sensor_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the analysis pipeline for get_weather_data()."""
+        # Convert once; condition, visibility and forecast all read this copy
+        analysis_data = self._prepare_analysis_sensor_data(sensor_data)
 
         # Store historical data
-        self.trends_analyzer.store_historical_data(
-            self._prepare_analysis_sensor_data(sensor_data)
-        )
+        self.trends_analyzer.store_historical_data(analysis_data)
 
         # Get altitude for forecast generation (converted to meters)
         altitude = convert_altitude_to_meters(
@@ -235,8 +261,8 @@ class WeatherDetector:
             self.hass.config.units is US_CUSTOMARY_SYSTEM,
         )
 
-        # Determine weather condition
-        condition = self._determine_weather_condition(sensor_data)
+        # Determine weather condition and visibility
+        condition, visibility = self._determine_weather_condition(analysis_data)
 
         # Store the final condition in historical data
         self.trends_analyzer.store_historical_data(
@@ -263,7 +289,6 @@ class WeatherDetector:
             # Get historical patterns from trends analyzer
             historical_patterns = self.trends_analyzer.analyze_historical_patterns()
 
-            analysis_data = self._prepare_analysis_sensor_data(sensor_data)
             meteorological_state = self.meteorological_analyzer.analyze_state(
                 analysis_data, altitude
             )
@@ -343,9 +368,7 @@ class WeatherDetector:
                 sensor_data.get("wind_gust"), sensor_data.get(KEY_WIND_GUST_UNIT)
             ),
             KEY_WIND_DIRECTION: sensor_data.get("wind_direction"),
-            KEY_VISIBILITY: self.analysis.estimate_visibility(
-                condition, self._prepare_analysis_sensor_data(sensor_data)
-            ),
+            KEY_VISIBILITY: visibility,
             KEY_PRECIPITATION: sensor_data.get(KEY_RAIN_RATE),
             KEY_DEWPOINT: self._convert_temperature(
                 dewpoint_value, dewpoint_unit
@@ -462,7 +485,9 @@ class WeatherDetector:
 
         return sensor_data
 
-    def _determine_weather_condition(self, sensor_data: Dict[str, Any]) -> str:
+    def _determine_weather_condition(
+        self, analysis_data: Dict[str, Any]
+    ) -> Tuple[str, float]:
         """
         Advanced meteorological weather condition detection.
 
@@ -473,6 +498,12 @@ class WeatherDetector:
         - Wind patterns for storm identification
         - Temperature/humidity for fog and frost conditions
         - Dewpoint analysis for precipitation potential
+
+        Args:
+            analysis_data: Sensor data from _prepare_analysis_sensor_data
+
+        Returns:
+            Tuple of (weather condition, estimated visibility in km)
         """
         # Get altitude from configuration options (converted to meters)
         altitude = float(
@@ -483,11 +514,8 @@ class WeatherDetector:
             or 0.0
         )  # Ensure altitude is always a float
 
-        # Prepare sensor data in imperial units for analysis
-        analysis_data = self._prepare_analysis_sensor_data(sensor_data)
-
-        # Use the weather analysis module for condition determination
-        return self.analysis.determine_condition(analysis_data, altitude)
+        # Use the weather analysis module for condition and visibility
+        return self.analysis.evaluate(analysis_data, altitude)
 
     def _convert_temperature(
         self, temp: Optional[float], unit: Optional[str]
@@ -8,6 +8,10 @@ import pytest
 
 from custom_components.micro_weather.analysis.atmospheric import AtmosphericAnalyzer
 from custom_components.micro_weather.analysis.trends import TrendsAnalyzer
+from custom_components.micro_weather.meteorological_constants import (
+    PhysicsConstants,
+    PressureThresholds,
+)
 
 
 class TestAtmosphericAnalyzer:
@@ -198,6 +202,25 @@ class TestAtmosphericAnalyzer:
         # Significant shift should be boolean
         assert isinstance(wind_analysis["significant_shift"], bool)
 
+    def test_analyze_wind_direction_trends_values(self, analyzer):
+        """Test wind direction stability, change rate and shift values."""
+        # Fixture directions 180..270°, newest first
+        wind_analysis = analyzer.analyze_wind_direction_trends()
+        assert wind_analysis["direction_stability"] == pytest.approx(
+            1.0 - 30.2765 / 180.0, abs=1e-5
+        )
+        assert wind_analysis["significant_shift"] is True
+
+        # Chronological veer through north: 350, 0, 10, 20 over three hours
+        start = datetime.now() - timedelta(hours=3)
+        analyzer._sensor_history["wind_direction"] = deque(
+            {"timestamp": start + timedelta(hours=i), "value": value}
+            for i, value in enumerate([350.0, 0.0, 10.0, 20.0])
+        )
+        wind_analysis = analyzer.analyze_wind_direction_trends()
+        assert wind_analysis["direction_change_rate"] == pytest.approx(10.0)
+        assert wind_analysis["significant_shift"] is False
+
     def test_calculate_angular_difference(self, analyzer):
         """Test angular difference calculation."""
         # Test same direction
@@ -234,6 +257,32 @@ class TestAtmosphericAnalyzer:
             result_invalid, (str, type(None))
         )  # Should handle invalid dewpoint
 
+    @pytest.mark.parametrize(
+        ("humidity", "spread", "wind_speed", "solar_rad", "expected_score"),
+        [
+            (98.0, 0.5, 2.0, 49.9, 100.0),
+            (97.9, 0.51, 2.1, 50.0, 75.0),
+            (88.0, 3.0, 8.0, 300.0, 5.0),
+            (87.9, 3.1, 8.1, 299.0, -5.0),
+        ],
+    )
+    def test_analyze_fog_conditions_score_boundaries(
+        self, analyzer, humidity, spread, wind_speed, solar_rad, expected_score
+    ):
+        """Test fog scoring bands at their inclusive/exclusive thresholds."""
+        score = analyzer._fog_score(35.0, humidity, spread, wind_speed, solar_rad, True)
+
+        assert score == expected_score
+
+    def test_analyze_fog_conditions_unreachable_score_short_circuits(self, analyzer):
+        """Test night humidity below fog range returns before full scoring."""
+        # Best case for every other factor still cannot reach a fog band
+        assert analyzer._fog_score(50.0, 90.0, 0.0, 0.0, 0.0, False) is None
+        assert (
+            analyzer.analyze_fog_conditions(50.0, 90.0, 50.0, 0.0, 0.0, 0.0, False)
+            is None
+        )
+
     def test_analyze_pressure_trends_error_handling(self, analyzer):
         """Test pressure trend analysis error handling."""
         # Test with empty history - need to update both analyzer and trends_analyzer
@@ -294,3 +343,55 @@ class TestAtmosphericAnalyzer:
             0.0
         )
         assert thresholds["normal_low"] < sea_level_thresholds["normal_low"]
+
+    def test_get_altitude_adjusted_pressure_thresholds_memoized(self, analyzer):
+        """Test altitude-adjusted thresholds are reused until altitude changes."""
+        thresholds = analyzer.get_altitude_adjusted_pressure_thresholds(500.0)
+        assert analyzer.get_altitude_adjusted_pressure_thresholds(500.0) is thresholds
+        assert thresholds["normal_low"] == pytest.approx(
+            PressureThresholds.NORMAL_LOW - 500.0 / 8.0 / PhysicsConstants.INHG_TO_HPA
+        )
+
+        higher = analyzer.get_altitude_adjusted_pressure_thresholds(1500.0)
+        assert higher is not thresholds
+        assert higher["normal_low"] < thresholds["normal_low"]
+
+        sea_level = analyzer.get_altitude_adjusted_pressure_thresholds(None)
+        assert sea_level["normal_low"] == PressureThresholds.NORMAL_LOW
+
+        thresholds_hpa = analyzer.get_altitude_adjusted_pressure_thresholds_hpa(1500.0)
+        assert (
+            analyzer.get_altitude_adjusted_pressure_thresholds_hpa(1500.0)
+            is thresholds_hpa
+        )
+        assert thresholds_hpa["normal_low"] == pytest.approx(
+            higher["normal_low"] * PhysicsConstants.INHG_TO_HPA
+        )
+
+    def test_adjust_pressure_for_altitude(self, analyzer):
+        """Test station pressure reduction to sea level."""
+        exponent = (PhysicsConstants.G * PhysicsConstants.M_AIR) / (
+            PhysicsConstants.R * PhysicsConstants.LAPSE_RATE
+        )
+        expected_factor = (
+            1
+            - PhysicsConstants.LAPSE_RATE * 1000.0 / PhysicsConstants.STD_TEMP_SEA_LEVEL
+        ) ** exponent
+
+        for pressure in (28.5, 29.0):
+            assert analyzer.adjust_pressure_for_altitude(
+                pressure, 1000.0, "relative"
+            ) == pytest.approx(pressure * expected_factor)
+
+        # Sea-level readings, zero and negative altitude are left unchanged
+        assert (
+            analyzer.adjust_pressure_for_altitude(29.0, 1000.0, "atmospheric") == 29.0
+        )
+        assert analyzer.adjust_pressure_for_altitude(29.0, None, "relative") == 29.0
+        assert analyzer.adjust_pressure_for_altitude(29.0, -50.0, "relative") == 29.0
+
+        assert analyzer.sea_level_pressure_factor(1000.0) == pytest.approx(
+            expected_factor
+        )
+        assert analyzer.sea_level_pressure_factor(0.0) == 1.0
+        assert analyzer.sea_level_pressure_factor(None) == 1.0
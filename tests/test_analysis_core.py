@@ -2,6 +2,7 @@
 
 from collections import deque
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from homeassistant.components.weather import (
     ATTR_CONDITION_CLEAR_NIGHT,
@@ -17,11 +18,43 @@ from homeassistant.components.weather import (
 import pytest
 
 from custom_components.micro_weather.analysis.atmospheric import AtmosphericAnalyzer
-from custom_components.micro_weather.analysis.core import WeatherConditionAnalyzer
+from custom_components.micro_weather.analysis.core import (
+    DerivedParameters,
+    PressureBands,
+    SensorReadings,
+    WeatherConditionAnalyzer,
+)
 from custom_components.micro_weather.analysis.solar import SolarAnalyzer
 from custom_components.micro_weather.analysis.trends import TrendsAnalyzer
 
 
+def _derived_parameters(atmospheric, **overrides):
+    """Build sea-level DerivedParameters with neutral defaults."""
+    values = {
+        "dewpoint": 50.0,
+        "temp_dewpoint_spread": 20.0,
+        "is_freezing": False,
+        "is_daytime": False,
+        "is_twilight": False,
+        "has_solar_data": False,
+        "regime": 2,
+        "altitude": 0.0,
+        "adjusted_pressure": 29.92,
+        "pressure_thresholds": PressureBands.from_thresholds(
+            atmospheric.get_altitude_adjusted_pressure_thresholds(0.0)
+        ),
+        "gust_factor": 1.0,
+        "storm_pressure": False,
+        "low_pressure": False,
+        "wind_strong_band": False,
+        "strong_turbulence": False,
+        "severe_turbulence": False,
+        "extreme_gusts": False,
+    }
+    values.update(overrides)
+    return DerivedParameters(**values)
+
+
 class TestWeatherConditionAnalyzer:
     """Test the WeatherConditionAnalyzer class."""
 
@@ -116,6 +149,25 @@ class TestWeatherConditionAnalyzer:
         dewpoint_max_humidity = analyzers["core"].calculate_dewpoint(70.0, 99.9)
         assert dewpoint_min_humidity < dewpoint_max_humidity
 
+    @pytest.mark.parametrize("temp_f", [-4.0, 32.0, 72.0, 122.0])
+    @pytest.mark.parametrize("humidity", [50.0, 65.0, 84.0, 98.0, 100.0])
+    def test_calculate_dewpoint_fast_tracks_magnus(self, analyzers, temp_f, humidity):
+        """Test the log-free dewpoint stays close to the Magnus formula."""
+        core = analyzers["core"]
+
+        fast = core.calculate_dewpoint_fast(temp_f, humidity)
+
+        assert abs(fast - core.calculate_dewpoint(temp_f, humidity)) < 1.2
+
+    def test_calculate_dewpoint_fast_dry_air_uses_magnus(self, analyzers):
+        """Test dry air falls back to the Magnus formula."""
+        core = analyzers["core"]
+
+        assert core.calculate_dewpoint_fast(70.0, 30.0) == core.calculate_dewpoint(
+            70.0, 30.0
+        )
+        assert core.calculate_dewpoint_fast(70.0, None) == 70.0 - 50
+
     def test_classify_precipitation_intensity(self, analyzers):
         """Test precipitation intensity classification."""
         assert analyzers["core"].classify_precipitation_intensity(0.0) == "trace"
@@ -683,3 +735,237 @@ class TestWeatherConditionAnalyzer:
         result = analyzers["core"].determine_condition(sensor_data, 0.0)
         # Lightning sensor should take priority, returning lightning-rainy
         assert result == ATTR_CONDITION_LIGHTNING_RAINY
+
+    def test_determine_conditions_matches_per_row(self, analyzers, mock_sensor_history):
+        """Test the batch API agrees with determine_condition row by row."""
+        trends = TrendsAnalyzer(mock_sensor_history)
+        reference = WeatherConditionAnalyzer(
+            AtmosphericAnalyzer(mock_sensor_history, trends),
+            SolarAnalyzer(mock_sensor_history),
+            trends,
+        )
+        rows = []
+        for rain_rate in (None, 0.006, 0.3):
+            for rain_state in ("dry", "Wet"):
+                for humidity in (40.0, 90.0, 97.0):
+                    for wind_speed, wind_gust in (
+                        (0.5, 0.0),
+                        (20.0, 45.0),
+                        (35.0, 40.0),
+                    ):
+                        for solar_radiation, solar_lux in (
+                            (0.0, 0.0),
+                            (20.0, 70.0),
+                            (600.0, 50000.0),
+                        ):
+                            rows.append(
+                                {
+                                    "outdoor_temp": 55.0,
+                                    "humidity": humidity,
+                                    "pressure": 29.92,
+                                    "wind_speed": wind_speed,
+                                    "wind_gust": wind_gust,
+                                    "rain_rate": rain_rate,
+                                    "rain_state": rain_state,
+                                    "solar_radiation": solar_radiation,
+                                    "solar_lux": solar_lux,
+                                    "uv_index": 0.0,
+                                }
+                            )
+        rows.append(
+            {
+                **rows[0],
+                "lightning_count": 3.0,
+                "lightning_distance": 8.0,
+                "lightning_time": datetime.now() - timedelta(minutes=10),
+            }
+        )
+        columns = {key: [row.get(key) for row in rows] for key in rows[-1]}
+
+        expected = [reference.determine_condition(row, 100.0) for row in rows]
+        assert analyzers["core"].determine_conditions(columns, 100.0) == expected
+        assert expected[-1] == ATTR_CONDITION_LIGHTNING
+
+    def test_determine_conditions_empty(self, analyzers):
+        """Test the batch API with no readings."""
+        assert analyzers["core"].determine_conditions({}) == []
+        assert analyzers["core"].determine_conditions({"humidity": []}) == []
+
+    @pytest.mark.parametrize(
+        ("pressure", "humidity", "wind_speed", "gust_factor", "expected"),
+        [
+            (29.5, 97.0, 2.0, 1.0, ATTR_CONDITION_CLOUDY),  # low, saturated, still
+            (30.8, 60.0, 0.5, 1.0, ATTR_CONDITION_CLEAR_NIGHT),  # very high, calm
+            (30.5, 75.0, 5.0, 1.5, ATTR_CONDITION_CLEAR_NIGHT),  # high, steady
+            (30.5, 75.0, 5.0, 2.0, ATTR_CONDITION_PARTLYCLOUDY),  # high, gusty
+            (29.5, 60.0, 5.0, 1.0, ATTR_CONDITION_CLEAR_NIGHT),  # low, dry
+            (29.92, 80.0, 5.0, 1.0, ATTR_CONDITION_PARTLYCLOUDY),  # normal, light
+            (29.5, 85.0, 5.0, 1.0, ATTR_CONDITION_PARTLYCLOUDY),  # low, humid
+            (29.92, 92.0, 10.0, 1.0, ATTR_CONDITION_CLOUDY),  # very humid
+            (29.92, 88.0, 10.0, 1.0, ATTR_CONDITION_PARTLYCLOUDY),  # default
+        ],
+    )
+    def test_determine_nighttime_condition_rules(
+        self, analyzers, pressure, humidity, wind_speed, gust_factor, expected
+    ):
+        """Test the nighttime decision table picks the first matching rule."""
+        params = _derived_parameters(
+            analyzers["atmospheric"],
+            adjusted_pressure=pressure,
+            gust_factor=gust_factor,
+        )
+        sensors = SensorReadings(humidity=humidity, wind_speed=wind_speed)
+        assert (
+            analyzers["core"]._determine_nighttime_condition(sensors, params)
+            == expected
+        )
+
+    @pytest.mark.parametrize(
+        ("pressure", "humidity", "spread", "expected"),
+        [
+            (29.92, 45.0, 12.0, ATTR_CONDITION_SUNNY),  # dry
+            (29.92, 65.0, 6.0, ATTR_CONDITION_SUNNY),  # fair, normal pressure
+            (29.5, 65.0, 6.0, ATTR_CONDITION_PARTLYCLOUDY),  # fair, low pressure
+            (30.5, 72.0, 3.0, ATTR_CONDITION_SUNNY),  # high pressure
+            (29.92, 90.0, 1.0, ATTR_CONDITION_CLOUDY),  # humid
+            (29.92, 82.0, 3.0, ATTR_CONDITION_PARTLYCLOUDY),  # default
+        ],
+    )
+    def test_atmospheric_fallback_condition_rules(
+        self, analyzers, pressure, humidity, spread, expected
+    ):
+        """Test the atmospheric fallback decision table."""
+        params = _derived_parameters(
+            analyzers["atmospheric"],
+            adjusted_pressure=pressure,
+            temp_dewpoint_spread=spread,
+        )
+        sensors = SensorReadings(humidity=humidity)
+        assert (
+            analyzers["core"]._atmospheric_fallback_condition(sensors, params)
+            == expected
+        )
+
+    def test_estimate_visibility_reuses_condition_inputs(self, analyzers):
+        """Test visibility reuses the sensors and dewpoint from determine_condition."""
+        core = analyzers["core"]
+        sensor_data = {
+            "outdoor_temp": 50.0,
+            "humidity": 99.0,
+            "pressure": 29.92,
+            "wind_speed": 0.5,
+            "rain_rate": 0.0,
+            "solar_radiation": 0.0,
+        }
+        core.determine_condition(sensor_data, 0.0)
+        sensors = core._extract_sensors(sensor_data)
+        assert core._extract_sensors(dict(sensor_data)) is sensors
+
+        with patch.object(
+            core, "calculate_dewpoint", wraps=core.calculate_dewpoint
+        ) as mock_dewpoint:
+            assert core.estimate_visibility(ATTR_CONDITION_FOG, sensor_data) == 0.2
+        mock_dewpoint.assert_not_called()
+
+        # Changed readings are extracted again
+        sensor_data["humidity"] = 93.0
+        assert core._extract_sensors(sensor_data).humidity == 93.0
+        assert core.estimate_visibility(ATTR_CONDITION_FOG, sensor_data) == 1.0
+
+    @pytest.mark.parametrize(
+        "sensor_data",
+        [
+            {"outdoor_temp": 50.0, "humidity": 99.0, "wind_speed": 0.5},
+            {"rain_rate": 0.3, "rain_state": "wet", "wind_speed": 12.0},
+            {"solar_radiation": 850.0, "solar_lux": 90000.0, "uv_index": 7.0},
+            {"humidity": 60.0, "pressure": 30.5},
+        ],
+    )
+    def test_evaluate_matches_separate_calls(self, analyzers, sensor_data):
+        """Test evaluate returns the same condition and visibility as the pair."""
+        core = analyzers["core"]
+        condition, visibility = core.evaluate(sensor_data, 100.0)
+        assert condition == core.determine_condition(sensor_data, 100.0)
+        assert visibility == core.estimate_visibility(condition, sensor_data)
+
+    def test_sensor_readings_from_raw(self):
+        """Test raw readings are normalized with the documented defaults."""
+        readings = SensorReadings.from_raw(
+            {
+                "rain_rate": -0.2,
+                "rain_state": " Raining ",
+                "wind_speed": None,
+                "outdoor_temp": 0,
+                "lightning_count": 2,
+            }
+        )
+        assert readings.rain_rate == 0.0
+        assert readings.rain_state == "wet"
+        assert readings.wind_speed == 0.0
+        assert readings.outdoor_temp == 70.0
+        assert readings.humidity == 50.0
+        assert readings.pressure == 29.92
+        assert readings.lightning_count == 2.0
+        assert readings.lightning_distance is None
+        assert readings.solar_elevation is None
+        assert SensorReadings.from_raw({}) == SensorReadings()
+
+    def test_altitude_corrections_memoized(self, analyzers):
+        """Test pressure corrections are looked up once per station altitude."""
+        core = analyzers["core"]
+        atmospheric = analyzers["atmospheric"]
+        sensor_data = {"pressure": 29.0, "humidity": 50.0}
+        factor = atmospheric.sea_level_pressure_factor(500.0)
+        bands = PressureBands.from_thresholds(
+            atmospheric.get_altitude_adjusted_pressure_thresholds(500.0)
+        )
+
+        with (
+            patch.object(
+                atmospheric,
+                "sea_level_pressure_factor",
+                wraps=atmospheric.sea_level_pressure_factor,
+            ) as mock_factor,
+            patch.object(
+                atmospheric,
+                "get_altitude_adjusted_pressure_thresholds",
+                wraps=atmospheric.get_altitude_adjusted_pressure_thresholds,
+            ) as mock_thresholds,
+        ):
+            for pressure in (29.0, 29.1, 29.2):
+                sensor_data["pressure"] = pressure
+                params = core._calculate_parameters(
+                    core._extract_sensors(sensor_data), 500.0
+                )
+                assert params.adjusted_pressure == pressure * factor
+                assert params.pressure_thresholds == bands
+            assert mock_factor.call_count == 1
+            assert mock_thresholds.call_count == 1
+
+            core._calculate_parameters(core._extract_sensors(sensor_data), 0.0)
+            assert mock_factor.call_count == 2
+
+    @pytest.mark.parametrize(
+        ("condition", "sensor_data", "expected"),
+        [
+            (ATTR_CONDITION_FOG, {"humidity": 95.0, "outdoor_temp": 50.0}, 0.5),
+            (ATTR_CONDITION_FOG, {"humidity": 92.0, "outdoor_temp": 50.0}, 1.0),
+            (ATTR_CONDITION_FOG, {"humidity": 91.9, "outdoor_temp": 50.0}, 2.0),
+            (ATTR_CONDITION_CLEAR_NIGHT, {"humidity": 49.9}, 25.0),
+            (ATTR_CONDITION_CLEAR_NIGHT, {"humidity": 50.0}, 20.0),
+            (ATTR_CONDITION_CLEAR_NIGHT, {"humidity": 70.0}, 15.0),
+            (ATTR_CONDITION_SUNNY, {"solar_radiation": 600.0}, 25.0),
+            (ATTR_CONDITION_SUNNY, {"solar_radiation": 400.0}, 15.0),
+            (ATTR_CONDITION_CLOUDY, {"solar_lux": 5000.0}, 12.0),
+            (ATTR_CONDITION_CLOUDY, {"solar_lux": 20000.0}, 15.0),
+            (ATTR_CONDITION_PARTLYCLOUDY, {"solar_lux": 50001.0}, 25.0),
+            (ATTR_CONDITION_CLOUDY, {"humidity": 75.0}, 15.0),
+            (ATTR_CONDITION_CLOUDY, {"humidity": 85.0}, 12.0),
+            (ATTR_CONDITION_WINDY, {"humidity": 30.0}, 15.0),
+        ],
+    )
+    def test_estimate_visibility_bands(
+        self, analyzers, condition, sensor_data, expected
+    ):
+        """Test visibility band boundaries for each condition."""
+        assert analyzers["core"].estimate_visibility(condition, sensor_data) == expected
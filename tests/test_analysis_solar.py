@@ -2,10 +2,12 @@
 
 from collections import deque
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
 from custom_components.micro_weather.analysis.solar import SolarAnalyzer
+from custom_components.micro_weather.analysis.trends import TrendsAnalyzer
 
 
 class TestSolarAnalyzer:
@@ -159,6 +161,21 @@ class TestSolarAnalyzer:
         assert 0 <= winter_cover <= 100
         assert 0 <= summer_cover <= 100
 
+    def test_analyze_cloud_cover_reads_clock_once(self, analyzer):
+        """Test cloud cover analysis uses a single timestamp throughout."""
+        import datetime
+        from unittest.mock import patch
+
+        frozen = datetime.datetime(2024, 7, 15, 10, 0)
+        with patch(
+            "custom_components.micro_weather.analysis.solar.datetime"
+        ) as mock_datetime:
+            mock_datetime.now.return_value = frozen
+            analyzer.analyze_cloud_cover(300.0, 30000.0, 3.0, 60.0)
+
+        assert mock_datetime.now.call_count == 1
+        assert analyzer._sensor_history["cloud_cover"][-1]["timestamp"] == frozen
+
     def test_analyze_cloud_cover_measurement_weighting(self, analyzer):
         """Test cloud cover analysis measurement weighting logic."""
         # Test primary weighting (solar radiation > 10)
@@ -267,6 +284,124 @@ class TestSolarAnalyzer:
             abs(average - expected_avg) < 5.0
         )  # Should be close to recent data average
 
+    def test_get_solar_radiation_average_chronological_history(self, analyzer):
+        """Test chronological history averages only the recent window."""
+        base_time = datetime.now()
+        history = deque(maxlen=192)
+        for minutes_ago in range(120, -1, -1):
+            history.append(
+                {
+                    "timestamp": base_time - timedelta(minutes=minutes_ago),
+                    "value": 500.0 if minutes_ago >= 15 else 100.0 + minutes_ago,
+                }
+            )
+        analyzer._sensor_history["solar_radiation"] = history
+
+        average = analyzer._get_solar_radiation_average(100.0)
+
+        # Newest readings (lowest values) weigh most
+        assert 100.0 < average < 107.0
+
+    def test_get_solar_radiation_average_unindexed_history(self, analyzer):
+        """Test history not written by the trends analyzer is filtered whole."""
+        now = datetime(2024, 6, 1, 12, 0)
+        analyzer._sensor_history["solar_radiation"] = deque(
+            {"timestamp": now - timedelta(minutes=minutes_ago), "value": value}
+            for minutes_ago, value in (
+                (120, 500.0),
+                (3, 100.0),
+                (90, 500.0),
+                (2, 200.0),
+                (1, 400.0),
+            )
+        )
+
+        average = analyzer._get_solar_radiation_average(400.0, now)
+
+        expected = (0.3 * 100.0 + 0.65 * 200.0 + 1.0 * 400.0) / (0.3 + 0.65 + 1.0)
+        assert average == pytest.approx(expected)
+
+    def test_get_solar_radiation_average_indexed_history(self):
+        """Test history stored by the trends analyzer is bisected to the window."""
+        history = {"solar_radiation": deque(maxlen=192)}
+        trends = TrendsAnalyzer(history)
+        analyzer = SolarAnalyzer(history, trends_analyzer=trends)
+        now = datetime(2024, 6, 1, 12, 0)
+        with patch(
+            "custom_components.micro_weather.analysis.trends.datetime"
+        ) as mock_datetime:
+            mock_datetime.now.side_effect = [
+                now - timedelta(minutes=minutes_ago)
+                for minutes_ago in (60, 30, 3, 2, 1)
+            ]
+            for value in (500.0, 500.0, 100.0, 200.0, 400.0):
+                trends.store_historical_data({"solar_radiation": value})
+
+        cutoff_time = now - timedelta(minutes=15)
+        assert (
+            trends.window_start(
+                "solar_radiation", history["solar_radiation"], cutoff_time
+            )
+            == 2
+        )
+
+        average = analyzer._get_solar_radiation_average(400.0, now)
+
+        expected = (0.3 * 100.0 + 0.65 * 200.0 + 1.0 * 400.0) / (0.3 + 0.65 + 1.0)
+        assert average == pytest.approx(expected)
+
+    def test_get_solar_radiation_average_linear_weights(self, analyzer):
+        """Test weights rise linearly from 0.3 (oldest) to 1.0 (newest)."""
+        base_time = datetime.now()
+        analyzer._sensor_history["solar_radiation"] = [
+            {"timestamp": base_time - timedelta(minutes=3), "value": 100.0},
+            {"timestamp": base_time - timedelta(minutes=2), "value": 200.0},
+            {"timestamp": base_time - timedelta(minutes=1), "value": 400.0},
+        ]
+
+        average = analyzer._get_solar_radiation_average(400.0)
+
+        expected = (0.3 * 100.0 + 0.65 * 200.0 + 1.0 * 400.0) / (0.3 + 0.65 + 1.0)
+        assert average == pytest.approx(expected)
+        assert analyzer._average_weights(3) is analyzer._average_weights(3)
+
+    def test_get_historical_weather_bias_chronological_history(self, analyzer):
+        """Test historical bias counts only conditions inside the window."""
+        now = datetime(2024, 6, 1, 15, 0)
+        history = deque(maxlen=50)
+        for hours_ago in range(10, -1, -1):
+            history.append(
+                {
+                    "timestamp": now - timedelta(hours=hours_ago),
+                    "value": "cloudy" if hours_ago >= 6 else "sunny",
+                }
+            )
+        analyzer._sensor_history["weather_condition"] = history
+
+        bias = analyzer._get_historical_weather_bias(hours=6, now=now)
+
+        assert bias["recent_conditions"] == ["sunny"] * 6
+        assert bias["clear_percentage"] == 100.0
+        assert bias["is_morning"] is False
+
+    def test_get_historical_weather_bias_unindexed_history(self, analyzer):
+        """Test out-of-order history keeps every condition inside the window."""
+        now = datetime(2024, 6, 1, 15, 0)
+        analyzer._sensor_history["weather_condition"] = deque(
+            {"timestamp": now - timedelta(hours=hours_ago), "value": condition}
+            for hours_ago, condition in (
+                (30, "cloudy"),
+                (1, "sunny"),
+                (26, "cloudy"),
+                (2, "rainy"),
+            )
+        )
+
+        bias = analyzer._get_historical_weather_bias(hours=24, now=now)
+
+        assert bias["recent_conditions"] == ["sunny", "rainy"]
+        assert bias["clear_percentage"] == 50.0
+
     def test_calculate_clear_sky_max_radiation(self, analyzer):
         """Test clear-sky maximum radiation calculation."""
         # Test at zenith (90° elevation)
@@ -317,6 +452,29 @@ class TestSolarAnalyzer:
         # Check that the difference is meaningful (should be several W/m²)
         assert rad_perihelion - rad_aphelion > 10
 
+    def test_clear_sky_geometry_memoized(self, analyzer):
+        """Test clear-sky maximum and air mass are reused for the same inputs."""
+        date = datetime(2024, 6, 1)
+        max_rad = analyzer._calculate_clear_sky_max_radiation(40.0, date)
+
+        with patch.object(
+            analyzer, "_calculate_air_mass", wraps=analyzer._calculate_air_mass
+        ) as mock_air_mass:
+            assert analyzer._calculate_clear_sky_max_radiation(40.0, date) == max_rad
+            mock_air_mass.assert_not_called()
+
+            # A new date, elevation or calibration is recalculated
+            analyzer._calculate_clear_sky_max_radiation(40.0, datetime(2024, 12, 1))
+            assert mock_air_mass.call_count == 1
+            analyzer.zenith_max_radiation *= 2
+            assert analyzer._calculate_clear_sky_max_radiation(
+                40.0, date
+            ) == pytest.approx(2 * max_rad)
+
+        air_mass = analyzer._calculate_air_mass(40.0)
+        assert analyzer._calculate_air_mass(40.0) == air_mass
+        assert analyzer._calculate_air_mass(50.0) < air_mass
+
     def test_calculate_clear_sky_max_radiation_bounds(self, analyzer):
         """Test bounds checking in clear-sky radiation calculation."""
         # Test that very high elevations don't exceed maximum
@@ -435,6 +593,22 @@ class TestSolarAnalyzer:
         assert rad_aphelion < rad_spring < rad_perihelion
         assert rad_aphelion < rad_fall < rad_perihelion
 
+    @pytest.mark.parametrize(
+        "cloud_cover,expected",
+        [
+            (0.0, "sunny"),
+            (30.0, "sunny"),
+            (30.5, "partlycloudy"),
+            (60.0, "partlycloudy"),
+            (60.01, "cloudy"),
+            (100.0, "cloudy"),
+            (float("nan"), "cloudy"),
+        ],
+    )
+    def test_map_cloud_cover_to_condition(self, analyzer, cloud_cover, expected):
+        """Test cloud cover thresholds are inclusive upper bounds."""
+        assert analyzer.map_cloud_cover_to_condition(cloud_cover) == expected
+
     def test_apply_condition_hysteresis_no_history(self, analyzer):
         """Test hysteresis with no previous condition history."""
         # First call should always return the proposed condition
@@ -649,3 +823,22 @@ class TestSolarAnalyzer:
             if entry["timestamp"] > base_time - timedelta(hours=24)
         ]
         assert len(recent_entries) > 0
+
+    def test_apply_condition_hysteresis_expires_in_place(self, analyzer):
+        """Test expired entries are dropped from the existing history deque."""
+        history = analyzer._condition_history
+        base_time = datetime.now()
+        for hours_ago in (30, 25, 2):
+            history.append(
+                {
+                    "condition": "sunny",
+                    "cloud_cover": 20.0,
+                    "timestamp": base_time - timedelta(hours=hours_ago),
+                }
+            )
+
+        assert analyzer.apply_condition_hysteresis("sunny", 22.0) == "sunny"
+
+        assert analyzer._condition_history is history
+        assert len(history) == 2
+        assert history[0]["timestamp"] == base_time - timedelta(hours=2)
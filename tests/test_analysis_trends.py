@@ -2,6 +2,7 @@
 
 from collections import deque
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
@@ -94,6 +95,154 @@ class TestTrendsAnalyzer:
         trends_empty = analyzer_empty.get_historical_trends("test_sensor")
         assert trends_empty == {}
 
+    def test_get_historical_trends_statistics(self, analyzer):
+        """Test the summary statistics computed over the history window."""
+        trends = analyzer.get_historical_trends("outdoor_temp", hours=24)
+
+        # Fixture stores 70..79°F, newest first
+        assert trends["current"] == 79.0
+        assert trends["average"] == pytest.approx(74.5)
+        assert trends["min"] == 70.0
+        assert trends["max"] == 79.0
+        assert trends["volatility"] == pytest.approx(3.02765, abs=1e-4)
+        assert trends["sample_count"] == 10
+        # Temperature rises by 1°F for every hour further in the past
+        assert trends["trend"] == pytest.approx(-1.0, abs=1e-6)
+        for key in ("average", "min", "max", "volatility", "trend"):
+            assert type(trends[key]) is float
+
+    def test_batch_reference_time(self, analyzer):
+        """Test that a batch freezes the reference time for history windows."""
+        assert analyzer.current_time() <= datetime.now()
+
+        analyzer.begin_batch()
+        frozen = analyzer.current_time()
+        assert analyzer.current_time() == frozen
+        assert (
+            analyzer.get_historical_trends("outdoor_temp", hours=24)["sample_count"]
+            == 10
+        )
+
+        analyzer.end_batch()
+        assert analyzer._now is None
+        assert analyzer.current_time() >= frozen
+
+    def test_select_recent_entries(self, analyzer):
+        """Test window selection over datetime and numeric timestamps."""
+        now = datetime.now()
+        entries = [
+            {"timestamp": now - timedelta(hours=1), "value": 3.0},
+            {"timestamp": 5, "value": 2.0},
+            {"timestamp": now - timedelta(hours=30), "value": 1.0},
+        ]
+
+        # Datetime entries win and are filtered against the window
+        recent, is_numeric = analyzer.select_recent_entries(entries, 24)
+        assert [entry["value"] for entry in recent] == [3.0]
+        assert is_numeric is False
+
+        # Stale datetime entries still take precedence over numeric ones
+        recent, is_numeric = analyzer.select_recent_entries(entries[1:], 24)
+        assert recent == []
+        assert is_numeric is False
+
+        # Chronological history is cut at the window start
+        chronological = deque(
+            {"timestamp": now - timedelta(hours=hours), "value": float(hours)}
+            for hours in range(48, -1, -1)
+        )
+        recent, is_numeric = analyzer.select_recent_entries(chronological, 24)
+        assert [entry["value"] for entry in recent] == [
+            float(hours) for hours in range(23, -1, -1)
+        ]
+        assert is_numeric is False
+
+        # Numeric-only history is returned unfiltered
+        numeric = [{"timestamp": i, "value": float(i)} for i in range(3)]
+        recent, is_numeric = analyzer.select_recent_entries(numeric, 1)
+        assert recent == numeric
+        assert is_numeric is True
+
+    def test_select_recent_entries_unindexed_history(self, analyzer):
+        """Test histories not written by the analyzer are not assumed sorted."""
+        now = datetime.now()
+        unordered = deque(
+            {"timestamp": now - timedelta(hours=hours), "value": float(hours)}
+            for hours in (30, 1, 26, 2)
+        )
+        recent, is_numeric = analyzer.select_recent_entries(unordered, 24, "pressure")
+        assert [entry["value"] for entry in recent] == [1.0, 2.0]
+        assert is_numeric is False
+
+        # A numeric timestamp between ascending datetimes is skipped
+        mixed = deque(
+            [
+                {"timestamp": now - timedelta(hours=2), "value": 2.0},
+                {"timestamp": 5, "value": 5.0},
+                {"timestamp": now - timedelta(hours=1), "value": 1.0},
+            ]
+        )
+        recent, is_numeric = analyzer.select_recent_entries(mixed, 24, "pressure")
+        assert [entry["value"] for entry in recent] == [2.0, 1.0]
+        assert is_numeric is False
+
+    def test_select_recent_entries_indexed_history(self):
+        """Test stored history is bisected and other writes fall back."""
+        history = {"pressure": deque(maxlen=3)}
+        analyzer = TrendsAnalyzer(history)
+        entries = history["pressure"]
+        now = datetime.now()
+
+        stamps = [now - timedelta(hours=hours) for hours in (40, 30, 2, 1)]
+        with patch(
+            "custom_components.micro_weather.analysis.trends.datetime"
+        ) as mock_datetime:
+            mock_datetime.now.side_effect = stamps
+            for value in range(4):
+                analyzer.store_historical_data({"pressure": float(value)})
+
+        assert analyzer.window_start("pressure", entries, stamps[1]) == 1
+        recent, is_numeric = analyzer.select_recent_entries(entries, 24, "pressure")
+        assert [entry["value"] for entry in recent] == [2.0, 3.0]
+        assert is_numeric is False
+
+        # Entries appended elsewhere are not covered by the index
+        entries.append({"timestamp": now - timedelta(hours=50), "value": 4.0})
+        assert analyzer.window_start("pressure", entries, stamps[1]) is None
+        recent, _ = analyzer.select_recent_entries(entries, 24, "pressure")
+        assert [entry["value"] for entry in recent] == [2.0, 3.0]
+
+        # After a clock step backwards the index only covers the buffer again
+        # once the older entries have rolled out
+        stamps = [now - timedelta(minutes=minutes) for minutes in (20, 40, 10, 5)]
+        with patch(
+            "custom_components.micro_weather.analysis.trends.datetime"
+        ) as mock_datetime:
+            mock_datetime.now.side_effect = stamps
+            for value in range(5, 8):
+                analyzer.store_historical_data({"pressure": float(value)})
+            assert analyzer.window_start("pressure", entries, now) is None
+
+            analyzer.store_historical_data({"pressure": 8.0})
+        cutoff = now - timedelta(minutes=30)
+        assert analyzer.window_start("pressure", entries, cutoff) == 1
+
+    def test_history_arrays(self, analyzer):
+        """Test unpacking entries into hour offsets and values."""
+        start = datetime(2025, 1, 1, 12, 0)
+        entries = [
+            {"timestamp": start + timedelta(minutes=30 * i), "value": float(i)}
+            for i in range(4)
+        ]
+        offsets, values = analyzer.history_arrays(entries, False)
+        assert offsets.tolist() == [0.0, 0.5, 1.0, 1.5]
+        assert values.tolist() == [0.0, 1.0, 2.0, 3.0]
+
+        numeric = [{"timestamp": 10 + i, "value": 5.0 - i} for i in range(3)]
+        offsets, values = analyzer.history_arrays(numeric, True)
+        assert offsets.tolist() == [0.0, 1.0, 2.0]
+        assert values.tolist() == [5.0, 4.0, 3.0]
+
     def test_calculate_trend(self, analyzer):
         """Test trend calculation (linear regression)."""
         # Test with simple data
@@ -134,6 +283,10 @@ class TestTrendsAnalyzer:
         # Should be around north (0°), but could be around 360° which is equivalent
         assert mean_north >= 350 or mean_north <= 20  # Around north
 
+        # Means are exact for symmetric spreads, including across north
+        assert analyzer.calculate_circular_mean([80, 100]) == pytest.approx(90.0)
+        assert analyzer.calculate_circular_mean([300, 320]) == pytest.approx(310.0)
+
         # Test empty list
         mean_empty = analyzer.calculate_circular_mean([])
         assert mean_empty == 0.0
@@ -167,6 +320,62 @@ class TestTrendsAnalyzer:
         trend_constant = analyzer.calculate_trend([1, 2, 3], [5, 5, 5])
         assert trend_constant == 0.0
 
+        # Test with all samples at the same instant (zero time variance)
+        trend_same_time = analyzer.calculate_trend([2.5, 2.5, 2.5], [1, 2, 3])
+        assert trend_same_time == 0.0
+
+    def test_calculate_trend_long_history(self, analyzer):
+        """Test slope recovery over a full 48h history at 5-minute samples."""
+        x_values = [i / 12 for i in range(576)]
+        y_values = [
+            29.92 - 0.015 * x + (0.01 if i % 2 else -0.01)
+            for i, x in enumerate(x_values)
+        ]
+        trend = analyzer.calculate_trend(x_values, y_values)
+        assert trend == pytest.approx(-0.015, abs=1e-4)
+        assert isinstance(trend, float)
+
+    @staticmethod
+    def _calm_history(pressure_step=0.0, rain_rate=0.0, wind_step=0.0):
+        """Build six hours of half-hourly readings for quiescence checks."""
+        history = {
+            "pressure": deque(maxlen=192),
+            "rain_rate": deque(maxlen=192),
+            "wind_speed": deque(maxlen=192),
+        }
+        base_time = datetime.now()
+        for i in range(12):
+            timestamp = base_time - timedelta(minutes=30 * (11 - i))
+            history["pressure"].append(
+                {"timestamp": timestamp, "value": 30.0 + i * pressure_step}
+            )
+            history["rain_rate"].append({"timestamp": timestamp, "value": rain_rate})
+            history["wind_speed"].append(
+                {"timestamp": timestamp, "value": 4.0 + (i % 2) * wind_step}
+            )
+        return history
+
+    def test_is_weather_quiescent(self):
+        """Calm, dry, steady conditions are quiescent."""
+        assert TrendsAnalyzer(self._calm_history()).is_weather_quiescent() is True
+
+    @pytest.mark.parametrize(
+        "history_kwargs",
+        [
+            {"pressure_step": -0.01},  # ~1 hPa/3h fall
+            {"rain_rate": 0.1},
+            {"wind_step": 6.0},  # gusty, variable wind
+        ],
+    )
+    def test_is_weather_quiescent_active(self, history_kwargs):
+        """Pressure change, rain or variable wind are not quiescent."""
+        analyzer = TrendsAnalyzer(self._calm_history(**history_kwargs))
+        assert analyzer.is_weather_quiescent() is False
+
+    def test_is_weather_quiescent_without_history(self):
+        """Missing pressure history keeps the configured refresh rate."""
+        assert TrendsAnalyzer({}).is_weather_quiescent() is False
+
     def test_compute_pressure_acceleration_falling_fast(self):
         """Acceleration is negative when pressure fall speeds up."""
         history = {"pressure": deque(maxlen=192)}
@@ -264,3 +473,33 @@ class TestTrendsAnalyzer:
         result = analyzer.analyze_pressure_trends()
         assert abs(result["current_trend"]) < 0.2
         assert result["storm_probability"] == 0
+
+    def test_analyze_pressure_trends_cached_within_batch(self, analyzer):
+        """Pressure analysis is reused within a batch until pressure is stored."""
+        analyzer.begin_batch()
+        try:
+            with patch.object(
+                analyzer,
+                "_compute_pressure_trends",
+                wraps=analyzer._compute_pressure_trends,
+            ) as compute:
+                first = analyzer.analyze_pressure_trends()
+                first["current_trend"] = None
+                second = analyzer.analyze_pressure_trends()
+                assert compute.call_count == 1
+                assert second["current_trend"] is not None
+
+                analyzer.store_historical_data({"pressure": 29.50})
+                analyzer.analyze_pressure_trends()
+                assert compute.call_count == 2
+        finally:
+            analyzer.end_batch()
+
+        with patch.object(
+            analyzer,
+            "_compute_pressure_trends",
+            wraps=analyzer._compute_pressure_trends,
+        ) as compute:
+            analyzer.analyze_pressure_trends()
+            analyzer.analyze_pressure_trends()
+            assert compute.call_count == 2
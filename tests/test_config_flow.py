@@ -836,6 +836,66 @@ class TestOptionsFlow:
         assert result["data"][CONF_ZENITH_MAX_RADIATION] == 950
         assert result["data"][CONF_SOLAR_LUX_SENSOR] == "sensor.lux"
 
+    @patch("homeassistant.helpers.frame.report_usage")
+    async def test_options_flow_saves_once_on_finish(
+        self, mock_report_usage, hass: HomeAssistant
+    ):
+        """Test menu steps accumulate input and only the final step saves it."""
+        # Create a real config entry
+        config_entry = config_entries.ConfigEntry(
+            entry_id="test_entry",
+            version=1,
+            minor_version=0,
+            domain="micro_weather",
+            title="Test Weather Station",
+            data={},
+            options={
+                CONF_OUTDOOR_TEMP_SENSOR: "sensor.outdoor_temperature",
+                CONF_UPDATE_INTERVAL: 30,
+            },
+            source=config_entries.SOURCE_USER,
+            unique_id="test_unique_id",
+            discovery_keys=set(),
+            subentries_data={},
+        )
+        hass.config_entries._entries[config_entry.entry_id] = config_entry
+
+        flow = OptionsFlowHandler()
+        flow._config_entry = config_entry
+        flow.hass = hass
+
+        with patch.object(
+            hass.config_entries, "async_update_entry"
+        ) as mock_update_entry:
+            await flow.async_step_init()
+            result = await flow.async_step_solar(
+                {CONF_SOLAR_RADIATION_SENSOR: "sensor.solar_radiation"}
+            )
+            assert result["type"] == "menu"
+
+            # The pending sensor already unlocks Zenith Max Radiation
+            result = await flow.async_step_init({"next_step_id": "solar"})
+            assert CONF_ZENITH_MAX_RADIATION in result["data_schema"].schema
+
+            result = await flow.async_step_solar(
+                {
+                    CONF_SOLAR_RADIATION_SENSOR: "sensor.solar_radiation",
+                    CONF_ZENITH_MAX_RADIATION: 1100,
+                }
+            )
+            result = await flow.async_step_wind(
+                {CONF_WIND_SPEED_SENSOR: "sensor.wind_speed"}
+            )
+            assert result["type"] == "menu"
+            mock_update_entry.assert_not_called()
+
+        result = await flow.async_step_device_config({})
+
+        assert result["type"] == "create_entry"
+        assert result["data"][CONF_SOLAR_RADIATION_SENSOR] == "sensor.solar_radiation"
+        assert result["data"][CONF_ZENITH_MAX_RADIATION] == 1100
+        assert result["data"][CONF_WIND_SPEED_SENSOR] == "sensor.wind_speed"
+
     async def test_options_get_altitude_unit_metric(self, hass: HomeAssistant):
         """Test OptionsFlowHandler _get_altitude_unit returns 'm' for metric system."""
         # Set metric system
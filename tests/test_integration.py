@@ -1,5 +1,6 @@
 """Integration tests for Micro Weather Station setup and unload flows."""
 
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.components.weather import (
@@ -20,6 +21,7 @@ from custom_components.micro_weather import (
     async_update_options,
 )
 from custom_components.micro_weather.const import (
+    CONF_REFRESH_ON_STARTUP,
     CONF_UPDATE_INTERVAL,
     DOMAIN,
     KEY_CONDITION,
@@ -88,6 +90,43 @@ class TestIntegrationSetup:
             with pytest.raises(ConfigEntryNotReady):
                 await async_setup_entry(hass, mock_config_entry)
 
+    async def test_async_setup_entry_skips_startup_refresh(self, hass: HomeAssistant):
+        """Test setup defers the first analysis when startup refresh is off."""
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={"outdoor_temp_sensor": "sensor.outdoor_temperature"},
+            options={
+                "outdoor_temp_sensor": "sensor.outdoor_temperature",
+                CONF_REFRESH_ON_STARTUP: False,
+            },
+            entry_id="test_entry_id",
+        )
+
+        with (
+            patch(
+                "custom_components.micro_weather.weather_detector.WeatherDetector"
+            ) as mock_detector_class,
+            patch(
+                "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups"
+            ) as mock_forward,
+        ):
+            mock_detector = MagicMock()
+            mock_detector_class.return_value = mock_detector
+
+            result = await async_setup_entry(hass, config_entry)
+
+            assert result is True
+            coordinator = hass.data[DOMAIN][config_entry.entry_id]
+            assert coordinator.refresh_on_startup is False
+            assert coordinator.data is None
+            # The detector is built so the entity can share its analyzers
+            mock_detector_class.assert_called_once()
+            assert (
+                coordinator.atmospheric_analyzer is mock_detector.atmospheric_analyzer
+            )
+            mock_detector.get_weather_data.assert_not_called()
+            mock_forward.assert_called_once_with(config_entry, ["weather"])
+
     async def test_async_unload_entry_success(
         self, hass: HomeAssistant, mock_config_entry: MockConfigEntry
     ):
@@ -235,6 +274,29 @@ class TestCoordinatorIntegration:
             assert result == mock_weather_data
             mock_detector_class.assert_called_once_with(hass, mock_config_entry.options)
 
+    async def test_coordinator_update_holds_analysis_lock(
+        self, hass: HomeAssistant, mock_config_entry: MockConfigEntry
+    ):
+        """The executor analysis must run under the coordinator's analysis lock."""
+        coordinator = MicroWeatherCoordinator(hass, mock_config_entry)
+        lock_states = []
+
+        def get_weather_data(sensor_data):
+            lock_states.append(coordinator.analysis_lock.locked())
+            return {"condition": ATTR_CONDITION_PARTLYCLOUDY, "forecast": []}
+
+        with patch(
+            "custom_components.micro_weather.weather_detector.WeatherDetector"
+        ) as mock_detector_class:
+            mock_detector = MagicMock()
+            mock_detector.get_weather_data.side_effect = get_weather_data
+            mock_detector_class.return_value = mock_detector
+
+            await coordinator._async_update_data()
+
+        assert lock_states == [True]
+        assert not coordinator.analysis_lock.locked()
+
     async def test_coordinator_reuses_detector_between_updates(
         self, hass: HomeAssistant, mock_config_entry: MockConfigEntry
     ):
@@ -295,6 +357,58 @@ class TestCoordinatorIntegration:
             assert first_detector.get_weather_data.call_count == 1
             assert second_detector.get_weather_data.call_count == 1
 
+    async def test_coordinator_keeps_detector_when_options_unchanged(
+        self, hass: HomeAssistant, mock_config_entry: MockConfigEntry
+    ):
+        """Re-saving identical options must not discard accumulated history."""
+        with patch(
+            "custom_components.micro_weather.weather_detector.WeatherDetector"
+        ) as mock_detector_class:
+            mock_detector_class.return_value.get_weather_data.return_value = {
+                "condition": "cloudy"
+            }
+
+            coordinator = MicroWeatherCoordinator(hass, mock_config_entry)
+            await coordinator._async_update_data()
+            await coordinator._async_update_data()
+
+            # An equal but distinct options mapping keeps the same detector
+            coordinator._detector_options = dict(mock_config_entry.options)
+            await coordinator._async_update_data()
+
+            mock_detector_class.assert_called_once_with(hass, mock_config_entry.options)
+            assert coordinator._detector_options is mock_config_entry.options
+
+    @pytest.mark.parametrize(
+        ("configured", "quiescent", "expected"),
+        [
+            (5, True, 15),
+            (5, False, 5),
+            (1, True, 3),
+            (30, True, 30),
+        ],
+    )
+    async def test_coordinator_adapts_update_interval(
+        self, hass: HomeAssistant, configured, quiescent, expected
+    ):
+        """Quiescent weather backs off polling without exceeding the ceiling."""
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={},
+            options={CONF_UPDATE_INTERVAL: configured},
+        )
+        with patch(
+            "custom_components.micro_weather.weather_detector.WeatherDetector"
+        ) as mock_detector_class:
+            mock_detector = mock_detector_class.return_value
+            mock_detector.get_weather_data.return_value = {"condition": "sunny"}
+            mock_detector.trends_analyzer.is_weather_quiescent.return_value = quiescent
+
+            coordinator = MicroWeatherCoordinator(hass, entry)
+            await coordinator._async_update_data()
+
+            assert coordinator.update_interval == timedelta(minutes=expected)
+
     async def test_coordinator_update_failure(
         self, hass: HomeAssistant, mock_config_entry: MockConfigEntry
     ):
@@ -1,5 +1,6 @@
 """Tests for the Micro Weather Station weather entity."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.components.weather import (
@@ -453,6 +454,24 @@ class TestMicroWeatherEntity:
             assert isinstance(forecast["native_wind_speed"], float)
             assert isinstance(forecast["humidity"], (int, float))
 
+    async def test_async_forecast_hourly_waits_for_analysis_lock(
+        self, weather_entity, coordinator
+    ):
+        """Test forecasts leave the analyzers alone while an update runs."""
+        coordinator.data = {KEY_TEMPERATURE: 20.0}
+        coordinator.analysis_lock = asyncio.Lock()
+        weather_entity._hourly_generator = MagicMock()
+        weather_entity._hourly_generator.generate_forecast.return_value = []
+
+        async with coordinator.analysis_lock:
+            task = asyncio.create_task(weather_entity.async_forecast_hourly())
+            await asyncio.sleep(0)
+            assert not task.done()
+            weather_entity._hourly_generator.generate_forecast.assert_not_called()
+
+        assert await task == []
+        weather_entity._hourly_generator.generate_forecast.assert_called_once()
+
     async def test_async_forecast_hourly_with_rain(self, weather_entity, coordinator):
         """Test hourly forecast with rain condition."""
         coordinator.data = {
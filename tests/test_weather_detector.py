@@ -80,6 +80,30 @@ class TestWeatherDetector:
         for history in detector.trends_analyzer._sensor_history.values():
             assert history.maxlen >= 48 * 60
 
+    def test_get_weather_data_from_sensor_snapshot(self, mock_hass, mock_options):
+        """Analysis of a sensor snapshot must not touch the state machine."""
+        states = {
+            "sensor.outdoor_temperature": Mock(
+                state="70.0", attributes={"unit_of_measurement": "°F"}
+            ),
+            "sensor.humidity": Mock(state="50.0", attributes={}),
+            "sensor.pressure": Mock(
+                state="29.92", attributes={"unit_of_measurement": "inHg"}
+            ),
+        }
+        mock_hass.states.get = Mock(side_effect=states.get)
+
+        detector = WeatherDetector(mock_hass, mock_options)
+        snapshot = detector.read_sensor_values()
+        assert snapshot["outdoor_temp"] == 70.0
+        mock_hass.states.get.reset_mock()
+
+        result = detector.get_weather_data(snapshot)
+
+        mock_hass.states.get.assert_not_called()
+        assert result["humidity"] == 50.0
+        assert detector.trends_analyzer._now is None
+
     def test_detect_weather_with_psi_pressure(
         self, mock_hass, mock_options, mock_sensor_data
     ):